@@ -0,0 +1,56 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Micro-benchmark of openvino.helpers.pack_data/unpack_data for all supported low precision types.
+
+Usage: python benchmark_packing.py [--size NUM_VALUES] [--repeat N] [--chunk-size NUM_VALUES]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from openvino import Type
+from openvino.helpers import pack_data, unpack_data
+from openvino.helpers.packing import DEFAULT_CHUNK_SIZE
+
+TYPES = [
+    (Type.u1, 0, 2, np.uint8),
+    (Type.u2, 0, 4, np.uint8),
+    (Type.u3, 0, 8, np.uint8),
+    (Type.u4, 0, 16, np.uint8),
+    (Type.u6, 0, 64, np.uint8),
+    (Type.i4, -8, 8, np.int8),
+    (Type.nf4, 0, 16, np.uint8),
+    (Type.f4e2m1, 0, 16, np.uint8),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1 << 24, help="Number of values to pack.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements, the best one is reported.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Number of values processed at once.")
+    args = parser.parse_args()
+
+    print(f"{'type':<8}{'pack, ms':>12}{'unpack, ms':>12}{'pack, GB/s':>12}{'unpack, GB/s':>14}")
+    for ov_type, low, high, dtype in TYPES:
+        data = np.random.randint(low, high, args.size).astype(dtype)
+        packed = pack_data(data, ov_type, chunk_size=args.chunk_size)
+        unpacked = np.empty_like(data)
+
+        pack_time = min(timeit.repeat(lambda: pack_data(data, ov_type, out=packed, chunk_size=args.chunk_size),
+                                      number=1, repeat=args.repeat))
+        unpack_time = min(timeit.repeat(lambda: unpack_data(packed, ov_type, data.shape, out=unpacked,
+                                                            chunk_size=args.chunk_size),
+                                        number=1, repeat=args.repeat))
+        assert np.array_equal(unpacked, data), f"Packing round trip failed for {ov_type}"
+
+        print(f"{ov_type.get_type_name():<8}{pack_time * 1e3:>12.2f}{unpack_time * 1e3:>12.2f}"
+              f"{data.nbytes / pack_time / 1e9:>12.2f}{data.nbytes / unpack_time / 1e9:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import io
+from time import perf_counter
 from types import TracebackType
 from typing import Any, Union, Optional
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 import traceback  # noqa: F811
 
@@ -17,8 +18,10 @@ from openvino._pyopenvino import AsyncInferQueue as AsyncInferQueueBase
 from openvino._pyopenvino import Node, Tensor, Type, RTMap, TensorVector
 
 from openvino.utils.data_helpers import (
+    InputBindingPlan,
     OVDict,
     _InferRequestWrapper,
+    _OutputIndex,
     _data_dispatch,
     tensor_from_file,
 )
@@ -199,11 +202,25 @@ class InferRequest(_InferRequestWrapper):
         :return: Dictionary of results from output tensors with port/int/str keys.
         :rtype: OVDict
         """
-        return OVDict(super().infer(_data_dispatch(
-            self,
-            inputs,
-            is_shared=share_inputs,
-        ), share_outputs=share_outputs, decode_strings=decode_strings))
+        hook = self._stage_hook
+        if hook is None:
+            return self._infer_lazy(_data_dispatch(
+                self,
+                inputs,
+                is_shared=share_inputs,
+            ), share_outputs=share_outputs, decode_strings=decode_strings)
+        stages: dict = {}
+        start = perf_counter()
+        dispatched = _data_dispatch(self, inputs, is_shared=share_inputs)
+        stages["input dispatch"] = (start, perf_counter())
+        results = self._infer_lazy(
+            dispatched,
+            share_outputs=share_outputs,
+            decode_strings=decode_strings,
+            stages=stages,
+        )
+        hook(stages)
+        return results
 
     def start_async(
         self,
@@ -265,7 +282,7 @@ class InferRequest(_InferRequestWrapper):
                               Default value: False
         :type share_inputs: bool, optional
         """
-        super().start_async(
+        self._start_async(
             _data_dispatch(
                 self,
                 inputs,
@@ -274,6 +291,24 @@ class InferRequest(_InferRequestWrapper):
             userdata,
         )
 
+    def create_binding_plan(self, inputs: Any, share_inputs: bool = False) -> InputBindingPlan:
+        """Creates a reusable plan of binding inputs of the same structure as `inputs`.
+
+        Keys, data types and memory layout of `inputs` are resolved once, following calls
+        of `InputBindingPlan.infer` and `InputBindingPlan.start_async` bind numpy arrays
+        matching the plan directly, which reduces Python overhead of repeated inference calls
+        with inputs of the same structure. Inputs not matching the plan are still accepted
+        and dispatched the same way as in `InferRequest.infer`.
+
+        :param inputs: Example of data to be set on input tensors.
+        :type inputs: Any
+        :param share_inputs: Enables `share_inputs` mode, see `InferRequest.infer`.
+        :type share_inputs: bool, optional
+        :return: Binding plan of this InferRequest.
+        :rtype: openvino.utils.data_helpers.InputBindingPlan
+        """
+        return InputBindingPlan(self, inputs, is_shared=share_inputs)
+
     def get_compiled_model(self) -> "CompiledModel":
         """Gets the compiled model this InferRequest is using.
 
@@ -302,6 +337,8 @@ class CompiledModel(CompiledModelBase):
     def __init__(self, other: CompiledModelBase, weights: Optional[bytes] = None) -> None:
         # Private memeber to store already created InferRequest
         self._infer_request: Optional[InferRequest] = None
+        # Private member to store index of outputs shared by all created InferRequests
+        self._output_index: Optional[_OutputIndex] = None
         self._weights = weights
         super().__init__(other)
 
@@ -316,7 +353,9 @@ class CompiledModel(CompiledModelBase):
         :return: New InferRequest object.
         :rtype: openvino.InferRequest
         """
-        return InferRequest(super().create_infer_request())
+        if self._output_index is None:
+            self._output_index = _OutputIndex(self.outputs)
+        return InferRequest(super().create_infer_request(), self._output_index)
 
     def query_state(self) -> None:
         """Gets state control interface for the underlaying infer request.
@@ -483,6 +522,34 @@ class AsyncInferQueue(AsyncInferQueueBase):
     a simple pipeline.
     """
 
+    def __init__(self, model: CompiledModel, jobs: int = 0) -> None:
+        # Private member to store InferRequest wrappers reused between calls
+        self._requests: list[InferRequest] = []
+        # Private member to store a callback receiving `perf_counter` timestamps of stages of
+        # every `start_async` call as a dict of stage name to (start, end), used to profile Python overhead
+        self._stage_hook: Optional[Callable[[dict], None]] = None
+        super().__init__(model, jobs)
+
+    def _get_request(self, i: int) -> InferRequest:
+        if not self._requests:
+            requests = [InferRequest(x) for x in super().__iter__()]
+            if requests:
+                # All requests share the same outputs
+                output_index = requests[0]._get_output_index()
+                for request in requests:
+                    request._output_index = output_index
+            self._requests = requests
+        return self._requests[i]
+
+    def _submit(self, handle: int, inputs: Any, userdata: Any, share_inputs: bool, plans: dict) -> None:
+        """Start inference on the idle request `handle`, reusing its binding plan."""
+        request = self._get_request(handle)
+        request._detach_results()
+        plan = plans.get(handle)
+        if plan is None:
+            plan = plans[handle] = request.create_binding_plan(inputs, share_inputs=share_inputs)
+        super().start_async(plan.dispatch(inputs), userdata)
+
     def __iter__(self) -> Iterator[InferRequest]:
         """Allows to iterate over AsyncInferQueue.
 
@@ -493,7 +560,7 @@ class AsyncInferQueue(AsyncInferQueueBase):
         :return: a generator that yields InferRequests.
         :rtype: collections.abc.Iterable[openvino.InferRequest]
         """
-        return (InferRequest(x) for x in super().__iter__())
+        return (self._get_request(i) for i in range(len(self)))
 
     def __getitem__(self, i: int) -> InferRequest:
         """Gets InferRequest from the pool with given i id.
@@ -507,7 +574,7 @@ class AsyncInferQueue(AsyncInferQueueBase):
         :return: InferRequests from the pool with given id.
         :rtype: openvino.InferRequest
         """
-        return InferRequest(super().__getitem__(i))
+        return self._get_request(i)
 
     def start_async(
         self,
@@ -565,14 +632,158 @@ class AsyncInferQueue(AsyncInferQueueBase):
                               Default value: False
         :type share_inputs: bool, optional
         """
-        super().start_async(
-            _data_dispatch(
-                self[self.get_idle_request_id()],
-                inputs,
-                is_shared=share_inputs,
-            ),
-            userdata,
-        )
+        hook = self._stage_hook
+        if hook is None:
+            request = self._get_request(self.get_idle_request_id())
+            request._detach_results()
+            super().start_async(
+                _data_dispatch(
+                    request,
+                    inputs,
+                    is_shared=share_inputs,
+                ),
+                userdata,
+            )
+            return
+        # Hook is called after the native call, the callback of the job may be already called by then
+        start = perf_counter()
+        handle = self.get_idle_request_id()
+        idle_end = perf_counter()
+        request = self._get_request(handle)
+        request._detach_results()
+        lookup_end = perf_counter()
+        dispatched = _data_dispatch(request, inputs, is_shared=share_inputs)
+        dispatch_end = perf_counter()
+        super().start_async(dispatched, userdata)
+        hook({
+            "idle request wait": (start, idle_end),
+            "request wrapper lookup": (idle_end, lookup_end),
+            "input dispatch": (lookup_end, dispatch_end),
+            "native start_async call": (dispatch_end, perf_counter()),
+        })
+
+    def submit_many(
+        self,
+        inputs: Iterable,
+        userdata: Optional[Iterable] = None,
+        share_inputs: bool = False,
+    ) -> int:
+        """Run asynchronous inference of every item of `inputs` using the pool.
+
+        Items are taken from `inputs` only when there is an idle InferRequest, so
+        generators are streamed into the pool without being read ahead. Every
+        InferRequest binds its inputs with a plan created from the first item it
+        receives, see `InferRequest.create_binding_plan`. Results are passed to
+        the callback set with `set_callback`, call `wait_all` to wait for them.
+
+        :param inputs: Iterable of data to be set on input tensors, every item is
+                       of the same form as `inputs` of `start_async`.
+        :type inputs: collections.abc.Iterable
+        :param userdata: Iterable of data passed to the callback, one item per input.
+        :type userdata: collections.abc.Iterable, optional
+        :param share_inputs: Enables `share_inputs` mode, see `start_async`.
+        :type share_inputs: bool, optional
+        :return: Number of submitted inputs.
+        :rtype: int
+        """
+        plans: dict = {}
+        count = 0
+        userdata_iter = iter(userdata) if userdata is not None else None
+        for item in inputs:
+            self._submit(
+                self.get_idle_request_id(),
+                item,
+                next(userdata_iter) if userdata_iter is not None else None,
+                share_inputs,
+                plans,
+            )
+            count += 1
+        return count
+
+    def map(
+        self,
+        inputs: Iterable,
+        share_inputs: bool = False,
+        share_outputs: bool = False,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        *,
+        decode_strings: bool = True,
+    ) -> Iterator:
+        """Infer every item of `inputs` using the pool and yield the results.
+
+        Items are taken from `inputs` only when there is an idle InferRequest.
+        Results are produced without a callback, so the callback set with
+        `set_callback` is still called for every item. Outputs are converted
+        to numpy arrays only when accessed, see `OVDict`.
+
+        :param inputs: Iterable of data to be set on input tensors, every item is
+                       of the same form as `inputs` of `start_async`.
+        :type inputs: collections.abc.Iterable
+        :param share_inputs: Enables `share_inputs` mode, see `start_async`.
+        :type share_inputs: bool, optional
+        :param share_outputs: Enables `share_outputs` mode, see `InferRequest.infer`.
+                              Shared results are valid only until the next result is requested.
+        :type share_outputs: bool, optional
+        :param ordered: If set to `True` results are yielded in the order of `inputs`.
+                        If set to `False` pairs of the input index and results are yielded
+                        as soon as inference of the input is finished.
+        :type ordered: bool, optional
+        :param max_pending: Maximum number of inputs being inferred or waiting to be yielded
+                            in order. Default is twice the number of InferRequests in the pool.
+        :type max_pending: int, optional
+        :param decode_strings: Controls decoding outputs of textual based data, see `InferRequest.infer`.
+        :type decode_strings: bool, optional, keyword-only
+        :return: Generator of results or of pairs of the input index and results.
+        :rtype: collections.abc.Iterator[Union[OVDict, tuple[int, OVDict]]]
+        """
+        if max_pending is None:
+            max_pending = 2 * len(self)
+        max_pending = max(max_pending, len(self))
+        plans: dict = {}
+        # Index of the input being inferred by every busy request
+        running: dict[int, int] = {}
+        # Finished results waiting to be yielded in order
+        finished: dict[int, OVDict] = {}
+        next_index = 0
+
+        def collect(handle: int) -> tuple[int, OVDict]:
+            request = self._get_request(handle)
+            return running.pop(handle), request._wrap_results(request.output_tensors, share_outputs, decode_strings)
+
+        for index, item in enumerate(inputs):
+            handle = self.get_idle_request_id()
+            if handle in running:
+                result = collect(handle)
+                if not ordered:
+                    yield result
+                else:
+                    finished[result[0]] = result[1]
+            while ordered:
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+                if len(running) + len(finished) < max_pending:
+                    break
+                # Too many pending results, wait for the oldest input to bound the memory usage
+                oldest = next(h for h, i in running.items() if i == next_index)
+                self._get_request(oldest).wait()
+                finished[next_index] = collect(oldest)[1]
+            self._submit(handle, item, None, share_inputs, plans)
+            running[handle] = index
+
+        for handle in sorted(running, key=running.__getitem__):
+            self._get_request(handle).wait()
+            result = collect(handle)
+            if not ordered:
+                yield result
+            else:
+                finished[result[0]] = result[1]
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        # Propagate errors raised by the callback
+        self.wait_all()
 
 
 class Core(CoreBase):
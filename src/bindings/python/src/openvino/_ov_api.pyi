@@ -1,6 +1,7 @@
 # type: ignore
 from __future__ import annotations
 from builtins import traceback as TracebackType
+from collections.abc import Iterable
 from collections.abc import Iterator
 from openvino._pyopenvino import AsyncInferQueue as AsyncInferQueueBase
 from openvino._pyopenvino import CompiledModel as CompiledModelBase
@@ -11,9 +12,11 @@ from openvino._pyopenvino import RTMap
 from openvino._pyopenvino import Tensor
 from openvino._pyopenvino import TensorVector
 from openvino._pyopenvino import Type
+from openvino.utils.data_helpers.data_dispatcher import InputBindingPlan
 from openvino.utils.data_helpers.data_dispatcher import _data_dispatch
 from openvino.utils.data_helpers.wrappers import OVDict
 from openvino.utils.data_helpers.wrappers import _InferRequestWrapper
+from openvino.utils.data_helpers.wrappers import _OutputIndex
 from openvino.utils.data_helpers.wrappers import tensor_from_file
 from pathlib import Path
 import collections.abc
@@ -21,11 +24,12 @@ import io as io
 import openvino._pyopenvino
 import openvino._pyopenvino.op
 import openvino._pyopenvino.op.util
+import openvino.utils.data_helpers.data_dispatcher
 import openvino.utils.data_helpers.wrappers
 import pathlib
 import traceback as traceback
 import typing
-__all__: list[str] = ['AsyncInferQueue', 'AsyncInferQueueBase', 'CompiledModel', 'CompiledModelBase', 'Core', 'CoreBase', 'InferRequest', 'Iterator', 'Model', 'ModelBase', 'ModelMeta', 'Node', 'OVDict', 'Path', 'RTMap', 'Tensor', 'TensorVector', 'TracebackType', 'Type', 'compile_model', 'io', 'tensor_from_file', 'traceback']
+__all__: list[str] = ['AsyncInferQueue', 'AsyncInferQueueBase', 'CompiledModel', 'CompiledModelBase', 'Core', 'CoreBase', 'InferRequest', 'InputBindingPlan', 'Iterable', 'Iterator', 'Model', 'ModelBase', 'ModelMeta', 'Node', 'OVDict', 'Path', 'RTMap', 'Tensor', 'TensorVector', 'TracebackType', 'Type', 'compile_model', 'io', 'tensor_from_file', 'traceback']
 class AsyncInferQueue(openvino._pyopenvino.AsyncInferQueue):
     """
     AsyncInferQueue with a pool of asynchronous requests.
@@ -60,6 +64,44 @@ class AsyncInferQueue(openvino._pyopenvino.AsyncInferQueue):
                 :return: a generator that yields InferRequests.
                 :rtype: collections.abc.Iterable[openvino.InferRequest]
                 
+        """
+    def __init__(self, model: CompiledModel, jobs: int = 0) -> None:
+        ...
+    def _get_request(self, i: int) -> InferRequest:
+        ...
+    def _submit(self, handle: int, inputs: typing.Any, userdata: typing.Any, share_inputs: bool, plans: dict) -> None:
+        """
+        Start inference on the idle request `handle`, reusing its binding plan.
+        """
+    def map(self, inputs: collections.abc.Iterable, share_inputs: bool = False, share_outputs: bool = False, ordered: bool = True, max_pending: typing.Optional[int] = None, *, decode_strings: bool = True) -> collections.abc.Iterator:
+        """
+        Infer every item of `inputs` using the pool and yield the results.
+        
+                Items are taken from `inputs` only when there is an idle InferRequest.
+                Results are produced without a callback, so the callback set with
+                `set_callback` is still called for every item. Outputs are converted
+                to numpy arrays only when accessed, see `OVDict`.
+        
+                :param inputs: collections.abc.Iterable of data to be set on input tensors, every item is
+                               of the same form as `inputs` of `start_async`.
+                :type inputs: collections.abc.Iterable
+                :param share_inputs: Enables `share_inputs` mode, see `start_async`.
+                :type share_inputs: bool, optional
+                :param share_outputs: Enables `share_outputs` mode, see `InferRequest.infer`.
+                                      Shared results are valid only until the next result is requested.
+                :type share_outputs: bool, optional
+                :param ordered: If set to `True` results are yielded in the order of `inputs`.
+                                If set to `False` pairs of the input index and results are yielded
+                                as soon as inference of the input is finished.
+                :type ordered: bool, optional
+                :param max_pending: Maximum number of inputs being inferred or waiting to be yielded
+                                    in order. Default is twice the number of InferRequests in the pool.
+                :type max_pending: int, optional
+                :param decode_strings: Controls decoding outputs of textual based data, see `InferRequest.infer`.
+                :type decode_strings: bool, optional, keyword-only
+                :return: Generator of results or of pairs of the input index and results.
+                :rtype: collections.abc.Iterator[Union[OVDict, tuple[int, OVDict]]]
+                
         """
     def start_async(self, inputs: typing.Any = None, userdata: typing.Any = None, share_inputs: bool = False) -> None:
         """
@@ -113,6 +155,27 @@ class AsyncInferQueue(openvino._pyopenvino.AsyncInferQueue):
                                       Default value: False
                 :type share_inputs: bool, optional
                 
+        """
+    def submit_many(self, inputs: collections.abc.Iterable, userdata: typing.Optional[collections.abc.Iterable] = None, share_inputs: bool = False) -> int:
+        """
+        Run asynchronous inference of every item of `inputs` using the pool.
+        
+                Items are taken from `inputs` only when there is an idle InferRequest, so
+                generators are streamed into the pool without being read ahead. Every
+                InferRequest binds its inputs with a plan created from the first item it
+                receives, see `InferRequest.create_binding_plan`. Results are passed to
+                the callback set with `set_callback`, call `wait_all` to wait for them.
+        
+                :param inputs: collections.abc.Iterable of data to be set on input tensors, every item is
+                               of the same form as `inputs` of `start_async`.
+                :type inputs: collections.abc.Iterable
+                :param userdata: collections.abc.Iterable of data passed to the callback, one item per input.
+                :type userdata: collections.abc.Iterable, optional
+                :param share_inputs: Enables `share_inputs` mode, see `start_async`.
+                :type share_inputs: bool, optional
+                :return: Number of submitted inputs.
+                :rtype: int
+                
         """
 class CompiledModel(openvino._pyopenvino.CompiledModel):
     """
@@ -357,6 +420,24 @@ class InferRequest(openvino.utils.data_helpers.wrappers._InferRequestWrapper):
     """
     InferRequest class represents infer request which can be run in asynchronous or synchronous manners.
     """
+    def create_binding_plan(self, inputs: typing.Any, share_inputs: bool = False) -> openvino.utils.data_helpers.data_dispatcher.InputBindingPlan:
+        """
+        Creates a reusable plan of binding inputs of the same structure as `inputs`.
+        
+                Keys, data types and memory layout of `inputs` are resolved once, following calls
+                of `InputBindingPlan.infer` and `InputBindingPlan.start_async` bind numpy arrays
+                matching the plan directly, which reduces Python overhead of repeated inference calls
+                with inputs of the same structure. Inputs not matching the plan are still accepted
+                and dispatched the same way as in `InferRequest.infer`.
+        
+                :param inputs: Example of data to be set on input tensors.
+                :type inputs: Any
+                :param share_inputs: Enables `share_inputs` mode, see `InferRequest.infer`.
+                :type share_inputs: bool, optional
+                :return: Binding plan of this InferRequest.
+                :rtype: openvino.utils.data_helpers.InputBindingPlan
+                
+        """
     def get_compiled_model(self) -> CompiledModel:
         """
         Gets the compiled model this InferRequest is using.
@@ -1503,6 +1503,30 @@ class InferRequest:
         ...
     def __repr__(self) -> str:
         ...
+    @typing.overload
+    def _infer(self, inputs: Tensor) -> list:
+        """
+                    Infers specified input(s) in synchronous mode.
+        
+                    GIL is released while running the inference.
+        
+                    :param inputs: Data to set on single input tensor.
+                    :type inputs: openvino.Tensor
+                    :return: Output tensors in order of the model outputs.
+                    :rtype: list[openvino.Tensor]
+        """
+    @typing.overload
+    def _infer(self, inputs: dict) -> list:
+        """
+                    Infers specified input(s) in synchronous mode.
+        
+                    GIL is released while running the inference.
+        
+                    :param inputs: Data to set on input tensors.
+                    :type inputs: dict[Union[int, str, openvino.ConstOutput], openvino.Tensor]
+                    :return: Output tensors in order of the model outputs.
+                    :rtype: list[openvino.Tensor]
+        """
     def cancel(self) -> None:
         """
                     Cancels inference request.
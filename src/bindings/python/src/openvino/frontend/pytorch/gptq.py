@@ -6,10 +6,41 @@
 
 from functools import partial
 import logging
+import sys
 import torch
 
 log = logging.getLogger(__name__)
 
+# Added to zero points to move zp+1 step from after unpacking to before
+# to have correct decompression pattern. uint8 arithmetic wraps around.
+QZEROS_SHIFT = 17
+
+
+def get_peak_rss():
+    """Returns peak resident set size of the current process in bytes or None if it is unknown."""
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def to_float_inplace(module):
+    """Converts floating point parameters and buffers owned directly by the module to fp32.
+
+    Unlike module.float() it does not recurse into submodules, so applied to modules one by one
+    the model is converted layer by layer and original half precision tensors are released as it goes.
+    """
+    for param in module.parameters(recurse=False):
+        if param.is_floating_point() and param.dtype != torch.float32:
+            param.data = param.data.float()
+    for name, buffer in module.named_buffers(recurse=False):
+        if buffer is not None and buffer.is_floating_point() and buffer.dtype != torch.float32:
+            module._buffers[name] = buffer.float()
+
 
 # Wraps a single tensor to a module to prevent it from jit.freezing
 # It depends on a tensor dtype whether it will be preserved from freezing.
@@ -107,6 +138,7 @@ def patch_model(model):
         config = model.model.config
     if config is not None and hasattr(config, "quantization_config") and hasattr(config.quantization_config, "sym"):
         is_symmetrical = config.quantization_config.sym
+    num_patched = 0
     for name, module in model.named_modules():
         if hasattr(module, "_openvino_patch_orig_forward"):
             # already patched, skipping
@@ -115,7 +147,7 @@ def patch_model(model):
         is_quantized = getattr(module, "is_quantized", None)
         if is_quantized is not None:
             module.is_quantized = False
-        module.float()  # enables tracing on CPU, applied for all modules
+        to_float_inplace(module)  # enables tracing on CPU, applied for all modules
         if hasattr(module, "QUANT_TYPE"):
             if module.QUANT_TYPE not in supported_quant_types:
                 raise ValueError(f"Unsupported QUANT_TYPE == {module.QUANT_TYPE} is discovered for "
@@ -144,19 +176,22 @@ def patch_model(model):
             module.qweight = module.qweight.view(dtype=torch.uint8)
             module.qzeros = module.qzeros.view(dtype=torch.uint8)
 
-            # TODO: Redundant tensor copy? Try to remove module.qweight and module.qzeros
-            # after keeping modified values as submodules
+            # Submodule shares memory with module.qweight, so no copy of the quantized weights is made.
             module.add_module(
                 "_openvino_u4_compression_submodule_qweights", KeepWeight(module.qweight)
             )
-            # Adding 17 to move zp+1 step from after unpacking to before
-            # to have correct decompression pattern. Can it overflow?
+            # Shifted zero points are kept in a separate small tensor: traced model shares
+            # memory with the original tensors and is converted after the model is unpatched.
             module.add_module(
                 "_openvino_u4_compression_submodule_qzeros",
-                KeepWeight(module.qzeros + torch.tensor(17, dtype=torch.uint8)),
+                KeepWeight(module.qzeros + torch.tensor(QZEROS_SHIFT, dtype=torch.uint8)),
             )
 
             module.scales = module.scales.view(-1, 1, module.width)
+            num_patched += 1
+            log.debug("Repacked GPTQ module %s, peak RSS: %s bytes", name, get_peak_rss())
+
+    log.debug("Repacked %d GPTQ modules, peak RSS: %s bytes", num_patched, get_peak_rss())
 
 
 def unpatch_model(model):
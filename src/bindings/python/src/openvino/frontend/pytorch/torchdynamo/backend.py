@@ -23,7 +23,7 @@ from openvino.frontend.pytorch.ts_decoder import TorchScriptPythonDecoder
 from openvino.frontend.pytorch.torchdynamo import decompositions
 from openvino.frontend.pytorch.torchdynamo.decompositions import get_aot_decomposition_list, get_inf_decomposition_list
 from openvino.frontend.pytorch.torchdynamo.partition import Partitioner
-from openvino.frontend.pytorch.torchdynamo.execute import execute, execute_cached
+from openvino.frontend.pytorch.torchdynamo.execute import execute, execute_cached, clear_caches
 from openvino.frontend.pytorch.torchdynamo.compile import cached_model_name, openvino_compile_cached_model
 from openvino.frontend.pytorch.torchdynamo.backend_utils import _get_cache_dir, _get_device, _get_model_caching, _get_decompositions, _get_aot_autograd
 
@@ -49,6 +49,16 @@ logger.setLevel(logging.WARNING)
 
 openvino_options = {}
 
+try:
+    from openvino.tools.ovc import telemetry_utils
+
+    # The backend marks torch.compile as the caller, so ovc doesn't search for it in the call stack
+    if "torch.compile" not in telemetry_utils.callers:
+        telemetry_utils.set_caller("torch.compile")
+        telemetry_utils.send_torch_compile_import()
+except ImportError:
+    pass
+
 # Disable regional compilation which was enabled by default from Torch 2.5.0
 if hasattr(torch._dynamo.config, "inline_inbuilt_nn_modules"):
     torch._dynamo.config.inline_inbuilt_nn_modules=False
@@ -4,12 +4,20 @@
 
 # mypy: ignore-errors
 
+import os
+from functools import lru_cache
 from typing import Optional, Any
 from openvino import Core
 
 
+@lru_cache(maxsize=None)
+def _get_core() -> Core:
+    # A single Core is shared by all compilations, creating it loads plugins and takes noticeable time
+    return Core()
+
+
 def _get_device(options) -> Optional[Any]:
-    core = Core()
+    core = _get_core()
     device = "CPU"
 
     if options is not None and "device" in options:
@@ -60,6 +68,21 @@ def _get_model_caching(options) -> Optional[Any]:
     return False
 
 
+def _get_async_compile(options) -> Optional[Any]:
+    if options is not None and "async_compile" in options:
+        async_compile = options["async_compile"]
+        if bool(async_compile) and str(async_compile).lower() not in ["false", "0"]:
+            return True
+    return False
+
+
+def _get_compile_threads(options) -> Optional[Any]:
+    compile_threads = min(4, os.cpu_count() or 1)
+    if options is not None and "compile_threads" in options:
+        compile_threads = int(options["compile_threads"])
+    return compile_threads
+
+
 def _get_config(options) -> Optional[Any]:
     if options is not None and "config" in options:
         return options["config"]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+# mypy: ignore-errors
+
+import logging
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("OPENVINO_TORCH_MODEL_CACHE_SIZE", 64))
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "bytes", "max_entries", "max_bytes"])
+
+
+class CompiledModelCache:
+    """LRU cache of compiled OpenVINO partitions.
+
+    Entries are evicted in least-recently-used order once either the number of entries
+    exceeds `max_entries` or the accumulated size of the entries exceeds `max_bytes`.
+    A limit set to None disables the corresponding bound.
+    """
+
+    def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = None):
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the entry without updating its recency and the hit statistics."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int = 0) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def resize(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries),
+                             self._bytes, self._max_entries, self._max_bytes)
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def values(self) -> list:
+        with self._lock:
+            return [value for value, _ in self._entries.values()]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _over_limit(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        if self._max_bytes is not None and self._bytes > self._max_bytes:
+            return True
+        return False
+
+    def _evict(self) -> None:
+        # The most recently inserted entry is kept even if it alone exceeds max_bytes,
+        # otherwise the partition would be recompiled on every call.
+        while len(self._entries) > 1 and self._over_limit():
+            key, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self._evictions += 1
+            logger.debug(f"Evicted compiled OpenVINO partition {key} from the cache")
+        if self._max_entries is not None and self._max_entries <= 0:
+            self._evictions += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
@@ -16,6 +16,7 @@ from openvino.frontend import FrontEndManager
 from openvino.frontend.pytorch.fx_decoder import TorchFXPythonDecoder
 from openvino import Core, Type, PartialShape, serialize
 from openvino.frontend.pytorch.torchdynamo.backend_utils import (
+    _get_core,
     _get_cache_dir,
     _get_device,
     _get_config,
@@ -25,6 +26,50 @@ from openvino.frontend.pytorch.torchdynamo.backend_utils import (
 logger = logging.getLogger(__name__)
 
 
+def graph_constants(gm: GraphModule) -> dict:
+    """Collect parameters, buffers and constants referenced by get_attr nodes of an FX graph."""
+    constants = dict(gm.named_parameters())
+    constants.update(gm.named_buffers())
+    for node in gm.graph.nodes:
+        if node.op == "get_attr":
+            attr = gm
+            for atom in str(node.target).split("."):
+                attr = getattr(attr, atom, None)
+            if isinstance(attr, torch.Tensor):
+                constants[str(node.target)] = attr
+    return constants
+
+
+def graph_hash(gm: GraphModule) -> str:
+    """Content hash of an FX graph: its generated code and the values of all captured constants.
+
+    Graphs with the same hash convert to the same OpenVINO model, so it is used as a key of the
+    partitions store on disk regardless of the order partitions were created in.
+    """
+    hasher = sha256(gm.code.encode("utf-8"))
+    for name, tensor in sorted(graph_constants(gm).items()):
+        tensor = tensor.detach().cpu().contiguous()
+        hasher.update(f"{name}:{tensor.dtype}:{list(tensor.shape)}".encode("utf-8"))
+        hasher.update(tensor.reshape(-1).view(torch.uint8).numpy())
+    return hasher.hexdigest()
+
+
+def graph_input_shapes(gm: GraphModule) -> list:
+    """Shapes of placeholders of an FX graph the partition is compiled for.
+
+    Symbolic dimensions are -1, inputs without shape information (like scalars) are None.
+    """
+    shapes = []
+    for node in gm.graph.nodes:
+        if node.op != "placeholder":
+            continue
+        shape = TorchFXPythonDecoder.get_found_shape(node)
+        if shape is not None:
+            shape = torch.Size([-1 if type(dim).__name__ == "SymInt" else dim for dim in shape])
+        shapes.append(shape)
+    return shapes
+
+
 def cached_model_name(model_hash_str, device, args, cache_root, reversed=False):  # noqa: VNE003
     if model_hash_str is None:
         return None
@@ -52,7 +97,7 @@ def cached_model_name(model_hash_str, device, args, cache_root, reversed=False):
 
 
 def openvino_compile_cached_model(cached_model_path, options, *example_inputs):
-    core = Core()
+    core = _get_core()
     om = core.read_model(cached_model_path + ".xml")
 
     dtype_mapping = {
@@ -84,7 +129,7 @@ def openvino_compile_cached_model(cached_model_path, options, *example_inputs):
 
 
 def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None, options=None):
-    core = Core()
+    core = _get_core()
 
     device = _get_device(options)
     cache_root = _get_cache_dir(options)
@@ -96,16 +141,6 @@ def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None, options
         fe_manager = FrontEndManager()
         fe = fe_manager.load_by_framework("pytorch")
 
-        input_shapes = []
-        input_types = []
-        for input_data in args:
-            if isinstance(input_data, int):
-                input_types.append(torch.int64)
-                input_shapes.append(torch.Size([1]))
-            else:
-                input_types.append(input_data.type())
-                input_shapes.append(input_data.size())
-
         decoder = TorchFXPythonDecoder(gm)
 
         im = fe.load(decoder)
@@ -126,13 +161,15 @@ def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None, options
         torch.bool: Type.boolean
     }
 
+    # Shapes are taken from the graph, so they are known when the model is read from the store
+    input_shapes = graph_input_shapes(gm)
     for idx, input_data in enumerate(args):
         if isinstance(input_data, int):
             om.inputs[idx].get_node().set_element_type(dtype_mapping[torch.int64])
             om.inputs[idx].get_node().set_partial_shape(PartialShape(list(torch.Size([1]))))
         else:
             om.inputs[idx].get_node().set_element_type(dtype_mapping[input_data.dtype])
-            om.inputs[idx].get_node().set_partial_shape(PartialShape(list(decoder.input_shapes[idx])))
+            om.inputs[idx].get_node().set_partial_shape(PartialShape(list(input_shapes[idx])))
 
     om.validate_nodes_and_infer_types()
 
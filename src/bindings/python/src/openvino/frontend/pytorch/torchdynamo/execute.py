@@ -8,26 +8,41 @@ from copy import deepcopy
 from dataclasses import dataclass
 from functools import lru_cache
 from types import MappingProxyType
+from weakref import WeakKeyDictionary, WeakSet
 from warnings import warn
 
 import torch
 import torch.overrides
 
 from torch.fx import GraphModule
-from torch.utils._pytree import tree_flatten, tree_map, tree_unflatten
+from torch.utils._pytree import tree_flatten
 
 from openvino.frontend import FrontEndManager
 from openvino.frontend.pytorch.fx_decoder import TorchFXPythonDecoder
 from openvino.frontend.pytorch.torchdynamo.partition import Partitioner
-from openvino.frontend.pytorch.torchdynamo.compile import openvino_compile
-from openvino import Core, Type, PartialShape
-from openvino.frontend.pytorch.torchdynamo.backend_utils import _get_cache_dir, _get_device, _get_aot_autograd
+from openvino.frontend.pytorch.torchdynamo.compile import (
+    graph_constants,
+    graph_hash,
+    graph_input_shapes,
+    openvino_compile,
+)
+from openvino.frontend.pytorch.torchdynamo.cache import CacheInfo, CompiledModelCache
+from openvino.frontend.pytorch.torchdynamo.request_pool import InferRequestPool
+from openvino import Core, Type, PartialShape, Tensor
+from openvino.frontend.pytorch.torchdynamo.backend_utils import (
+    _get_cache_dir,
+    _get_device,
+    _get_async_compile,
+    _get_compile_threads,
+)
 
 from typing import Optional, Any
 
 from torch.fx.experimental.proxy_tensor import make_fx, wrapper_and_args_for_make_fx
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 logger = logging.getLogger(__name__)
 
 
@@ -38,10 +53,13 @@ DEFAULT_OPENVINO_PYTHON_CONFIG = MappingProxyType(
     },
 )
 
-compiled_cache = {}
-req_cache = {}
+compiled_cache = CompiledModelCache()
+compile_lock = threading.RLock()
+compile_executor = None
+pending_compiles = {}
 max_openvino_partitions = 0
-partitioned_modules = {}
+partitioned_modules = WeakSet()
+graph_input_shapes_cache = WeakKeyDictionary()
 
 
 def execute(
@@ -68,8 +86,228 @@ def execute(
 import numpy as np
 
 
+def _inputs_signature(flat_args, input_shapes=None) -> tuple:
+    signature = []
+    for idx, arg in enumerate(flat_args):
+        if isinstance(arg, torch.Tensor):
+            shape = tuple(arg.shape)
+            graph_shape = input_shapes[idx] if input_shapes is not None and idx < len(input_shapes) else None
+            if graph_shape is not None and len(graph_shape) == len(shape):
+                # Dynamic dimensions are compiled as such, so any size of them reuses the same partition
+                shape = tuple(-1 if graph_dim == -1 else dim for graph_dim, dim in zip(graph_shape, shape))
+            signature.append((arg.dtype, shape, arg.device.type))
+        else:
+            # Scalars are passed to OpenVINO as i64 tensors of shape [1], the value does not affect compilation
+            signature.append((type(arg).__name__,))
+    return tuple(signature)
+
+
+def _graph_input_shapes(gm: GraphModule) -> list:
+    input_shapes = graph_input_shapes_cache.get(gm)
+    if input_shapes is None:
+        input_shapes = graph_input_shapes(gm)
+        graph_input_shapes_cache[gm] = input_shapes
+    return input_shapes
+
+
+def _options_signature(options) -> tuple:
+    if options is None:
+        return ()
+    device = options.get("device", "CPU")
+    config = options.get("config", None) or {}
+    return (device, tuple(sorted((str(k), str(v)) for k, v in config.items())))
+
+
+def _graph_weights_size(gm: GraphModule) -> int:
+    # Parameters, buffers and constants captured by the graph end up as OpenVINO constants,
+    # so their size is a good estimate of the memory held by the compiled partition.
+    tensors = {id(tensor): tensor for tensor in graph_constants(gm).values()}
+    return sum(t.numel() * t.element_size() for t in tensors.values())
+
+
+def compiled_cache_info() -> CacheInfo:
+    """Return statistics of the compiled partitions cache.
+
+    :return: Named tuple with hits, misses, evictions, current number of entries and their
+             estimated size in bytes, and the configured limits.
+    """
+    return compiled_cache.info()
+
+
+def set_compiled_cache_limits(max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+    """Set limits of the compiled partitions cache and evict entries exceeding them.
+
+    :param max_entries: Maximum number of compiled partitions kept in the cache, None for no limit.
+    :param max_bytes: Maximum estimated size of weights held by the cached partitions, None for no limit.
+    """
+    compiled_cache.resize(max_entries=max_entries, max_bytes=max_bytes)
+
+
+ov_to_torch_dtype = {
+    Type.f32: torch.float32,
+    Type.f64: torch.float64,
+    Type.f16: torch.float16,
+    Type.bf16: torch.bfloat16,
+    Type.i64: torch.int64,
+    Type.i32: torch.int32,
+    Type.i16: torch.int16,
+    Type.i8: torch.int8,
+    Type.u8: torch.uint8,
+    Type.boolean: torch.bool,
+}
+
+
+def _int_to_ov_tensor(arg) -> Tensor:
+    return Tensor(np.array([arg], dtype=np.int64))
+
+
+def _bf16_to_ov_tensor(arg) -> Tensor:
+    arg = arg.detach()
+    if arg.device.type != "cpu" or not arg.is_contiguous():
+        arg = arg.cpu().contiguous()
+    return Tensor(arg.view(torch.int16).numpy(), list(arg.shape), Type.bf16)
+
+
+def _shared_ov_tensor(arg) -> Tensor:
+    arg = arg.detach()
+    if arg.device.type != "cpu" or not arg.is_contiguous():
+        arg = arg.cpu().contiguous()
+    return Tensor(arg.numpy(), shared_memory=True)
+
+
+def _ov_tensor_converter(dtype):
+    if dtype == torch.bfloat16:
+        return _bf16_to_ov_tensor
+    return _shared_ov_tensor
+
+
+def _input_converter(spec: tuple):
+    # spec is an entry of the inputs signature, non-tensor inputs only have their type name
+    if len(spec) > 1:
+        return _ov_tensor_converter(spec[0])
+    if spec[0] == "int":
+        return _int_to_ov_tensor
+    return torch_to_ov_tensor
+
+
+def torch_to_ov_tensor(arg) -> Tensor:
+    """Wrap a torch tensor into openvino.Tensor sharing its memory.
+
+    Only CPU contiguous tensors are shared, other tensors are copied to a contiguous CPU tensor first.
+    Python integers are converted to i64 tensors of shape [1].
+    """
+    if isinstance(arg, int):
+        return _int_to_ov_tensor(arg)
+    return _ov_tensor_converter(arg.dtype)(arg)
+
+
+def _flatten_inputs(args):
+    # Partitions are called with the flat placeholders of an FX graph,
+    # so the inputs only need to be flattened for nested arguments.
+    for arg in args:
+        if isinstance(arg, (list, tuple, dict)):
+            return tree_flatten(args)[0]
+    return args
+
+
+@dataclass
+class CompiledPartition:
+    requests: InferRequestPool
+    # Converters of the flat inputs into openvino.Tensor, chosen once for the inputs signature
+    input_converters: tuple
+    # (index, dtype, shape, converter) of outputs which are preallocated by torch
+    static_outputs: tuple
+    # Indices of outputs with dynamic shape or type unknown to torch, their data is copied
+    dynamic_outputs: tuple
+    num_outputs: int
+
+    @classmethod
+    def create(cls, compiled_model, signature: tuple):
+        input_converters = tuple(_input_converter(spec) for spec in signature)
+        static_outputs = []
+        dynamic_outputs = []
+        for idx, output in enumerate(compiled_model.outputs):
+            partial_shape = output.get_partial_shape()
+            dtype = ov_to_torch_dtype.get(output.get_element_type())
+            if dtype is None or not partial_shape.is_static:
+                dynamic_outputs.append(idx)
+            else:
+                static_outputs.append((idx, dtype, tuple(partial_shape.to_shape()), _ov_tensor_converter(dtype)))
+        return cls(InferRequestPool(compiled_model), input_converters, tuple(static_outputs),
+                   tuple(dynamic_outputs), len(compiled_model.outputs))
+
+
+def _compile_partition(cache_key, gm: GraphModule, args, model_hash_str, options) -> CompiledPartition:
+    if model_hash_str is not None:
+        fully_supported = len(model_hash_str) > 3 and model_hash_str[-3:] == "_fs"
+        if not fully_supported:
+            # Partitions are stored on disk by content, so the same graph is found
+            # regardless of the model it comes from and the order it was partitioned in.
+            model_hash_str = graph_hash(gm)
+    compiled = openvino_compile(gm, *args, model_hash_str=model_hash_str, options=options)
+    partition = CompiledPartition.create(compiled, cache_key[1])
+    compiled_cache.put(cache_key, partition, _graph_weights_size(gm))
+    return partition
+
+
+def _compile_partition_sync(cache_key, gm: GraphModule, args, model_hash_str, options) -> CompiledPartition:
+    # compile_lock only guards lookups, so different partitions are compiled concurrently
+    # and callers of a partition being compiled wait for that compilation.
+    with compile_lock:
+        partition = compiled_cache.peek(cache_key)
+        if partition is not None:
+            return partition
+        future = pending_compiles.get(cache_key)
+        owner = future is None
+        if owner:
+            future = Future()
+            pending_compiles[cache_key] = future
+    if not owner:
+        return future.result()
+
+    try:
+        partition = _compile_partition(cache_key, gm, args, model_hash_str, options)
+    except Exception as error:
+        with compile_lock:
+            pending_compiles.pop(cache_key, None)
+        future.set_exception(error)
+        raise
+    with compile_lock:
+        pending_compiles.pop(cache_key, None)
+    future.set_result(partition)
+    return partition
+
+
+def _compile_partition_async(cache_key, gm: GraphModule, args, model_hash_str, options) -> None:
+    global compile_executor
+    with compile_lock:
+        if cache_key in compiled_cache:
+            return
+        future = pending_compiles.get(cache_key)
+        if future is None:
+            if compile_executor is None:
+                compile_executor = ThreadPoolExecutor(max_workers=_get_compile_threads(options),
+                                                      thread_name_prefix="openvino_compile")
+            future = compile_executor.submit(_compile_partition, cache_key, gm, args, model_hash_str, options)
+            pending_compiles[cache_key] = future
+            future.add_done_callback(lambda f: _on_compile_done(cache_key, f))
+            logger.debug(f"Scheduled background compilation of OpenVINO partition {cache_key[0]}")
+    if future.done() and future.exception() is not None:
+        with compile_lock:
+            pending_compiles.pop(cache_key, None)
+        # Propagate compilation errors so the caller permanently falls back to PyTorch
+        future.result()
+
+
+def _on_compile_done(cache_key, future) -> None:
+    # Failed compilations are kept to be reported by the next call of the partition
+    if future.exception() is None:
+        with compile_lock:
+            pending_compiles.pop(cache_key, None)
+
+
 def execute_cached(compiled_model, *args):
-    ov_inputs = [a.detach().cpu().numpy() for a in args]
+    ov_inputs = [torch_to_ov_tensor(a) for a in args]
     ov_inputs.reverse()
     res = compiled_model(ov_inputs)
     result = [torch.from_numpy(res[out]) for out in compiled_model.outputs]
@@ -92,31 +330,36 @@ def openvino_execute(
     )
     global compiled_cache  # noqa: F824
 
-    model_hash_str = executor_parameters.get("model_hash_str", None)
-    if model_hash_str is not None:
-        fully_supported = False
-        if len(model_hash_str) > 3 and model_hash_str[-3:] == "_fs":
-            fully_supported = True
-        if not fully_supported:
-            model_hash_str = model_hash_str + "_p" + str(partition_id)
-
-    if use_cache and (partition_id in compiled_cache):
-        compiled = compiled_cache[partition_id]
-        req = req_cache[partition_id]
-    else:
-        compiled = openvino_compile(gm, *args, model_hash_str=model_hash_str, options=options)
-        compiled_cache[partition_id] = compiled
-        req = compiled.create_infer_request()
-        req_cache[partition_id] = req
+    flat_args = _flatten_inputs(args)
+    cache_key = (partition_id, _inputs_signature(flat_args, _graph_input_shapes(gm)), _options_signature(options))
+
+    partition = compiled_cache.get(cache_key) if use_cache else None
+    if partition is None:
+        model_hash_str = executor_parameters.get("model_hash_str", None)
+        if use_cache and _get_async_compile(options):
+            # Run eagerly until the partition compiled in background is ready
+            _compile_partition_async(cache_key, gm, args, model_hash_str, options)
+            return gm(*args)
+        if use_cache:
+            partition = _compile_partition_sync(cache_key, gm, args, model_hash_str, options)
+        else:
+            partition = _compile_partition(cache_key, gm, args, model_hash_str, options)
+
+    # Static outputs are written by OpenVINO directly into memory owned by torch,
+    # dynamic outputs are copied since the request is handed over to another caller once released.
+    # Output tensors are returned to the caller, so they and their wrappers are created on every call.
+    results1 = [None] * partition.num_outputs
+    with partition.requests.request() as req:
+        for idx, (arg, convert) in enumerate(zip(flat_args, partition.input_converters)):
+            req.set_input_tensor(idx, convert(arg))
+        for idx, dtype, shape, convert in partition.static_outputs:
+            result = torch.empty(shape, dtype=dtype)
+            req.set_output_tensor(idx, convert(result))
+            results1[idx] = result
+        req.infer(share_outputs=True)
+        for idx in partition.dynamic_outputs:
+            results1[idx] = torch.from_numpy(np.copy(req.get_output_tensor(idx).data))
 
-    flat_args, _ = tree_flatten(args)
-    ov_inputs = []
-    for arg in flat_args:
-        ov_inputs.append((arg if isinstance(arg, int) else arg.detach().cpu().numpy()))
-
-    res = req.infer(ov_inputs, share_inputs=True, share_outputs=True)
-
-    results1 = [torch.from_numpy(res[out]) for out in compiled.outputs]
     if len(results1) == 1:
         return results1[0]
     return results1
@@ -162,6 +405,8 @@ def partition_graph(gm: GraphModule, use_python_fusion_cache: bool, model_hash_s
         # TODO: use a better way to identify fused submodule
         if node.op == "call_module" and "fused_" in node.name:
             openvino_submodule = getattr(gm, node.name)
+            if isinstance(openvino_submodule, OpenVINOGraphModule):
+                continue
             gm.delete_submodule(node.target)
             gm.add_submodule(
                 node.target,
@@ -186,36 +431,15 @@ def openvino_execute_partitioned(gm: GraphModule, *args, executor_parameters=Non
     )
     model_hash_str = executor_parameters.get("model_hash_str", None)
 
-    signature = str(id(gm))
-    if (not _get_aot_autograd(options)):
-        for idx, input_data in enumerate(args):
-            if isinstance(input_data, torch.Tensor):
-                signature = (
-                    signature
-                    + "_"
-                    + str(idx)
-                    + ":"
-                    + str(input_data.type())[6:]
-                    + ":"
-                    + str(input_data.size())[11:-1].replace(" ", "")
-                )
-            else:
-                signature = (
-                    signature
-                    + "_"
-                    + str(idx)
-                    + ":"
-                    + type(input_data).__name__
-                    + ":val("
-                    + str(input_data)
-                    + ")"
+    # Partitions of a graph module handle any inputs, their compiled models are cached by input signature
+    if gm not in partitioned_modules:
+        with compile_lock:
+            if gm not in partitioned_modules:
+                partition_graph(
+                    gm, use_python_fusion_cache=use_python_fusion_cache, model_hash_str=model_hash_str, options=options
                 )
-
-    if signature not in partitioned_modules:
-        partitioned_modules[signature] = partition_graph(
-            gm, use_python_fusion_cache=use_python_fusion_cache, model_hash_str=model_hash_str, options=options
-        )
-    return partitioned_modules[signature](*args)
+                partitioned_modules.add(gm)
+    return gm(*args)
 
 
 def clear_caches():
@@ -224,3 +448,5 @@ def clear_caches():
 
     compiled_cache.clear()
     partitioned_modules.clear()
+    graph_input_shapes_cache.clear()
+    pending_compiles.clear()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+# mypy: ignore-errors
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from openvino import properties
+
+logger = logging.getLogger(__name__)
+
+
+def _optimal_number_of_requests(compiled_model) -> int:
+    try:
+        return max(1, int(compiled_model.get_property(properties.optimal_number_of_infer_requests())))
+    except Exception as e:
+        logger.debug(f"Failed to query optimal number of infer requests: {e}. Using a single request.")
+        return 1
+
+
+class InferRequestPool:
+    """Pool of infer requests created for a single compiled partition.
+
+    Requests are created lazily up to `size`, which defaults to the OPTIMAL_NUMBER_OF_INFER_REQUESTS
+    reported by the compiled model. A request is owned by exactly one caller between `checkout`
+    and `release`, callers block when all requests are in use.
+    """
+
+    def __init__(self, compiled_model, size: int = None):
+        self.compiled_model = compiled_model
+        self.size = size if size is not None else _optimal_number_of_requests(compiled_model)
+        self._idle = []
+        self._created = 0
+        self._cond = threading.Condition()
+
+    def checkout(self):
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self.compiled_model.create_infer_request()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, request) -> None:
+        with self._cond:
+            self._idle.append(request)
+            self._cond.notify()
+
+    @contextmanager
+    def request(self):
+        req = self.checkout()
+        try:
+            yield req
+        finally:
+            self.release(req)
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._created
@@ -4,11 +4,19 @@
 # flake8: noqa
 
 import numpy as np
-from typing import Union
+from typing import Callable, Optional, Union
 from openvino import Type, Shape
 
+# Number of values processed at once, bounds the size of temporary arrays
+DEFAULT_CHUNK_SIZE = 1 << 22
 
-def pack_data(array: np.ndarray, type: Type) -> np.ndarray:
+
+def pack_data(
+    array: np.ndarray,
+    type: Type,
+    out: Optional[np.ndarray] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
     """Represent array values as u1, u2, u3, u4, u6 or i4 openvino element type and pack them into uint8 numpy array.
 
     For u1, u4, i4: Standard bit packing where 8 % bitwidth == 0
@@ -22,43 +30,51 @@ def pack_data(array: np.ndarray, type: Type) -> np.ndarray:
              value - [120], because [7, 8] bit representation is [0111, 1000] will be viewed
              as [01111000], which is bit representation of [120].
 
+    The array is processed in chunks of `chunk_size` values, so together with `out` pointing to
+    preallocated or memory-mapped storage the packing of large weights needs only a bounded
+    amount of temporary memory.
+
     :param array: numpy array with values to pack.
     :type array: numpy array
     :param type: Type to interpret the array values. Type must be u1, u2, u3, u4, u6, i4, nf4 or f4e2m1.
     :type type: openvino.Type
+    :param out: C-contiguous uint8 array to store the packed data into. It is allocated if not provided.
+    :type out: numpy array, optional
+    :param chunk_size: Number of values packed at once.
+    :type chunk_size: int, optional
     """
-    # Handle u3 and u6 with special transposed packing
-    if type == Type.u3:
-        return _pack_u3(array)
-    elif type == Type.u6:
-        return _pack_u6(array)
-    
-    assert type in [Type.u1, Type.u2, Type.u4, Type.i4, Type.nf4, Type.f4e2m1], "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
-
-    minimum_regular_dtype = np.int8 if type == Type.i4 else np.uint8
-    casted_to_regular_type = array.astype(dtype=minimum_regular_dtype, casting="unsafe")
-    if not np.array_equal(casted_to_regular_type, array):
-        raise RuntimeError(f'The conversion of array "{array}" to dtype' f' "{casted_to_regular_type}" results in rounding')
-
-    data_size = casted_to_regular_type.size
-    num_bits = type.bitwidth
-
-    assert num_bits < 8 and 8 % num_bits == 0, "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
-    num_values_fitting_into_uint8 = 8 // num_bits
-    pad = (-data_size) % num_values_fitting_into_uint8
-
-    flattened = casted_to_regular_type.flatten()
-    padded = np.concatenate((flattened, np.zeros([pad], dtype=minimum_regular_dtype)))  # type: ignore
-    assert padded.size % num_values_fitting_into_uint8 == 0
-
-    bit_order_little = (padded[:, None] & (1 << np.arange(num_bits)) > 0).astype(minimum_regular_dtype)
-    bit_order_big = np.flip(bit_order_little, axis=1)  # type: ignore
-    bit_order_big_flattened = bit_order_big.flatten()
-
-    return np.packbits(bit_order_big_flattened)
-
-
-def unpack_data(array: np.ndarray, type: Type, shape: Union[list, Shape]) -> np.ndarray:
+    values_per_group, bytes_per_group, pack_group, _ = _get_packing_scheme(type)
+
+    check_rounding = type not in [Type.u3, Type.u6]
+    regular_dtype = np.int8 if type == Type.i4 else np.uint8
+    flattened = np.ravel(array)
+    num_groups = -(-flattened.size // values_per_group)
+    out = _check_output(out, [num_groups * bytes_per_group], np.uint8)
+    packed = out.reshape(num_groups, bytes_per_group)
+
+    groups_per_chunk = max(1, chunk_size // values_per_group)
+    for begin in range(0, num_groups, groups_per_chunk):
+        end = min(begin + groups_per_chunk, num_groups)
+        chunk = flattened[begin * values_per_group:end * values_per_group]
+        casted = chunk.astype(dtype=regular_dtype, casting="unsafe")
+        if check_rounding and not np.array_equal(casted, chunk):
+            raise RuntimeError(f'The conversion of array "{array}" to dtype' f' "{casted}" results in rounding')
+        casted = casted.view(np.uint8)
+        pad = (end - begin) * values_per_group - casted.size
+        if pad:
+            casted = np.concatenate((casted, np.zeros([pad], dtype=np.uint8)))
+        pack_group(casted.reshape(-1, values_per_group), packed[begin:end])
+
+    return out
+
+
+def unpack_data(
+    array: np.ndarray,
+    type: Type,
+    shape: Union[list, Shape],
+    out: Optional[np.ndarray] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
     """Extract openvino element type values from array into new uint8/int8 array given shape.
 
     For u1, u4, i4: Standard bit unpacking where 8 % bitwidth == 0
@@ -69,123 +85,142 @@ def unpack_data(array: np.ndarray, type: Type, shape: Union[list, Shape]) -> np.
              because [120] bit representation is [01111000] will be viewed as [0111, 1000],
              which is bit representation of [7, 8].
 
+    The array is processed in chunks of `chunk_size` values written directly into `out`.
+
     :param array: numpy array to unpack.
     :type array: numpy array
     :param type: Type to extract from array values. Type must be u1, u2, u3, u4, u6, i4, nf4 or f4e2m1.
     :type type: openvino.Type
     :param shape: the new shape for the unpacked array.
     :type shape: Union[list, openvino.Shape]
+    :param out: C-contiguous array of the given shape to store the unpacked values into.
+                Its dtype must be int8 for i4 and uint8 for other types. It is allocated if not provided.
+    :type out: numpy array, optional
+    :param chunk_size: Number of values unpacked at once.
+    :type chunk_size: int, optional
     """
-    # Handle u3 and u6 with special transposed unpacking
-    if type == Type.u3:
-        return _unpack_u3(array, shape)
-    elif type == Type.u6:
-        return _unpack_u6(array, shape)
-    
-    assert type in [Type.u1, Type.u2, Type.u4, Type.i4, Type.nf4, Type.f4e2m1], "Unpacking algorithm for the" "data types stored in 1, 2 or 4 bits"
-    unpacked = np.unpackbits(array.view(np.uint8))
+    values_per_group, bytes_per_group, _, unpack_group = _get_packing_scheme(type)
+
     shape = list(shape)
-    if type.bitwidth == 1:
-        return np.resize(unpacked, shape)
-    else:
-        unpacked = unpacked.reshape(-1, type.bitwidth)
-        padding_shape = (unpacked.shape[0], 8 - type.bitwidth)
-        padding = np.ndarray(padding_shape, np.uint8)  # type: np.ndarray
-        if type == Type.i4:
-            for axis, bits in enumerate(unpacked):
-                if bits[0] == 1:
-                    padding[axis] = np.ones((padding_shape[1],), np.uint8)
-                else:
-                    padding[axis] = np.zeros((padding_shape[1],), np.uint8)
-        else:
-            padding = np.zeros(padding_shape, np.uint8)
-        padded = np.concatenate((padding, unpacked), 1)  # type: ignore
-        packed = np.packbits(padded, 1)
-        if type == Type.i4:
-            return np.resize(packed, shape).astype(dtype=np.int8)
+    dtype = np.int8 if type == Type.i4 else np.uint8
+    packed = np.ravel(array).view(np.uint8)
+    available_groups = packed.size // bytes_per_group
+    num_values = int(np.prod(shape))
+
+    if num_values > available_groups * values_per_group:
+        # Not enough packed data, values are repeated the same way np.resize does it
+        unpacked = unpack_data(array, type, [available_groups * values_per_group], chunk_size=chunk_size)
+        out = _check_output(out, shape, dtype)
+        out[...] = np.resize(unpacked, shape)
+        return out
+
+    out = _check_output(out, shape, dtype)
+    unpacked = out.reshape(-1).view(np.uint8)
+    num_groups = -(-num_values // values_per_group)
+
+    groups_per_chunk = max(1, chunk_size // values_per_group)
+    for begin in range(0, num_groups, groups_per_chunk):
+        end = min(begin + groups_per_chunk, num_groups)
+        chunk = packed[begin * bytes_per_group:end * bytes_per_group].reshape(-1, bytes_per_group)
+        first, last = begin * values_per_group, min(end * values_per_group, num_values)
+        if last - first == (end - begin) * values_per_group:
+            unpack_group(chunk, unpacked[first:last].reshape(-1, values_per_group))
         else:
-            return np.resize(packed, shape)
+            # The last group is only partially stored in the output
+            tail = np.empty((end - begin, values_per_group), dtype=np.uint8)
+            unpack_group(chunk, tail)
+            unpacked[first:last] = tail.reshape(-1)[:last - first]
+
+    if type == Type.i4:
+        # Sign extension of 4-bit values: (value ^ 0b1000) - 0b1000 in modular uint8 arithmetic
+        np.bitwise_xor(unpacked, np.uint8(0x08), out=unpacked)
+        np.subtract(unpacked, np.uint8(0x08), out=unpacked)
+    return out
+
+
+def _check_output(out: Optional[np.ndarray], shape: list, dtype: type) -> np.ndarray:
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.dtype != dtype:
+        raise RuntimeError(f"Output array has dtype {out.dtype}, expected {np.dtype(dtype)}")
+    if out.size != int(np.prod(shape)):
+        raise RuntimeError(f"Output array has {out.size} elements, expected shape {shape}")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise RuntimeError("Output array must be C-contiguous and writeable")
+    return out
+
+
+def _get_packing_scheme(type: Type) -> tuple[int, int, Callable, Callable]:
+    """Return number of values and bytes in a packed group and functions packing/unpacking groups."""
+    # Handle u3 and u6 with special transposed packing
+    if type == Type.u3:
+        return 8, 3, _pack_u3, _unpack_u3
+    elif type == Type.u6:
+        return 4, 3, _pack_u6, _unpack_u6
 
+    assert type in [Type.u1, Type.u2, Type.u4, Type.i4, Type.nf4, Type.f4e2m1], "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
+    num_bits = type.bitwidth
+    assert num_bits < 8 and 8 % num_bits == 0, "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
 
-def _pack_u3(array: np.ndarray) -> np.ndarray:
-    """Pack u3 values using transposed packing scheme.
+    def pack(values: np.ndarray, packed: np.ndarray) -> None:
+        _pack_bits(values, packed[:, 0], num_bits)
 
-    8 values (each 3 bits) are packed into 3 bytes:
-    - Byte 0: bits [1:0] of values 0-3 (4 values * 2 bits = 8 bits)
-    - Byte 1: bits [1:0] of values 4-7 (4 values * 2 bits = 8 bits)
-    - Byte 2: bits [2] of all 8 values (8 values * 1 bit = 8 bits)
+    def unpack(packed: np.ndarray, values: np.ndarray) -> None:
+        _unpack_bits(packed[:, 0], values, num_bits)
+
+    return 8 // num_bits, 1, pack, unpack
+
+
+def _pack_bits(values: np.ndarray, packed: np.ndarray, num_bits: int, first_shift: int = 8) -> None:
+    """Pack columns of `values` into `packed`, the first column taking the most significant bits.
+
+    Only `num_bits` lower bits of every value are stored. Bits are placed starting from
+    the `first_shift` bit position down to the least significant bit.
     """
-    array = array.astype(np.uint8, casting="unsafe").flatten()
-    # Pad to multiple of 8
-    pad = (-len(array)) % 8
-    if pad:
-        array = np.concatenate([array, np.zeros(pad, dtype=np.uint8)])
+    mask = np.uint8((1 << num_bits) - 1)
+    packed[...] = 0
+    column = np.empty(values.shape[0], dtype=np.uint8)
+    for idx in range(values.shape[1]):
+        np.bitwise_and(values[:, idx], mask, out=column)
+        np.left_shift(column, np.uint8(first_shift - num_bits * (idx + 1)), out=column)
+        np.bitwise_or(packed, column, out=packed)
 
-    groups = array.reshape(-1, 8)
-    result = []
 
-    for group in groups:
-        # Extract lower 2 bits and MSB for each value
-        lower_bits = group & 0x03  # bits [1:0]
-        msb = (group >> 2) & 0x01  # bit [2]
+def _unpack_bits(packed: np.ndarray, values: np.ndarray, num_bits: int, first_shift: int = 8) -> None:
+    """Reverse of _pack_bits, every column of `values` receives the next `num_bits` bits of `packed`."""
+    mask = np.uint8((1 << num_bits) - 1)
+    for idx in range(values.shape[1]):
+        column = values[:, idx]
+        np.right_shift(packed, np.uint8(first_shift - num_bits * (idx + 1)), out=column)
+        np.bitwise_and(column, mask, out=column)
 
-        # Pack into 3 bytes
-        byte0 = (lower_bits[0] << 6) | (lower_bits[1] << 4) | (lower_bits[2] << 2) | lower_bits[3]
-        byte1 = (lower_bits[4] << 6) | (lower_bits[5] << 4) | (lower_bits[6] << 2) | lower_bits[7]
-        byte2 = (msb[0] << 7) | (msb[1] << 6) | (msb[2] << 5) | (msb[3] << 4) | \
-                (msb[4] << 3) | (msb[5] << 2) | (msb[6] << 1) | msb[7]
 
-        result.extend([byte0, byte1, byte2])
+def _pack_u3(values: np.ndarray, packed: np.ndarray) -> None:
+    """Pack u3 values using transposed packing scheme.
 
-    return np.array(result, dtype=np.uint8)
+    8 values (each 3 bits) are packed into 3 bytes:
+    - Byte 0: bits [1:0] of values 0-3 (4 values * 2 bits = 8 bits)
+    - Byte 1: bits [1:0] of values 4-7 (4 values * 2 bits = 8 bits)
+    - Byte 2: bits [2] of all 8 values (8 values * 1 bit = 8 bits)
+    """
+    _pack_bits(values[:, 0:4], packed[:, 0], 2)
+    _pack_bits(values[:, 4:8], packed[:, 1], 2)
+    _pack_bits(values >> np.uint8(2), packed[:, 2], 1)
 
 
-def _unpack_u3(array: np.ndarray, shape: Union[list, Shape]) -> np.ndarray:
+def _unpack_u3(packed: np.ndarray, values: np.ndarray) -> None:
     """Unpack u3 values using transposed unpacking scheme.
-    
+
     3 bytes are unpacked into 8 values (each 3 bits).
     """
-    array = array.view(np.uint8)
-    shape = list(shape)
+    _unpack_bits(packed[:, 0], values[:, 0:4], 2)
+    _unpack_bits(packed[:, 1], values[:, 4:8], 2)
+    msb = np.empty_like(values)
+    _unpack_bits(packed[:, 2], msb, 1)
+    np.bitwise_or(values, msb << np.uint8(2), out=values)
 
-    # Process 3 bytes at a time
-    result = []
-    for i in range(0, len(array), 3):
-        if i + 2 >= len(array):
-            break
-        byte0, byte1, byte2 = array[i:i+3]
-
-        # Unpack lower 2 bits from first two bytes
-        val0 = (byte0 >> 6) & 0x03
-        val1 = (byte0 >> 4) & 0x03
-        val2 = (byte0 >> 2) & 0x03
-        val3 = byte0 & 0x03
-        val4 = (byte1 >> 6) & 0x03
-        val5 = (byte1 >> 4) & 0x03
-        val6 = (byte1 >> 2) & 0x03
-        val7 = byte1 & 0x03
-
-        # Unpack MSBs from third byte
-        msb0 = (byte2 >> 7) & 0x01
-        msb1 = (byte2 >> 6) & 0x01
-        msb2 = (byte2 >> 5) & 0x01
-        msb3 = (byte2 >> 4) & 0x01
-        msb4 = (byte2 >> 3) & 0x01
-        msb5 = (byte2 >> 2) & 0x01
-        msb6 = (byte2 >> 1) & 0x01
-        msb7 = byte2 & 0x01
-
-        # Combine to form 3-bit values
-        result.extend([
-            val0 | (msb0 << 2), val1 | (msb1 << 2), val2 | (msb2 << 2), val3 | (msb3 << 2),
-            val4 | (msb4 << 2), val5 | (msb5 << 2), val6 | (msb6 << 2), val7 | (msb7 << 2)
-        ])
-
-    result = np.array(result, dtype=np.uint8)
-    return np.resize(result, shape)
-
-
-def _pack_u6(array: np.ndarray) -> np.ndarray:
+
+def _pack_u6(values: np.ndarray, packed: np.ndarray) -> None:
     """Pack u6 values using transposed packing scheme.
 
     4 values (each 6 bits) are packed into 3 bytes:
@@ -193,62 +228,18 @@ def _pack_u6(array: np.ndarray) -> np.ndarray:
     - Byte 1: bits [3:0] of values 2-3 (2 values * 4 bits = 8 bits)
     - Byte 2: bits [5:4] of all 4 values (4 values * 2 bits = 8 bits)
     """
-    array = array.astype(np.uint8, casting="unsafe").flatten()
-    # Pad to multiple of 4
-    pad = (-len(array)) % 4
-    if pad:
-        array = np.concatenate([array, np.zeros(pad, dtype=np.uint8)])
-
-    groups = array.reshape(-1, 4)
-    result = []
-
-    for group in groups:
-        lower_bits = group & 0x0F  # bits [3:0]
-        upper_bits = (group >> 4) & 0x03  # bits [5:4]
+    _pack_bits(values[:, 0:2], packed[:, 0], 4)
+    _pack_bits(values[:, 2:4], packed[:, 1], 4)
+    _pack_bits(values >> np.uint8(4), packed[:, 2], 2)
 
-        # Pack into 3 bytes
-        byte0 = (lower_bits[0] << 4) | lower_bits[1]
-        byte1 = (lower_bits[2] << 4) | lower_bits[3]
-        byte2 = (upper_bits[0] << 6) | (upper_bits[1] << 4) | (upper_bits[2] << 2) | upper_bits[3]
 
-        result.extend([byte0, byte1, byte2])
-
-    return np.array(result, dtype=np.uint8)
-
-
-def _unpack_u6(array: np.ndarray, shape: Union[list, Shape]) -> np.ndarray:
+def _unpack_u6(packed: np.ndarray, values: np.ndarray) -> None:
     """Unpack u6 values using transposed unpacking scheme.
-    
+
     3 bytes are unpacked into 4 values (each 6 bits).
     """
-    array = array.view(np.uint8)
-    shape = list(shape)
-    num_values = int(np.prod(shape))
-    
-    # Process 3 bytes at a time
-    result = []
-    for i in range(0, len(array), 3):
-        if i + 2 >= len(array):
-            break
-        byte0, byte1, byte2 = array[i:i+3]
-        
-        # Unpack lower 4 bits from first two bytes
-        val0 = (byte0 >> 4) & 0x0F
-        val1 = byte0 & 0x0F
-        val2 = (byte1 >> 4) & 0x0F
-        val3 = byte1 & 0x0F
-        
-        # Unpack upper 2 bits from third byte
-        upper0 = (byte2 >> 6) & 0x03
-        upper1 = (byte2 >> 4) & 0x03
-        upper2 = (byte2 >> 2) & 0x03
-        upper3 = byte2 & 0x03
-        
-        # Combine to form 6-bit values
-        result.extend([
-            val0 | (upper0 << 4), val1 | (upper1 << 4),
-            val2 | (upper2 << 4), val3 | (upper3 << 4)
-        ])
-    
-    result = np.array(result, dtype=np.uint8)
-    return np.resize(result, shape)
+    _unpack_bits(packed[:, 0], values[:, 0:2], 4)
+    _unpack_bits(packed[:, 1], values[:, 2:4], 4)
+    upper = np.empty_like(values)
+    _unpack_bits(packed[:, 2], upper, 2)
+    np.bitwise_or(values, upper << np.uint8(4), out=values)
@@ -5,8 +5,13 @@ from openvino._pyopenvino import Type
 import numpy
 import numpy as np
 import openvino._pyopenvino
-__all__: list[str] = ['Shape', 'Type', 'np', 'pack_data', 'unpack_data']
-def pack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type) -> numpy.ndarray:
+import typing
+from typing import Callable
+from typing import Optional
+from typing import Union
+__all__: list[str] = ['Callable', 'DEFAULT_CHUNK_SIZE', 'Optional', 'Shape', 'Type', 'Union', 'np', 'pack_data', 'unpack_data']
+DEFAULT_CHUNK_SIZE: int = 4194304
+def pack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type, out: typing.Optional[numpy.ndarray] = None, chunk_size: int = 4194304) -> numpy.ndarray:
     """
     Represent array values as u1, u2, u4 or i4 openvino element type and pack them into uint8 numpy array.
     
@@ -19,11 +24,15 @@ def pack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type) -> numpy.nd
     
         :param array: numpy array with values to pack.
         :type array: numpy array
-        :param type: Type to interpret the array values. Type must be u1, u2, u4, i4, nf4 or f4e2m1.
+        :param type: Type to interpret the array values. Type must be u1, u2, u3, u4, u6, i4, nf4 or f4e2m1.
         :type type: openvino.Type
+        :param out: C-contiguous uint8 array to store the packed data into. It is allocated if not provided.
+        :type out: numpy array, optional
+        :param chunk_size: Number of values packed at once.
+        :type chunk_size: int, optional
         
     """
-def unpack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type, shape: typing.Union[list, openvino._pyopenvino.Shape]) -> numpy.ndarray:
+def unpack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type, shape: typing.Union[list, openvino._pyopenvino.Shape], out: typing.Optional[numpy.ndarray] = None, chunk_size: int = 4194304) -> numpy.ndarray:
     """
     Extract openvino element type values from array into new uint8/int8 array given shape.
     
@@ -37,5 +46,10 @@ def unpack_data(array: numpy.ndarray, type: openvino._pyopenvino.Type, shape: ty
         :type type: openvino.Type
         :param shape: the new shape for the unpacked array.
         :type shape: Union[list, openvino.Shape]
+        :param out: C-contiguous array of the given shape to store the unpacked values into.
+                    Its dtype must be int8 for i4 and uint8 for other types. It is allocated if not provided.
+        :type out: numpy array, optional
+        :param chunk_size: Number of values unpacked at once.
+        :type chunk_size: int, optional
         
     """
@@ -0,0 +1,66 @@
+# type: ignore
+from __future__ import annotations
+from openvino.tools.ovc.cli_parser import get_all_cli_parser
+from openvino.tools.ovc.cli_parser import get_model_name_from_args
+from openvino.tools.ovc.cli_parser import get_params_with_paths_list
+from openvino.tools.ovc.error import Error
+from openvino.tools.ovc.profiler import get_memory_status
+from pathlib import Path
+import argparse as argparse
+import json as json
+import multiprocessing as multiprocessing
+import os as os
+import pathlib as pathlib
+import sys as sys
+import time as time
+import traceback as traceback
+__all__: list[str] = ['Conversion', 'Error', 'MEMORY_POLL_INTERVAL', 'Path', 'STATUS_FAILED', 'STATUS_MEMORY_LIMIT', 'STATUS_SUCCESS', 'argparse', 'convert_batch', 'convert_models', 'entry_to_cli_args', 'get_all_cli_parser', 'get_context', 'get_last_error', 'get_memory_status', 'get_model_name_from_args', 'get_params_with_paths_list', 'json', 'multiprocessing', 'os', 'read_manifest', 'run_conversion', 'sys', 'time', 'traceback']
+class Conversion:
+    def __init__(self, entry: dict, cli_args: list, log_path: pathlib.Path):
+        ...
+    def finish(self, status: str = None):
+        ...
+    def start(self, context):
+        ...
+    def update_peak_rss(self):
+        ...
+def convert_batch(batch_argv: argparse.Namespace, common_args: list):
+    """
+    
+        Converts models listed in the manifest and stores the report, returns exit code of the tool.
+        
+    """
+def convert_models(entries: list, common_args: list, workers: int, memory_limit: float, log_dir: pathlib.Path):
+    """
+    
+        Converts models in at most workers processes at once and returns results of conversions in order of entries.
+        A conversion is stopped when resident memory of its process exceeds memory_limit megabytes.
+        
+    """
+def entry_to_cli_args(entry: dict):
+    """
+    
+        Converts an entry of the manifest to command line arguments of the tool.
+        
+    """
+def get_context():
+    ...
+def get_last_error(log_path: str):
+    ...
+def read_manifest(manifest_path):
+    """
+    
+        Reads the list of models from the manifest and resolves relative paths against the directory of the manifest.
+        The manifest is either a list of entries or an object with such list in "models" field.
+        
+    """
+def run_conversion(cli_args: list, log_path: str, connection):
+    """
+    
+        Entry point of a conversion process, converts a model with command line arguments of the tool.
+        
+    """
+MEMORY_POLL_INTERVAL: float = 0.1
+STATUS_FAILED: str = 'failed'
+STATUS_MEMORY_LIMIT: str = 'memory limit exceeded'
+STATUS_SUCCESS: str = 'success'
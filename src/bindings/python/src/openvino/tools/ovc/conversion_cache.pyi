@@ -0,0 +1,80 @@
+# type: ignore
+from __future__ import annotations
+from openvino._ov_api import Core
+from openvino._ov_api import Model
+from openvino._ov_api import serialize
+from openvino._pyopenvino import Dimension
+from openvino._pyopenvino import PartialShape
+from openvino._pyopenvino import Shape
+from openvino._pyopenvino import Type
+from openvino._pyopenvino import get_version as get_rt_version
+from pathlib import Path
+import hashlib as hashlib
+import inspect as inspect
+import io as io
+import json as json
+import logging as log
+import numpy as np
+import openvino._ov_api
+import os as os
+import pathlib as pathlib
+import sys as sys
+__all__: list[str] = ['CACHE_SIZE_LIMIT_ENV', 'ConversionCache', 'Core', 'DEFAULT_CACHE_SIZE_LIMIT_MB', 'Dimension', 'HASH_CHUNK_SIZE', 'Model', 'PartialShape', 'Path', 'Shape', 'Type', 'UncacheableModel', 'get_cache_key', 'get_rt_version', 'hashlib', 'inspect', 'io', 'json', 'log', 'np', 'os', 'serialize', 'sys', 'update_hash_with_extension', 'update_hash_with_file', 'update_hash_with_input_model', 'update_hash_with_path', 'update_hash_with_torch_model', 'update_hash_with_torch_tensor', 'update_hash_with_value']
+class ConversionCache:
+    """
+    
+        Directory with converted models stored as IR under content hash keys.
+        Cached models are read with mmap, so a hit costs reading of the IR topology only.
+        
+    """
+    core = None
+    @classmethod
+    def get_core(cls):
+        ...
+    def __init__(self, cache_dir, size_limit_mb: int = None):
+        ...
+    def evict(self):
+        """
+         Remove least recently used models until the cache fits in the size limit. 
+        """
+    def get_entries(self):
+        ...
+    def get_paths(self, key: str):
+        ...
+    def load(self, key: str):
+        ...
+    def store(self, key: str, model: openvino._ov_api.Model):
+        ...
+class UncacheableModel(Exception):
+    pass
+def get_cache_key(input_model, non_default_params: dict, complex_params: dict):
+    """
+    
+        Returns a key of the converted model in the conversion cache or None if the model can't be cached.
+        The key is a hash of the original model content, of conversion parameters and of OpenVINO version.
+        :param input_model: original model passed to conversion, path to model files or model object
+        :param non_default_params: conversion parameters with simple values returned by get_non_default_params
+        :param complex_params: conversion parameters which are not serialized to rt_info, like example_input
+        
+    """
+def update_hash_with_extension(hasher, extension):
+    """
+     Hash extensions by contents of their files, so a rebuilt extension library changes the key. 
+    """
+def update_hash_with_file(hasher, path: pathlib.Path):
+    ...
+def update_hash_with_input_model(hasher, input_model):
+    ...
+def update_hash_with_path(hasher, path):
+    ...
+def update_hash_with_torch_model(hasher, model):
+    ...
+def update_hash_with_torch_tensor(hasher, name, tensor):
+    ...
+def update_hash_with_value(hasher, value):
+    """
+     Hash a value of a conversion parameter which is not a string or a number, like example_input. 
+    """
+CACHE_SIZE_LIMIT_ENV: str = 'OVC_CACHE_SIZE_LIMIT'
+DEFAULT_CACHE_SIZE_LIMIT_MB: int = 10240
+HASH_CHUNK_SIZE: int = 1048576
@@ -8,7 +8,7 @@ from openvino.tools.ovc.logger import restore_logger_state
 import openvino._ov_api
 import pathlib as pathlib
 __all__: list[str] = ['Model', 'convert_model', 'get_all_cli_parser', 'get_logger_state', 'pathlib', 'restore_logger_state']
-def convert_model(input_model: [str, pathlib.Path, typing.Any, list], input: [list, dict, str] = None, output: [str, list] = None, example_input: typing.Any = None, extension: [str, pathlib.Path, list, typing.Any] = None, verbose: bool = False, share_weights: bool = True) -> openvino._ov_api.Model:
+def convert_model(input_model: [str, pathlib.Path, typing.Any, list], input: [list, dict, str] = None, output: [str, list] = None, example_input: typing.Any = None, extension: [str, pathlib.Path, list, typing.Any] = None, verbose: bool = False, share_weights: bool = True, cache_dir: [str, pathlib.Path] = None, profile: [str, pathlib.Path] = None) -> openvino._ov_api.Model:
     """
     
         Converts the model from original framework to OpenVino Model.
@@ -83,6 +83,21 @@ def convert_model(input_model: [str, pathlib.Path, typing.Any, list], input: [li
                 then mmap is used to allocate weights directly from file. If input model is
                 runtime object, then original memory regions allocated in the original model
                 are reused for weights in the converted model.
+            :param cache_dir:
+                Path to a directory with converted models. When it is set, the converted model is stored
+                there under a hash of the original model content, conversion parameters and OpenVINO version,
+                and the next conversion of the same model with the same parameters reads the stored model
+                with mmap instead of converting it again. Models of unsupported types (objects of frameworks
+                other than PyTorch, extension objects) are always converted. Least recently used models are
+                removed when the directory exceeds OVC_CACHE_SIZE_LIMIT environment variable value
+                in megabytes, 10240 by default. Models loaded from the cache don't share memory with
+                the original model.
+            :param profile:
+                Path to a JSON file to store the conversion profile. The profile contains wall time, CPU time
+                and peak resident set size of conversion phases: decoder creation (including tracing of PyTorch
+                models), moc_pipeline, preprocessing, transformations and the conversion cache, and execution time
+                of every transformation applied by OpenVINO pass managers in each phase. ovc also profiles
+                saving of the model.
     
         Returns:
             openvino.Model
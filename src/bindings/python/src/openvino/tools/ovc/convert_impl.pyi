@@ -14,6 +14,10 @@ from openvino.tools.ovc.cli_parser import get_common_cli_options
 from openvino.tools.ovc.cli_parser import get_mo_convert_params
 from openvino.tools.ovc.cli_parser import input_to_input_cut_info
 from openvino.tools.ovc.cli_parser import parse_inputs
+from openvino.tools.ovc.conversion_cache import ConversionCache
+from openvino.tools.ovc.conversion_cache import get_cache_key
+from openvino.tools.ovc.profiler import ConversionProfiler
+from openvino.tools.ovc.profiler import profile_phase
 from openvino.tools.ovc.error import Error
 from openvino.tools.ovc.error import FrameworkError
 from openvino.tools.ovc.get_ov_update_message import get_compression_message
@@ -40,11 +44,12 @@ import collections.abc
 import datetime as datetime
 import logging as log
 import openvino_telemetry as tm
+import openvino.tools.ovc.profiler
 import os as os
 import sys as sys
 import traceback as traceback
 import tracemalloc as tracemalloc
-__all__: list[str] = ['Callable', 'Error', 'FrameworkError', 'FrontEndManager', 'Iterable', 'OpConversionFailure', 'OrderedDict', 'PartialShape', 'Path', 'TelemetryExtension', 'VersionChecker', 'add_line_breaks', 'any_extensions_used', 'argparse', 'args_to_argv', 'arguments_post_parsing', 'backend_ga4', 'check_iterable', 'check_model_object', 'check_values_equal', 'datetime', 'depersonalize', 'driver', 'extract_input_info_from_example', 'filtered_extensions', 'get_available_front_ends', 'get_common_cli_options', 'get_compression_message', 'get_convert_model_help_specifics', 'get_jax_decoder', 'get_mo_convert_params', 'get_moc_frontends', 'get_non_default_params', 'get_pytorch_decoder', 'get_pytorch_decoder_for_model_on_disk', 'get_rt_version', 'init_logger', 'init_ovc_telemetry', 'input_model_is_object', 'input_to_input_cut_info', 'is_verbose', 'log', 'moc_emit_ir', 'moc_pipeline', 'normalize_inputs', 'os', 'pack_params_to_args_namespace', 'paddle_frontend_converter', 'parse_inputs', 'prepare_ir', 'print_argv', 'replace_ext', 'send_conversion_result', 'send_params_info', 'show_mo_convert_help', 'sys', 'tf_frontend_with_python_bindings_installed', 'tm', 'to_ov_type', 'traceback', 'tracemalloc']
+__all__: list[str] = ['Callable', 'ConversionCache', 'ConversionProfiler', 'Error', 'FrameworkError', 'FrontEndManager', 'Iterable', 'OpConversionFailure', 'OrderedDict', 'PartialShape', 'Path', 'TelemetryExtension', 'VersionChecker', 'add_line_breaks', 'any_extensions_used', 'argparse', 'args_to_argv', 'arguments_post_parsing', 'backend_ga4', 'check_iterable', 'check_model_object', 'check_values_equal', 'datetime', 'depersonalize', 'driver', 'extract_input_info_from_example', 'filtered_extensions', 'finish_profiling', 'get_available_front_ends', 'get_cache_key', 'get_common_cli_options', 'get_compression_message', 'get_conversion_cache', 'get_conversion_cache_key', 'get_convert_model_help_specifics', 'get_jax_decoder', 'get_mo_convert_params', 'get_moc_frontends', 'get_non_default_params', 'get_profiler', 'get_tf_frontend_utils', 'get_pytorch_decoder', 'get_pytorch_decoder_for_model_on_disk', 'get_rt_version', 'init_logger', 'init_ovc_telemetry', 'input_model_is_object', 'input_to_input_cut_info', 'is_verbose', 'log', 'moc_emit_ir', 'moc_pipeline', 'normalize_inputs', 'os', 'pack_params_to_args_namespace', 'paddle_frontend_converter', 'parse_inputs', 'prepare_ir', 'print_argv', 'profile_phase', 'replace_ext', 'send_conversion_result', 'send_params_info', 'show_mo_convert_help', 'sys', 'tm', 'to_ov_type', 'traceback', 'tracemalloc']
 def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
     ...
 def add_line_breaks(text: str, char_num: int, line_break: str):
@@ -61,10 +66,31 @@ def driver(argv: argparse.Namespace, non_default_params: dict):
     ...
 def filtered_extensions(extensions):
     ...
+def finish_profiling(profiler: openvino.tools.ovc.profiler.ConversionProfiler, verbose: bool):
+    ...
+def get_conversion_cache(args: dict, cli_parser: argparse.ArgumentParser, python_api_used, profiler = None):
+    """
+    
+        Returns the conversion cache, the key of the model in the cache and parsed arguments
+        if the conversion cache is enabled by cache_dir parameter, otherwise returns None values.
+        Parameters of the key are taken before conversion, because framework objects are replaced during conversion.
+        
+    """
+def get_conversion_cache_key(argv: argparse.Namespace, cli_parser: argparse.ArgumentParser):
+    ...
 def get_moc_frontends(argv: argparse.Namespace):
     ...
 def get_non_default_params(argv, cli_parser):
     ...
+def get_profiler(args: dict, cli_parser: argparse.ArgumentParser, python_api_used):
+    ...
+def get_tf_frontend_utils():
+    """
+    
+        Returns utilities of TensorFlow frontend or None if Python bindings of the frontend are not installed.
+        Import loads the library of the frontend, so it is done only for TensorFlow model objects.
+        
+    """
 def input_model_is_object(input_model):
     ...
 def is_verbose(argv, args = None):
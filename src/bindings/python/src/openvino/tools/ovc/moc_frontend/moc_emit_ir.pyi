@@ -2,8 +2,9 @@
 from __future__ import annotations
 from openvino._ov_api import Model
 from openvino.tools.ovc.moc_frontend.preprocessing import apply_preprocessing
+from openvino.tools.ovc.profiler import profile_phase
 import argparse as argparse
 import openvino._ov_api
-__all__: list[str] = ['Model', 'apply_preprocessing', 'argparse', 'moc_emit_ir']
+__all__: list[str] = ['Model', 'apply_preprocessing', 'argparse', 'moc_emit_ir', 'profile_phase']
 def moc_emit_ir(ngraph_function: openvino._ov_api.Model, argv: argparse.Namespace):
     ...
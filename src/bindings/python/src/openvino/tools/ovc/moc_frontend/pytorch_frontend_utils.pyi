@@ -7,9 +7,11 @@ from openvino.tools.ovc.cli_parser import single_input_to_input_cut_info
 from openvino.tools.ovc.error import Error
 import logging as log
 import numpy as np
+import os as os
 import pathlib as pathlib
 import sys as sys
-__all__: list[str] = ['Error', 'PartialShape', 'Tensor', 'extract_input_info_from_example', 'extract_module_extensions', 'flatten_inputs', 'get_pytorch_decoder', 'get_pytorch_decoder_for_model_on_disk', 'get_value_from_list_or_dict', 'log', 'np', 'pathlib', 'prepare_torch_inputs', 'single_input_to_input_cut_info', 'sys', 'to_torch_tensor', 'update_list_or_dict']
+import zipfile as zipfile
+__all__: list[str] = ['Error', 'PartialShape', 'Tensor', 'extract_input_info_from_example', 'extract_module_extensions', 'flatten_inputs', 'get_pytorch_decoder', 'get_pytorch_decoder_for_model_on_disk', 'get_value_from_list_or_dict', 'log', 'np', 'os', 'pathlib', 'prepare_torch_inputs', 'single_input_to_input_cut_info', 'sys', 'to_torch_tensor', 'update_list_or_dict', 'zipfile']
 def extract_input_info_from_example(args, inputs):
     ...
 def extract_module_extensions(args):
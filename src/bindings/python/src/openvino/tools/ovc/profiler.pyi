@@ -0,0 +1,60 @@
+# type: ignore
+from __future__ import annotations
+import contextlib as contextlib
+import json as json
+import os as os
+import sys as sys
+import tempfile as tempfile
+import time as time
+__all__: list[str] = ['ConversionProfiler', 'PROFILE_PASS_ENV', 'Phase', 'contextlib', 'get_memory_status', 'json', 'os', 'profile_phase', 'reset_peak_rss', 'sys', 'tempfile', 'time']
+class ConversionProfiler:
+    """
+    
+        Records wall time, CPU time and peak resident set size of conversion phases
+        and execution time of every transformation applied by OpenVINO pass managers.
+        Transformations are attributed to the innermost phase running them.
+        CPU time includes all threads of the process. All phases are nested into 'total' phase,
+        which lasts from creation of the profiler till close().
+        Execution times of transformations are collected by setting OV_ENABLE_PROFILE_PASS to a file,
+        in this mode pass managers don't print to the standard output.
+        
+    """
+    def __init__(self, report_path):
+        ...
+    def close(self):
+        """
+        
+                Stops recording of transformations and writes the JSON report.
+                
+        """
+    def phase(self, name: str):
+        ...
+    def print_summary(self):
+        ...
+    def read_transformations(self):
+        ...
+class Phase:
+    def __init__(self, name: str, depth: int):
+        ...
+    def finish(self):
+        ...
+    def to_dict(self):
+        ...
+    def update_peak_rss(self, peak_rss):
+        ...
+def get_memory_status(pid = 'self'):
+    """
+    
+        Returns current and peak resident set size of the process in megabytes, None values if they are not available.
+        Memory of other processes is available on Linux only.
+        
+    """
+def profile_phase(profiler: [ConversionProfiler, None], name: str):
+    """
+    
+        Returns a context manager which records the phase if profiling is enabled for the conversion.
+        
+    """
+def reset_peak_rss():
+    ...
+PROFILE_PASS_ENV: str = 'OV_ENABLE_PROFILE_PASS'
@@ -8,7 +8,8 @@ import argparse as argparse
 import numbers as numbers
 import openvino_telemetry as tm
 import os as os
-__all__: list[str] = ['arg_to_str', 'argparse', 'backend_ga4', 'check_values_equal', 'get_params_with_paths_list', 'get_rt_version', 'get_tid', 'init_ovc_telemetry', 'init_telemetry_class', 'is_keras3', 'is_optimum', 'is_torch_compile', 'numbers', 'os', 'send_conversion_result', 'send_framework_info', 'send_params_info', 'telemetry_params', 'tm']
+import sys as sys
+__all__: list[str] = ['arg_to_str', 'argparse', 'backend_ga4', 'callers', 'check_values_equal', 'get_params_with_paths_list', 'get_rt_version', 'get_tid', 'init_ovc_telemetry', 'init_telemetry_class', 'is_called_from', 'is_keras3', 'is_optimum', 'is_torch_compile', 'numbers', 'os', 'send_conversion_result', 'send_framework_info', 'send_params_info', 'send_torch_compile_import', 'set_caller', 'sys', 'telemetry_params', 'tm']
 def arg_to_str(arg):
     ...
 def get_tid():
@@ -21,6 +22,16 @@ def init_ovc_telemetry(app_name = 'OVC', app_version = None):
     ...
 def init_telemetry_class(tid, app_name, app_version, backend, enable_opt_in_dialog, disable_in_ci):
     ...
+def is_called_from(module_name: str, paths: list):
+    """
+    
+        Checks if a function from one of the paths is in the call stack.
+        Functions of a module can't be called before the module is imported,
+        so the stack is checked only if the module is imported and without reading sources of frames.
+        :param module_name: name of the module which is imported if the function is called.
+        :param paths: parts of the file paths of the functions.
+        
+    """
 def is_keras3():
     ...
 def is_optimum():
@@ -43,4 +54,19 @@ def send_params_info(params: dict):
         :param params: command-line parameters dictionary.
         
     """
+def send_torch_compile_import():
+    """
+    
+        This function sends information about import of OpenVINO from torch.compile.
+        
+    """
+def set_caller(name: str):
+    """
+    
+        Marks an integration as a caller of OpenVINO, so it is detected without walking the call stack.
+        The call stack is still checked for integrations which don't mark themselves.
+        :param name: name of the integration: "optimum", "torch.compile" or "keras3".
+        
+    """
+callers: set = set()
 telemetry_params: dict = {'TID': 'G-W5E9RNLD4H'}
@@ -3,3 +3,4 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from openvino.frontend.pytorch.torchdynamo import backend
+from openvino.frontend.pytorch.torchdynamo.execute import compiled_cache_info, set_compiled_cache_limits
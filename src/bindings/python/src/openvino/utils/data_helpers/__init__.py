@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from openvino.utils.data_helpers.data_dispatcher import _data_dispatch
+from openvino.utils.data_helpers.data_dispatcher import InputBindingPlan
 from openvino.utils.data_helpers.wrappers import tensor_from_file
 from openvino.utils.data_helpers.wrappers import _InferRequestWrapper
+from openvino.utils.data_helpers.wrappers import _OutputIndex
 from openvino.utils.data_helpers.wrappers import OVDict
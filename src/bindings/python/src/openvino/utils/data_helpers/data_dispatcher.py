@@ -470,3 +470,141 @@ def _data_dispatch(
     if inputs is None:
         return {}
     return create_shared(inputs, request) if is_shared else create_copied(inputs, request)
+
+
+class _BindingEntry:
+    """Binding of a single input value, resolved once by InputBindingPlan."""
+
+    # Value is an openvino.Tensor or RemoteTensor passed "as-is"
+    AS_IS = 0
+    # C-contiguous, writeable numpy array of the input's dtype is wrapped without a copy
+    SHARE = 1
+    # Numpy array is copied into the Tensor already allocated by the request
+    COPY = 2
+    # Any other value is dispatched by the generic dispatcher
+    GENERIC = 3
+
+    __slots__ = ("key", "kind", "dtype", "ndim")
+
+    def __init__(self, key: Optional[ValidKeys], kind: int, dtype: Optional[np.dtype] = None, ndim: int = 0) -> None:
+        self.key = key
+        self.kind = kind
+        self.dtype = dtype
+        self.ndim = ndim
+
+
+class InputBindingPlan:
+    """Reusable plan of binding inputs of a fixed structure to an InferRequest.
+
+    The plan resolves input keys, checks data types and memory layout of the example inputs
+    and decides between sharing and copying every input once. Calls with inputs of the same
+    structure then skip the generic dispatching. Values which do not match the plan, e.g. arrays
+    of a different dtype, are dispatched the generic way, so the results are always the same
+    as the ones of `_data_dispatch`.
+
+    Create it with `InferRequest.create_binding_plan`.
+    """
+
+    def __init__(
+        self,
+        request: _InferRequestWrapper,
+        inputs: Union[ContainerTypes, Tensor, np.ndarray],
+        is_shared: bool = False,
+    ) -> None:
+        self.request = request
+        self.is_shared = is_shared
+        self._container = type(inputs)
+        self._entries: Optional[list] = None
+        if isinstance(inputs, dict):
+            items = list(inputs.items())
+            for key, _ in items:
+                if not isinstance(key, (str, int, ConstOutput)):
+                    raise TypeError(f"Incompatible key type for input: {key}")
+        elif isinstance(inputs, list) and request._is_single_input() and is_list_simple_type(inputs):
+            # List of simple types is a value of the only input, it is always copied
+            return
+        elif isinstance(inputs, (list, tuple, OVDict)):
+            items = list(enumerate(inputs.values() if isinstance(inputs, OVDict) else inputs))
+        else:
+            items = [(None, inputs)]
+        self._entries = [self._resolve(key, value) for key, value in items]
+
+    def _resolve(self, key: Optional[ValidKeys], value: Any) -> _BindingEntry:
+        if isinstance(value, (Tensor, RemoteTensor)):
+            return _BindingEntry(key, _BindingEntry.AS_IS)
+        if type(value) is not np.ndarray or value.ndim == 0:
+            return _BindingEntry(key, _BindingEntry.GENERIC)
+        tensor_type = get_request_tensor(self.request, key).get_element_type()
+        if tensor_type in (Type.string, Type.bf16):
+            return _BindingEntry(key, _BindingEntry.GENERIC)
+        dtype = np.dtype(tensor_type.to_dtype())
+        return _BindingEntry(key, _BindingEntry.SHARE if self.is_shared else _BindingEntry.COPY, dtype, value.ndim)
+
+    def _values(self, inputs: Any) -> Optional[list]:
+        """Return values in the order of the plan entries or None if the structure is different."""
+        if self._entries is None or type(inputs) is not self._container:
+            return None
+        if self._container is dict:
+            try:
+                return [inputs[entry.key] for entry in self._entries] if len(inputs) == len(self._entries) else None
+            except KeyError:
+                return None
+        if self._container is OVDict:
+            inputs = list(inputs.values())
+        elif self._container not in (list, tuple):
+            return [inputs]
+        return list(inputs) if len(inputs) == len(self._entries) else None
+
+    def dispatch(self, inputs: Any) -> Union[dict, Tensor]:
+        """Bind inputs to the request.
+
+        :return: Tensors to be set on the request during the inference call,
+                 the same as returned by `_data_dispatch`.
+        """
+        values = self._values(inputs)
+        if values is None:
+            return _data_dispatch(self.request, inputs, self.is_shared)
+        if self._entries[0].key is None and self._entries[0].kind == _BindingEntry.GENERIC:
+            return _data_dispatch(self.request, inputs, self.is_shared)
+
+        request = self.request
+        tensors: dict = {}
+        kept_alive: dict = {}
+        for entry, value in zip(self._entries, values):
+            kind = entry.kind
+            if kind == _BindingEntry.AS_IS and isinstance(value, (Tensor, RemoteTensor)):
+                tensors[entry.key] = value
+                continue
+            if type(value) is np.ndarray and value.dtype == entry.dtype and value.ndim == entry.ndim:
+                if kind == _BindingEntry.SHARE and value.flags.c_contiguous and value.flags.writeable:
+                    tensors[entry.key] = Tensor(value, shared_memory=True)
+                    continue
+                if kind == _BindingEntry.COPY:
+                    tensor = get_request_tensor(request, entry.key)
+                    if tuple(tensor.shape) != value.shape:
+                        tensor.shape = value.shape
+                    tensor.data[:] = value
+                    continue
+            # Value does not match the plan, fall back to the generic dispatching of this input
+            if entry.key is None:
+                return _data_dispatch(request, inputs, self.is_shared)
+            if self.is_shared:
+                kept_alive[entry.key] = to_c_style(value, is_shared=True)
+                tensors[entry.key] = value_to_tensor(kept_alive[entry.key], request=request, is_shared=True,
+                                                     key=entry.key)
+            else:
+                tensors.update(update_inputs({entry.key: value}, request))
+
+        if self.is_shared:
+            request._inputs_data = kept_alive
+        if self._entries[0].key is None:
+            return tensors.get(None, {})
+        return tensors
+
+    def infer(self, inputs: Any = None, share_outputs: bool = False, *, decode_strings: bool = True) -> OVDict:
+        """Infers inputs bound by the plan in synchronous mode, see `InferRequest.infer`."""
+        return self.request._infer_lazy(self.dispatch(inputs), share_outputs, decode_strings)
+
+    def start_async(self, inputs: Any = None, userdata: Any = None) -> None:
+        """Starts inference of inputs bound by the plan in asynchronous mode, see `InferRequest.start_async`."""
+        self.request._start_async(self.dispatch(inputs), userdata)
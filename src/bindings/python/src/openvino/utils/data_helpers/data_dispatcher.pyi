@@ -11,7 +11,55 @@ import numpy as np
 import openvino._pyopenvino
 import openvino.utils.data_helpers.wrappers
 import typing
-__all__: list[str] = ['ConstOutput', 'ContainerTypes', 'OVDict', 'RemoteTensor', 'ScalarTypes', 'Tensor', 'Type', 'ValidKeys', 'create_copied', 'create_shared', 'get_request_tensor', 'is_list_simple_type', 'normalize_arrays', 'np', 'set_request_tensor', 'singledispatch', 'to_c_style', 'update_inputs', 'update_tensor', 'value_to_tensor']
+__all__: list[str] = ['ConstOutput', 'ContainerTypes', 'InputBindingPlan', 'OVDict', 'RemoteTensor', 'ScalarTypes', 'Tensor', 'Type', 'ValidKeys', 'create_copied', 'create_shared', 'get_request_tensor', 'is_list_simple_type', 'normalize_arrays', 'np', 'set_request_tensor', 'singledispatch', 'to_c_style', 'update_inputs', 'update_tensor', 'value_to_tensor']
+class InputBindingPlan:
+    """
+    Reusable plan of binding inputs of a fixed structure to an InferRequest.
+    
+        The plan resolves input keys, checks data types and memory layout of the example inputs
+        and decides between sharing and copying every input once. Calls with inputs of the same
+        structure then skip the generic dispatching. Values which do not match the plan, e.g. arrays
+        of a different dtype, are dispatched the generic way, so the results are always the same
+        as the ones of `_data_dispatch`.
+    
+        Create it with `InferRequest.create_binding_plan`.
+        
+    """
+    def __init__(self, request: openvino.utils.data_helpers.wrappers._InferRequestWrapper, inputs: typing.Union[dict, list, tuple, openvino.utils.data_helpers.wrappers.OVDict, openvino._pyopenvino.Tensor, numpy.ndarray], is_shared: bool = False) -> None:
+        ...
+    def _resolve(self, key: typing.Union[str, int, openvino._pyopenvino.ConstOutput, NoneType], value: typing.Any) -> _BindingEntry:
+        ...
+    def _values(self, inputs: typing.Any) -> typing.Optional[list]:
+        """
+        Return values in the order of the plan entries or None if the structure is different.
+        """
+    def dispatch(self, inputs: typing.Any) -> typing.Union[dict, openvino._pyopenvino.Tensor]:
+        """
+        Bind inputs to the request.
+        
+                :return: Tensors to be set on the request during the inference call,
+                         the same as returned by `_data_dispatch`.
+                
+        """
+    def infer(self, inputs: typing.Any = None, share_outputs: bool = False, *, decode_strings: bool = True) -> openvino.utils.data_helpers.wrappers.OVDict:
+        """
+        Infers inputs bound by the plan in synchronous mode, see `InferRequest.infer`.
+        """
+    def start_async(self, inputs: typing.Any = None, userdata: typing.Any = None) -> None:
+        """
+        Starts inference of inputs bound by the plan in asynchronous mode, see `InferRequest.start_async`.
+        """
+class _BindingEntry:
+    """
+    Binding of a single input value, resolved once by InputBindingPlan.
+    """
+    AS_IS: typing.ClassVar[int] = 0
+    COPY: typing.ClassVar[int] = 2
+    GENERIC: typing.ClassVar[int] = 3
+    SHARE: typing.ClassVar[int] = 1
+    __slots__: typing.ClassVar[tuple] = ('key', 'kind', 'dtype', 'ndim')
+    def __init__(self, key: typing.Union[str, int, openvino._pyopenvino.ConstOutput, NoneType], kind: int, dtype: typing.Optional[numpy.dtype] = None, ndim: int = 0) -> None:
+        ...
 def _(inputs: typing.Union[openvino._pyopenvino.Tensor, numpy.number, int, float, str, bytes], request: openvino.utils.data_helpers.wrappers._InferRequestWrapper) -> openvino._pyopenvino.Tensor:
     ...
 def _data_dispatch(request: openvino.utils.data_helpers.wrappers._InferRequestWrapper, inputs: typing.Union[dict, list, tuple, openvino.utils.data_helpers.wrappers.OVDict, openvino._pyopenvino.Tensor, numpy.ndarray, numpy.number, int, float, str] = None, is_shared: bool = False) -> typing.Union[dict, openvino._pyopenvino.Tensor]:
@@ -2,13 +2,16 @@
 # Copyright (C) 2018-2026 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import warnings
+import weakref
 import numpy as np
 
 from functools import singledispatchmethod
-from collections.abc import Iterator, Mapping, KeysView, ItemsView, ValuesView
-from typing import Union, Optional
+from collections.abc import Callable, Iterator, Mapping, KeysView, ItemsView, ValuesView
+from time import perf_counter
+from typing import Any, Union, Optional
 
-from openvino._pyopenvino import Tensor, ConstOutput
+from openvino._pyopenvino import Tensor, ConstOutput, Type
 from openvino._pyopenvino import InferRequest as InferRequestBase
 
 
@@ -20,14 +23,98 @@ def tensor_from_file(path: str) -> Tensor:
 class _InferRequestWrapper(InferRequestBase):
     """InferRequest class with internal memory."""
 
-    def __init__(self, other: InferRequestBase) -> None:
+    def __init__(self, other: InferRequestBase, output_index: Optional["_OutputIndex"] = None) -> None:
         # Private memeber to store newly created shared memory data
         self._inputs_data = None
+        # Private member to store index of outputs, shared by all requests of a compiled model
+        self._output_index = output_index
+        # Private member to store weak reference to the last lazily converted results
+        self._last_results: Optional[weakref.ref] = None
+        # Private member to store a callback receiving `perf_counter` timestamps of stages of
+        # every `infer` call as a dict of stage name to (start, end), used to profile Python overhead
+        self._stage_hook: Optional[Callable[[dict], None]] = None
         super().__init__(other)
 
     def _is_single_input(self) -> bool:
         return len(self.input_tensors) == 1
 
+    def _get_output_index(self) -> "_OutputIndex":
+        if self._output_index is None:
+            self._output_index = _OutputIndex(self.model_outputs)
+        return self._output_index
+
+    def _detach_results(self) -> None:
+        """Convert outputs not accessed yet in the last results before the output tensors are overwritten."""
+        results = self._last_results() if self._last_results is not None else None
+        if results is not None:
+            results._materialize()
+        self._last_results = None
+
+    def _infer_lazy(
+        self,
+        inputs: Union[dict, Tensor],
+        share_outputs: bool,
+        decode_strings: bool,
+        stages: Optional[dict] = None,
+    ) -> "OVDict":
+        """Run inference and wrap output tensors, converting them to numpy arrays only on access.
+
+        Timestamps of the native call and of wrapping are added to `stages` if it is provided.
+        """
+        self._detach_results()
+        if stages is None:
+            return self._wrap_results(self._infer(inputs), share_outputs, decode_strings)
+        start = perf_counter()
+        tensors = self._infer(inputs)
+        infer_end = perf_counter()
+        results = self._wrap_results(tensors, share_outputs, decode_strings)
+        stages["native infer call"] = (start, infer_end)
+        stages["results wrapping"] = (infer_end, perf_counter())
+        return results
+
+    def _wrap_results(self, tensors: list[Tensor], share_outputs: bool, decode_strings: bool) -> "OVDict":
+        results = OVDict._from_tensors(self._get_output_index(), tensors, share_outputs, decode_strings)
+        if not share_outputs:
+            self._last_results = weakref.ref(results)
+        return results
+
+    def _start_async(self, inputs: Union[dict, Tensor], userdata: Any) -> None:
+        self._detach_results()
+        InferRequestBase.start_async(self, inputs, userdata)
+
+
+class _OutputIndex:
+    """Index of outputs of a compiled model.
+
+    Maps ports, names and indices of outputs to their positions. It is created once
+    per compiled model and shared by all results, output names are read on first use.
+    """
+
+    def __init__(self, ports: list[ConstOutput]) -> None:
+        self.ports = tuple(ports)
+        self.positions = {port: idx for idx, port in enumerate(self.ports)}
+        self._names: Optional[tuple[set[str], ...]] = None
+        self._name_positions: Optional[dict[str, int]] = None
+
+    @property
+    def names(self) -> tuple[set[str], ...]:
+        if self._names is None:
+            self._names = tuple(port.get_names() for port in self.ports)
+        return self._names
+
+    def name_position(self, name: str) -> int:
+        if self._name_positions is None:
+            name_positions: dict[str, int] = {}
+            for idx, port_names in enumerate(self.names):
+                for port_name in port_names:
+                    name_positions.setdefault(port_name, idx)
+            self._name_positions = name_positions
+        return self._name_positions[name]
+
+
+# Marker of an output which is not converted to numpy array yet
+_NOT_CONVERTED = object()
+
 
 class OVDict(Mapping):
     """Custom OpenVINO dictionary with inference results.
@@ -42,6 +129,11 @@ class OVDict(Mapping):
     This class follows `frozenset`/`tuple` concept of immutability.
     It is prohibited to assign new items or edit them.
 
+    Results of `InferRequest.infer` are converted to numpy arrays lazily,
+    only outputs which are accessed are copied from output tensors.
+    Outputs which were not accessed are copied before the infer request
+    producing them runs the next inference.
+
     To revert to the previous behavior use `to_dict` method which
     return shallow copy of underlaying dictionary.
     Note: It removes addressing feature! New dictionary keeps
@@ -67,27 +159,57 @@ class OVDict(Mapping):
         out1, out2, out3, _ = request.infer(inputs).to_tuple()
     """
     def __init__(self, _dict: dict[ConstOutput, np.ndarray]) -> None:
-        self._dict = _dict
-        self._names: Optional[dict[ConstOutput, set[str]]] = None
+        self._index = _OutputIndex(_dict.keys())
+        self._values = list(_dict.values())
+        self._tensors: Optional[list[Tensor]] = None
+        self._share_outputs = False
+        self._decode_strings = True
+
+    @classmethod
+    def _from_tensors(
+        cls,
+        index: _OutputIndex,
+        tensors: list[Tensor],
+        share_outputs: bool = False,
+        decode_strings: bool = True,
+    ) -> "OVDict":
+        """Create results converting output tensors to numpy arrays on first access."""
+        results = cls.__new__(cls)
+        results._index = index
+        results._values = [_NOT_CONVERTED] * len(tensors)
+        results._tensors = tensors
+        results._share_outputs = share_outputs
+        results._decode_strings = decode_strings
+        return results
 
     def __iter__(self) -> Iterator:
-        return self._dict.__iter__()
+        return iter(self._index.ports)
 
     def __len__(self) -> int:
-        return len(self._dict)
+        return len(self._index.ports)
 
     def __repr__(self) -> str:
-        return self._dict.__repr__()
-
-    def __get_names(self) -> dict[ConstOutput, set[str]]:
-        """Return names of every output key.
-
-        Insert empty set if key has no name.
-        """
-        return {key: key.get_names() for key in self._dict.keys()}
-
-    def __get_key(self, index: int) -> ConstOutput:
-        return list(self._dict.keys())[index]
+        return self.to_dict().__repr__()
+
+    def __get_value(self, idx: int) -> np.ndarray:
+        value = self._values[idx]
+        if value is _NOT_CONVERTED:
+            tensor = self._tensors[idx]  # type: ignore
+            if tensor.element_type == Type.string:
+                if self._share_outputs:
+                    warnings.warn("Result of a string type will be copied to OVDict!", RuntimeWarning, stacklevel=3)
+                value = tensor.str_data if self._decode_strings else tensor.bytes_data
+            else:
+                value = tensor.data if self._share_outputs else tensor.data.copy()
+            self._values[idx] = value
+        return value
+
+    def _materialize(self) -> None:
+        """Convert all outputs and release output tensors."""
+        if self._tensors is not None:
+            for idx in range(len(self._values)):
+                self.__get_value(idx)
+            self._tensors = None
 
     @singledispatchmethod
     def __getitem_impl(self, key: Union[ConstOutput, int, str]) -> np.ndarray:
@@ -95,44 +217,37 @@ class OVDict(Mapping):
 
     @__getitem_impl.register
     def _(self, key: ConstOutput) -> np.ndarray:
-        return self._dict[key]
+        return self.__get_value(self._index.positions[key])
 
     @__getitem_impl.register
     def _(self, key: int) -> np.ndarray:
         try:
-            return self._dict[self.__get_key(key)]
+            return self.__get_value(range(len(self._values))[key])
         except IndexError:
             raise KeyError(key)
 
     @__getitem_impl.register
     def _(self, key: str) -> np.ndarray:
-        if self._names is None:
-            self._names = self.__get_names()
-        for port, port_names in self._names.items():
-            if key in port_names:
-                return self._dict[port]
-        raise KeyError(key)
+        return self.__get_value(self._index.name_position(key))
 
     def __getitem__(self, key: Union[ConstOutput, int, str]) -> np.ndarray:
         return self.__getitem_impl(key)
 
     def keys(self) -> KeysView[ConstOutput]:
-        return self._dict.keys()
+        return KeysView(self)
 
     def values(self) -> ValuesView[np.ndarray]:
-        return self._dict.values()
+        return ValuesView(self)
 
     def items(self) -> ItemsView[ConstOutput, np.ndarray]:
-        return self._dict.items()
+        return ItemsView(self)
 
     def names(self) -> tuple[set[str], ...]:
         """Return names of every output key.
 
         Insert empty set if key has no name.
         """
-        if self._names is None:
-            self._names = self.__get_names()
-        return tuple(self._names.values())
+        return self._index.names
 
     def to_dict(self) -> dict[ConstOutput, np.ndarray]:
         """Return underlaying native dictionary.
@@ -140,8 +255,10 @@ class OVDict(Mapping):
         Function performs shallow copy, thus any modifications to
         returned values may affect this class as well.
         """
-        return self._dict
+        self._materialize()
+        return dict(zip(self._index.ports, self._values))
 
     def to_tuple(self) -> tuple:
         """Convert values of this dictionary to a tuple."""
-        return tuple(self._dict.values())
+        self._materialize()
+        return tuple(self._values)
@@ -9,12 +9,15 @@ from functools import singledispatchmethod
 from openvino._pyopenvino import ConstOutput
 from openvino._pyopenvino import InferRequest as InferRequestBase
 from openvino._pyopenvino import Tensor
+from openvino._pyopenvino import Type
 import collections.abc
 import numpy
 import numpy as np
 import openvino._pyopenvino
 import typing
-__all__: list[str] = ['ConstOutput', 'InferRequestBase', 'ItemsView', 'Iterator', 'KeysView', 'Mapping', 'OVDict', 'Tensor', 'ValuesView', 'np', 'singledispatchmethod', 'tensor_from_file']
+import warnings as warnings
+import weakref as weakref
+__all__: list[str] = ['ConstOutput', 'InferRequestBase', 'ItemsView', 'Iterator', 'KeysView', 'Mapping', 'OVDict', 'Tensor', 'Type', 'ValuesView', 'np', 'singledispatchmethod', 'tensor_from_file', 'warnings', 'weakref']
 class OVDict(collections.abc.Mapping):
     """
     Custom OpenVINO dictionary with inference results.
@@ -29,6 +32,11 @@ class OVDict(collections.abc.Mapping):
         This class follows `frozenset`/`tuple` concept of immutability.
         It is prohibited to assign new items or edit them.
     
+        Results of `InferRequest.infer` are converted to numpy arrays lazily,
+        only outputs which are accessed are copied from output tensors.
+        Outputs which were not accessed are copied before the infer request
+        producing them runs the next inference.
+    
         To revert to the previous behavior use `to_dict` method which
         return shallow copy of underlaying dictionary.
         Note: It removes addressing feature! New dictionary keeps
@@ -59,17 +67,15 @@ class OVDict(collections.abc.Mapping):
     @staticmethod
     def _OVDict__getitem_impl(*args, **kwargs) -> numpy.ndarray:
         ...
+    @classmethod
+    def _from_tensors(cls, index: _OutputIndex, tensors: list[openvino._pyopenvino.Tensor], share_outputs: bool = False, decode_strings: bool = True) -> OVDict:
+        """
+        Create results converting output tensors to numpy arrays on first access.
+        """
     def _(self, key: str) -> numpy.ndarray:
         ...
-    def _OVDict__get_key(self, index: int) -> openvino._pyopenvino.ConstOutput:
+    def _OVDict__get_value(self, idx: int) -> numpy.ndarray:
         ...
-    def _OVDict__get_names(self) -> dict[openvino._pyopenvino.ConstOutput, set[str]]:
-        """
-        Return names of every output key.
-        
-                Insert empty set if key has no name.
-                
-        """
     def __getitem__(self, key: typing.Union[openvino._pyopenvino.ConstOutput, int, str]) -> numpy.ndarray:
         ...
     def __init__(self, _dict: dict[openvino._pyopenvino.ConstOutput, numpy.ndarray[typing.Any, numpy.dtype[typing.Any]]]) -> None:
@@ -80,6 +86,10 @@ class OVDict(collections.abc.Mapping):
         ...
     def __repr__(self) -> str:
         ...
+    def _materialize(self) -> None:
+        """
+        Convert all outputs and release output tensors.
+        """
     def items(self) -> collections.abc.ItemsView[openvino._pyopenvino.ConstOutput, numpy.ndarray[typing.Any, numpy.dtype[typing.Any]]]:
         ...
     def keys(self) -> collections.abc.KeysView[openvino._pyopenvino.ConstOutput]:
@@ -109,11 +119,44 @@ class _InferRequestWrapper(openvino._pyopenvino.InferRequest):
     """
     InferRequest class with internal memory.
     """
-    def __init__(self, other: openvino._pyopenvino.InferRequest) -> None:
+    def __init__(self, other: openvino._pyopenvino.InferRequest, output_index: typing.Optional[_OutputIndex] = None) -> None:
+        ...
+    def _detach_results(self) -> None:
+        """
+        Convert outputs not accessed yet in the last results before the output tensors are overwritten.
+        """
+    def _get_output_index(self) -> _OutputIndex:
         ...
+    def _infer_lazy(self, inputs: typing.Union[dict, openvino._pyopenvino.Tensor], share_outputs: bool, decode_strings: bool, stages: typing.Optional[dict] = None) -> OVDict:
+        """
+        Run inference and wrap output tensors, converting them to numpy arrays only on access.
+        
+                Timestamps of the native call and of wrapping are added to `stages` if it is provided.
+                
+        """
     def _is_single_input(self) -> bool:
         ...
+    def _start_async(self, inputs: typing.Union[dict, openvino._pyopenvino.Tensor], userdata: typing.Any) -> None:
+        ...
+    def _wrap_results(self, tensors: list[openvino._pyopenvino.Tensor], share_outputs: bool, decode_strings: bool) -> OVDict:
+        ...
+class _OutputIndex:
+    """
+    Index of outputs of a compiled model.
+    
+        Maps ports, names and indices of outputs to their positions. It is created once
+        per compiled model and shared by all results, output names are read on first use.
+        
+    """
+    def __init__(self, ports: list[openvino._pyopenvino.ConstOutput]) -> None:
+        ...
+    def name_position(self, name: str) -> int:
+        ...
+    @property
+    def names(self) -> tuple[set[str], ...]:
+        ...
 def tensor_from_file(path: str) -> openvino._pyopenvino.Tensor:
     """
     Create Tensor from file. Data will be read with dtype of unit8.
     """
+_NOT_CONVERTED: object  # value = <object object>
@@ -75,6 +75,10 @@ class MultiMethod(object):
     def __init__(self, name: str):
         self.name = name
         self.typemap: dict[tuple, Callable] = {}
+        # Annotations of overloads parameters, computed once at registration
+        self.signatures: dict[tuple, dict[str, Any]] = {}
+        # Overloads resolved for (types of positional arguments, names of keyword arguments)
+        self.dispatch_cache: dict[tuple, Callable] = {}
 
     # Checks if actual_type is a subclass of any type in the union
     def matches_union(self, union_type, actual_type) -> bool:  # type: ignore
@@ -108,43 +112,51 @@ class MultiMethod(object):
         return True
 
     def __call__(self, *args, **kwargs) -> Any:  # type: ignore
-        arg_types = tuple(arg.__class__ for arg in args)
-        kwarg_types = {key: type(value) for key, value in kwargs.items()}
+        dispatch_key = (tuple(arg.__class__ for arg in args), frozenset(kwargs))
+        function = self.dispatch_cache.get(dispatch_key)
+        if function is None:
+            function = self.resolve(*dispatch_key)
+            self.dispatch_cache[dispatch_key] = function
+        return function(*args, **kwargs)  # type: ignore
 
+    def resolve(self, arg_types: tuple, kwarg_names: frozenset) -> Callable:
+        """Find the overload matching types of positional arguments and names of keyword arguments."""
         key_matched = None
-        if len(kwarg_types) == 0 and len(arg_types) != 0:
+        if len(kwarg_names) == 0 and len(arg_types) != 0:
             for key in self.typemap.keys():
                 # compare types of called function with overloads
                 if self.check_invoked_types_in_overloaded_funcs(arg_types, key):
                     key_matched = key
                     break
-        elif len(arg_types) == 0 and len(kwarg_types) != 0:
-            for key, func in self.typemap.items():
-                func_signature = {arg_name: types.annotation for arg_name, types in signature(func).parameters.items()}
+        elif len(arg_types) == 0 and len(kwarg_names) != 0:
+            for key, func_signature in self.signatures.items():
                 # if kwargs of called function are subset of overloaded function, we use this overload
-                if kwarg_types.keys() <= func_signature.keys():
+                if kwarg_names <= func_signature.keys():
                     key_matched = key
                     break
-        elif len(arg_types) != 0 and len(kwarg_types) != 0:
-            for key, func in self.typemap.items():
-                func_signature = {arg_name: types.annotation for arg_name, types in signature(func).parameters.items()}
+        elif len(arg_types) != 0 and len(kwarg_names) != 0:
+            for key, func_signature in self.signatures.items():
                 # compare types of called function with overloads
                 if self.check_invoked_types_in_overloaded_funcs(arg_types, tuple(func_signature.values())):
                     # if kwargs of called function are subset of overloaded function, we use this overload
-                    if kwarg_types.keys() <= func_signature.keys():
+                    if kwarg_names <= func_signature.keys():
                         key_matched = key
                         break
 
         if key_matched is None:
             raise TypeError(f"The necessary overload for {self.name} was not found")
 
-        function = self.typemap.get(key_matched)
-        return function(*args, **kwargs)  # type: ignore
+        return self.typemap[key_matched]
 
     def register(self, types: tuple, function: Callable) -> None:
         if types in self.typemap:
             raise TypeError("duplicate registration")
         self.typemap[types] = function
+        self.signatures[types] = {
+            arg_name: param.annotation for arg_name, param in signature(function).parameters.items()
+        }
+        # New overload may change resolution of already dispatched calls
+        self.dispatch_cache.clear()
 
 
 registry: dict[str, MultiMethod] = {}
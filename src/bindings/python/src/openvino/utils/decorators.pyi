@@ -26,6 +26,10 @@ class MultiMethod:
         ...
     def register(self, types: tuple, function: collections.abc.Callable) -> None:
         ...
+    def resolve(self, arg_types: tuple, kwarg_names: frozenset) -> collections.abc.Callable:
+        """
+        Find the overload matching types of positional arguments and names of keyword arguments.
+        """
 def _get_name(**kwargs: typing.Any) -> openvino._pyopenvino.Node:
     ...
 def _set_node_friendly_name(node: openvino._pyopenvino.Node, *, name: typing.Optional[str] = None) -> openvino._pyopenvino.Node:
@@ -17,13 +17,15 @@ namespace py = pybind11;
 
 PYBIND11_MAKE_OPAQUE(ov::TensorVector);
 
+inline void run_infer(InferRequestWrapper& self) {
+    py::gil_scoped_release release;
+    *self.m_start_time = Time::now();
+    self.m_request.infer();
+    *self.m_end_time = Time::now();
+}
+
 inline py::object run_sync_infer(InferRequestWrapper& self, bool share_outputs, bool decode_strings) {
-    {
-        py::gil_scoped_release release;
-        *self.m_start_time = Time::now();
-        self.m_request.infer();
-        *self.m_end_time = Time::now();
-    }
+    run_infer(self);
     return Common::outputs_to_dict(self, share_outputs, decode_strings);
 }
 
@@ -310,6 +312,46 @@ void regclass_InferRequest(py::module m) {
             :rtype: dict[openvino.ConstOutput, numpy.array]
         )");
 
+    // Overloads returning output tensors instead of numpy arrays, conversion of the results
+    // is deferred to the Python side, so only accessed outputs are converted.
+    cls.def(
+        "_infer",
+        [](InferRequestWrapper& self, const ov::Tensor& inputs) {
+            self.m_request.set_input_tensor(inputs);
+            run_infer(self);
+            return py::list(py::cast(self.get_output_tensors()));
+        },
+        py::arg("inputs"),
+        R"(
+            Infers specified input(s) in synchronous mode.
+
+            GIL is released while running the inference.
+
+            :param inputs: Data to set on single input tensor.
+            :type inputs: openvino.Tensor
+            :return: Output tensors in order of the model outputs.
+            :rtype: list[openvino.Tensor]
+        )");
+
+    cls.def(
+        "_infer",
+        [](InferRequestWrapper& self, const py::dict& inputs) {
+            Common::set_request_tensors(self.m_request, inputs);
+            run_infer(self);
+            return py::list(py::cast(self.get_output_tensors()));
+        },
+        py::arg("inputs"),
+        R"(
+            Infers specified input(s) in synchronous mode.
+
+            GIL is released while running the inference.
+
+            :param inputs: Data to set on input tensors.
+            :type inputs: dict[Union[int, str, openvino.ConstOutput], openvino.Tensor]
+            :return: Output tensors in order of the model outputs.
+            :rtype: list[openvino.Tensor]
+        )");
+
     // Overload for single input, it will throw error if a model has more than one input.
     cls.def(
         "start_async",
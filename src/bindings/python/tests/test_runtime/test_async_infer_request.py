@@ -9,6 +9,7 @@ import pytest
 import time
 import sysconfig
 
+import openvino._ov_api
 import openvino.opset13 as ops
 from openvino import (
     Core,
@@ -382,3 +383,104 @@ def test_array_like_input_async(device, share_inputs):
     request.start_async(model_input_list)
     request.wait()
     assert np.array_equal(request.get_output_tensor().data, np.abs(input_data))
+
+
+@pytest.mark.parametrize("share_inputs", [True, False])
+@pytest.mark.parametrize("ordered", [True, False])
+def test_infer_queue_map(device, share_inputs, ordered):
+    core = Core()
+    param = ops.parameter([10], np.float32)
+    model = Model(ops.relu(param), [param])
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 3)
+    data = [np.random.normal(size=[10]).astype(np.float32) for _ in range(20)]
+
+    results = list(infer_queue.map(iter(data), share_inputs=share_inputs, ordered=ordered, max_pending=4))
+    if not ordered:
+        assert sorted(index for index, _ in results) == list(range(len(data)))
+        results = [result for _, result in sorted(results, key=lambda item: item[0])]
+    assert len(results) == len(data)
+    for array, result in zip(data, results):
+        assert np.array_equal(result[0], np.maximum(array, 0))
+
+
+def test_infer_queue_submit_many(device):
+    core = Core()
+    param = ops.parameter([10], np.float32)
+    model = Model(ops.relu(param), [param])
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 2)
+    data = [np.full([10], i, dtype=np.float32) for i in range(10)]
+    outputs = {}
+
+    def callback(request, userdata):
+        outputs[userdata] = request.get_output_tensor().data.copy()
+
+    infer_queue.set_callback(callback)
+    consumed = []
+
+    def generator():
+        for i, array in enumerate(data):
+            consumed.append(i)
+            yield array
+
+    assert infer_queue.submit_many(generator(), userdata=range(len(data))) == len(data)
+    infer_queue.wait_all()
+    assert consumed == list(range(len(data)))
+    assert sorted(outputs.keys()) == list(range(len(data)))
+    for i, array in enumerate(data):
+        assert np.array_equal(outputs[i], array)
+
+    # InferRequest wrappers are reused by the queue
+    assert infer_queue[0] is infer_queue[0]
+
+
+def test_infer_queue_stage_hook(device, monkeypatch):
+    core = Core()
+    param = ops.parameter([10], np.float32)
+    model = Model(ops.relu(param), [param])
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 2)
+    data = [np.full([10], i - 5, dtype=np.float32) for i in range(10)]
+    outputs = {}
+
+    def callback(request, userdata):
+        outputs[userdata] = request.get_output_tensor().data.copy()
+
+    infer_queue.set_callback(callback)
+    stages = []
+    infer_queue._stage_hook = stages.append
+
+    # Input dispatch stage times the dispatching of the real call
+    dispatch = openvino._ov_api._data_dispatch
+
+    def slow_dispatch(*args, **kwargs):
+        time.sleep(0.01)
+        return dispatch(*args, **kwargs)
+
+    monkeypatch.setattr(openvino._ov_api, "_data_dispatch", slow_dispatch)
+    for i, array in enumerate(data):
+        start = time.perf_counter()
+        infer_queue.start_async(array, i)
+        end = time.perf_counter()
+        timestamps = stages[-1]
+        assert list(timestamps) == ["idle request wait", "request wrapper lookup", "input dispatch",
+                                    "native start_async call"]
+        # Stages follow each other and cover the call
+        bounds = list(timestamps.values())
+        assert start <= bounds[0][0]
+        assert all(previous[1] == current[0] for previous, current in zip(bounds, bounds[1:]))
+        assert bounds[-1][1] <= end
+        assert timestamps["input dispatch"][1] - timestamps["input dispatch"][0] >= 0.01
+    infer_queue.wait_all()
+
+    assert len(stages) == len(data)
+    # Userdata is passed to the callback as is
+    assert sorted(outputs.keys()) == list(range(len(data)))
+    for i, array in enumerate(data):
+        assert np.array_equal(outputs[i], np.maximum(array, 0))
+
+    infer_queue._stage_hook = None
+    infer_queue.start_async(data[0], 0)
+    infer_queue.wait_all()
+    assert len(stages) == len(data)
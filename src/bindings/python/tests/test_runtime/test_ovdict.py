@@ -256,3 +256,37 @@ def test_ovdict_multi_output_tuple0(device, is_direct, use_function):
 
     assert np.equal(result[outs[0]], out0).all()
     assert np.equal(result[outs[1]], out1).all()
+
+
+def test_ovdict_lazy_outputs_survive_next_inference(device):
+    output_names = ["output_0", "output_1"]
+    result, request = _get_ovdict(
+        device,
+        input_shape=(1, 10),
+        multi_output=True,
+        split_num=2,
+        output_names=output_names,
+    )
+    # Outputs are converted only on access
+    assert result._tensors is not None
+    first = result["output_0"]
+    assert result[0] is first
+
+    expected = [request.get_output_tensor(idx).data.copy() for idx in range(2)]
+    request.infer(np.zeros((1, 10), dtype=np.float32))
+    # Results of the previous inference are not overwritten by the next one
+    assert result._tensors is None
+    assert np.array_equal(result[0], expected[0])
+    assert np.array_equal(result["output_1"], expected[1])
+
+
+def test_ovdict_output_index_is_shared(device):
+    result, request = _get_ovdict(device)
+    compiled_model = request.get_compiled_model()
+    first = compiled_model.create_infer_request()
+    second = compiled_model.create_infer_request()
+    assert first._get_output_index() is second._get_output_index()
+
+    input_data = np.ones((1, 20), dtype=np.float32)
+    assert first.infer(input_data)._index is second.infer(input_data)._index
+    assert result.names() == first.infer(input_data).names()
@@ -8,6 +8,8 @@ import numpy as np
 import os
 import pytest
 import datetime
+import time
+import openvino._ov_api
 import openvino.properties as props
 
 import openvino.opset13 as ops
@@ -839,3 +841,39 @@ def test_infer_request_tensors_prop(device):
     assert isinstance(outputs, list)
     assert str(inputs) == "[<Tensor: shape[2,2] type: f32>, <Tensor: shape[2,2] type: f32>]"
     assert str(outputs) == "[<Tensor: shape[2,2] type: f32>]"  # Check representation
+
+
+def test_infer_stage_hook(device, monkeypatch):
+    request, arr_1, arr_2 = create_simple_request_and_inputs(device)
+    expected = request.infer([arr_1, arr_2])[0].copy()
+    stages = []
+    request._stage_hook = stages.append
+
+    # Input dispatch stage times the dispatching of the real call
+    dispatch = openvino._ov_api._data_dispatch
+
+    def slow_dispatch(*args, **kwargs):
+        time.sleep(0.01)
+        return dispatch(*args, **kwargs)
+
+    monkeypatch.setattr(openvino._ov_api, "_data_dispatch", slow_dispatch)
+    start = time.perf_counter()
+    result = request.infer([arr_1, arr_2])
+    end = time.perf_counter()
+
+    assert np.array_equal(result[0], expected)
+    assert len(stages) == 1
+    timestamps = stages[0]
+    assert list(timestamps) == ["input dispatch", "native infer call", "results wrapping"]
+    # Stages follow each other and cover the call
+    bounds = list(timestamps.values())
+    assert start <= bounds[0][0]
+    assert all(previous[1] == current[0] for previous, current in zip(bounds, bounds[1:]))
+    assert bounds[-1][1] <= end
+    assert timestamps["input dispatch"][1] - timestamps["input dispatch"][0] >= 0.01
+    native_call = timestamps["native infer call"]
+    assert (native_call[1] - native_call[0]) * 1000 >= request.latency
+
+    request._stage_hook = None
+    request.infer([arr_1, arr_2])
+    assert len(stages) == 1
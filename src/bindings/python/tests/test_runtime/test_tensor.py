@@ -768,3 +768,44 @@ def test_pack_unpack_u6_multidimensional():
     packed = pack_data(data, ov.Type.u6)
     unpacked = unpack_data(packed, ov.Type.u6, data.shape)
     assert np.array_equal(unpacked, data)
+
+
+@pytest.mark.parametrize(
+    ("low", "high", "ov_type", "dtype"),
+    [
+        (0, 2, ov.Type.u1, np.uint8),
+        (0, 4, ov.Type.u2, np.uint8),
+        (0, 8, ov.Type.u3, np.uint8),
+        (0, 16, ov.Type.u4, np.uint8),
+        (0, 64, ov.Type.u6, np.uint8),
+        (-8, 8, ov.Type.i4, np.int8),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_packing_chunked_into_output_buffer(low, high, ov_type, dtype, chunk_size):
+    shape = [3, 29]
+    data = np.random.randint(low, high, shape).astype(dtype)
+    expected = pack_data(data, ov_type)
+
+    packed = np.full(expected.shape, 0xAA, dtype=np.uint8)
+    assert pack_data(data, ov_type, out=packed, chunk_size=chunk_size) is packed
+    assert np.array_equal(packed, expected)
+
+    unpacked = np.zeros(shape, dtype=dtype)
+    assert unpack_data(packed, ov_type, shape, out=unpacked, chunk_size=chunk_size) is unpacked
+    assert np.array_equal(unpacked, data)
+
+
+def test_unpacking_i4_sign_extension():
+    packed = np.array([0x7F, 0x80, 0x0F], dtype=np.uint8)
+    unpacked = unpack_data(packed, ov.Type.i4, [6])
+    assert unpacked.dtype == np.int8
+    assert unpacked.tolist() == [7, -1, -8, 0, 0, -1]
+
+
+def test_packing_invalid_output_buffer():
+    data = np.arange(8, dtype=np.uint8)
+    with pytest.raises(RuntimeError, match="dtype"):
+        unpack_data(pack_data(data, ov.Type.u4), ov.Type.u4, [8], out=np.empty([8], dtype=np.int8))
+    with pytest.raises(RuntimeError, match="elements"):
+        pack_data(data, ov.Type.u4, out=np.empty([3], dtype=np.uint8))
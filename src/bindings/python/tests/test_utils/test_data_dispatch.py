@@ -435,3 +435,59 @@ def test_string_scalar_dispatcher(device, input_data, data_type, is_shared):
         assert np.array_equal(result.str_data, np.char.decode(test_data))
     assert not np.shares_memory(result.bytes_data, test_data)
     assert not np.shares_memory(result.str_data, test_data)
+
+
+@pytest.mark.parametrize("input_container", [list, tuple, dict])
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_binding_plan_multi_input(device, input_container, is_shared):
+    input_shape = [2, 2]
+    compiled_model = generate_add_compiled_model(device, input_shape)
+    request = compiled_model.create_infer_request()
+    reference_request = compiled_model.create_infer_request()
+
+    def make_inputs(value):
+        arrays = [np.full(input_shape, value, dtype=np.float32), np.full(input_shape, 2 * value, dtype=np.float32)]
+        return dict(enumerate(arrays)) if input_container is dict else input_container(arrays)
+
+    plan = request.create_binding_plan(make_inputs(0), share_inputs=is_shared)
+    for value in range(3):
+        inputs = make_inputs(value)
+        result = plan.infer(inputs)
+        expected = reference_request.infer(inputs, share_inputs=is_shared)
+        assert np.array_equal(result[0], expected[0])
+        assert np.array_equal(result[0], np.full(input_shape, 3 * value))
+
+
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_binding_plan_single_input(device, is_shared):
+    input_shape = [1, 4]
+    compiled_model = generate_relu_compiled_model(device, input_shape)
+    request = compiled_model.create_infer_request()
+
+    plan = request.create_binding_plan(np.zeros(input_shape, dtype=np.float32), share_inputs=is_shared)
+    array = np.array([[-1, 2, -3, 4]], dtype=np.float32)
+    assert np.array_equal(plan.infer(array)[0], np.maximum(array, 0))
+    # values of other types and structures are dispatched the generic way
+    for value in [array.astype(np.float64), Tensor(array), {0: array}, array.tolist()]:
+        assert np.array_equal(plan.infer(value)[0], np.maximum(array, 0))
+
+    plan.start_async(-array)
+    request.wait()
+    assert np.array_equal(request.get_output_tensor().data, np.maximum(-array, 0))
+
+
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_binding_plan_mismatched_values(device, is_shared):
+    input_shape = [2, 2]
+    compiled_model = generate_add_compiled_model(device, input_shape)
+    request = compiled_model.create_infer_request()
+    plan = request.create_binding_plan(
+        {0: np.zeros(input_shape, dtype=np.float32), 1: np.zeros(input_shape, dtype=np.float32)},
+        share_inputs=is_shared,
+    )
+
+    first = np.ones(input_shape, dtype=np.float64)
+    second = np.asfortranarray(np.arange(4, dtype=np.float32).reshape(input_shape))
+    second.flags.writeable = False
+    assert np.array_equal(plan.infer({0: first, 1: second})[0], first + second)
+    assert np.array_equal(plan.infer({1: second, 0: first})[0], first + second)
@@ -194,3 +194,32 @@ def test_infer_postponned_constant():
 
     expected_output = np.array([4, 5, 6, 7], dtype=np.float32).reshape(1, 2, 1, 2)
     assert np.allclose(results[list(results)[0]], expected_output, 1e-4, 1e-4)
+
+
+def test_multimethod_dispatch_is_memoized():
+    from typing import Optional, Union
+    from openvino.utils.decorators import MultiMethod
+
+    def from_int(value: int, name: Optional[str] = None):
+        return "int", value, name
+
+    def from_float(value: Union[float, list], name: str = "default", scale: int = 1):
+        return "float", value, name, scale
+
+    method = MultiMethod("test_multimethod")
+    method.register((int, Optional[str]), from_int)
+    method.register((Union[float, list], str), from_float)
+
+    assert method(1) == ("int", 1, None)
+    assert method(1.5, name="x") == ("float", 1.5, "x", 1)
+    assert method([1], "y") == ("float", [1], "y", 1)
+    assert method(value=2) == ("int", 2, None)
+    assert method(2.5, scale=3) == ("float", 2.5, "default", 3)
+    assert len(method.dispatch_cache) == 5
+
+    # resolved overloads are reused for the same argument types and keyword names
+    assert method(7) == ("int", 7, None)
+    assert len(method.dispatch_cache) == 5
+
+    with pytest.raises(TypeError, match="necessary overload"):
+        method("text")
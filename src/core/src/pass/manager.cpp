@@ -151,6 +151,7 @@ public:
      *
      *      Usage: Set this environment variable to "true" to enable visualizations.
      *      Alternatively, specify a file path where the execution times will be saved.
+     *      When a file path is specified, nothing is printed to the standard output.
      *
      *      Example:
      *      export OV_ENABLE_PROFILE_PASS=true
@@ -203,7 +204,7 @@ public:
             stopwatches[name].start();
 
             bool is_pass_manager = name == m_manager_name;
-            if (is_pass_manager) {
+            if (is_pass_manager && m_profile_pass.is_bool()) {
                 std::cout << std::setw(25) << std::left;
                 std::cout << "PassManager started: " << m_manager_name << std::endl;
                 std::cout << std::right;
@@ -1084,3 +1084,94 @@ def test_inlined_inputs():
     model.eval()
     model = orig_compile(model, backend="openvino", options={"testing": 1})
     model()
+
+
+def pack_int4(values, dim):
+    # Packs 8 int4 values along dim to int32 in AutoGPTQ layout, the first value in the lowest bits
+    values = values.to(torch.int64).movedim(dim, -1)
+    values = values.reshape(*values.shape[:-1], -1, 8)
+    packed = sum(values[..., i] << (4 * i) for i in range(8))
+    # Overflow to negative values as in int32 storage
+    packed = torch.where(packed >= 2**31, packed - 2**32, packed).to(torch.int32)
+    return packed.movedim(-1, dim)
+
+
+def unpack_int4(packed, dim):
+    packed = packed.to(torch.int64).movedim(dim, -1)
+    values = torch.stack([(packed >> (4 * i)) & 15 for i in range(8)], dim=-1)
+    return values.reshape(*packed.shape[:-1], -1).movedim(-1, dim)
+
+
+class FakeGPTQLinear(torch.nn.Module):
+    QUANT_TYPE = "exllama"
+
+    def __init__(self, in_features=64, out_features=32, group_size=32):
+        super().__init__()
+        rng = torch.Generator().manual_seed(42)
+        self.bits = 4
+        self.group_size = group_size
+        groups = in_features // group_size
+        weights = torch.randint(0, 16, (in_features, out_features), generator=rng)
+        # Stored zero points are decremented by one, 15 can't be incremented in 4 bits
+        zeros = torch.randint(0, 15, (groups, out_features), generator=rng)
+        self.register_buffer("qweight", pack_int4(weights, 0))
+        self.register_buffer("qzeros", pack_int4(zeros, 1))
+        self.register_buffer("scales", (torch.rand(groups, out_features, generator=rng) / 10).half())
+        self.bias = None
+
+    def forward(self, x):
+        weights = unpack_int4(self.qweight, 0)
+        zeros = unpack_int4(self.qzeros, 1) + 1
+        scales = self.scales.float()
+        weights = ((weights - zeros.repeat_interleave(self.group_size, 0))
+                   * scales.repeat_interleave(self.group_size, 0))
+        return x.to(torch.float32) @ weights
+
+
+def test_gptq_patching_does_not_copy_quantized_weights():
+    from openvino.frontend.pytorch import gptq
+
+    model = torch.nn.Sequential(FakeGPTQLinear(), torch.nn.Linear(32, 8).half())
+    orig_qzeros = model[0].qzeros.clone()
+    qweight_ptr = model[0].qweight.data_ptr()
+
+    gptq.patch_model(model)
+    assert model[0]._openvino_u4_compression_submodule_qweights.weight.data_ptr() == qweight_ptr
+    assert model[0].scales.dtype == torch.float32
+    assert model[1].weight.dtype == torch.float32
+
+    gptq.unpatch_model(model)
+    assert model[0].qzeros.dtype == torch.int32
+    assert torch.equal(model[0].qzeros, orig_qzeros)
+
+
+def test_gptq_conversion_accuracy():
+    from openvino import convert_model, compile_model
+    from types import SimpleNamespace
+
+    class GPTQModel(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.config = SimpleNamespace(
+                quantization_config=SimpleNamespace(quant_method="gptq", sym=False))
+            self.linear = FakeGPTQLinear()
+
+        def forward(self, x):
+            return self.linear(x)
+
+    model = GPTQModel()
+    x = torch.randn(2, 64)
+    orig_qzeros = model.linear.qzeros.clone()
+    with torch.no_grad():
+        res_ref = model(x)
+
+    with torch.no_grad():
+        converted_model = convert_model(model, example_input=(x,))
+    # Model is unpatched before the traced graph is converted, so converted
+    # zero points must not depend on the state of the original model
+    assert torch.equal(model.linear.qzeros, orig_qzeros)
+    cm = compile_model(converted_model, "CPU", default_cfg)
+    res = cm([x.numpy()])
+    np.testing.assert_allclose(res[0], res_ref.numpy(), rtol=1e-3, atol=1e-3)
+    with torch.no_grad():
+        np.testing.assert_allclose(model(x).numpy(), res_ref.numpy())
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch
+
+from openvino.frontend.pytorch.torchdynamo.cache import CompiledModelCache
+from openvino.frontend.pytorch.torchdynamo.request_pool import InferRequestPool
+
+
+def test_compiled_model_cache_lru_by_entries():
+    cache = CompiledModelCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.keys() == ["a", "c"]
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.entries) == (1, 0, 1, 2)
+    assert cache.get("b") is None
+    assert cache.info().misses == 1
+
+
+def test_compiled_model_cache_byte_budget():
+    cache = CompiledModelCache(max_entries=None, max_bytes=100)
+    cache.put("a", 1, nbytes=60)
+    cache.put("b", 2, nbytes=30)
+    cache.put("c", 3, nbytes=30)
+
+    assert cache.keys() == ["b", "c"]
+    assert cache.info().bytes == 60
+
+    # an entry larger than the whole budget is still kept alone
+    cache.put("d", 4, nbytes=200)
+    assert cache.keys() == ["d"]
+
+    cache.resize(max_entries=0)
+    assert len(cache) == 0
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, 0, 0, None)
+
+
+class aten_add_relu(torch.nn.Module):
+    def forward(self, x, y):
+        return torch.relu(x + y)
+
+
+def openvino_compile(model, **kwargs):
+    # test_torch_frontend.py replaces torch.compile with identity for the whole session
+    torch_compile = getattr(sys.modules.get("test_torch_frontend"), "orig_compile", torch.compile)
+    return torch_compile(model, backend="openvino", **kwargs)
+
+
+def test_torch_compile_recompiles_on_new_shape():
+    import openvino.torch  # noqa: F401
+    from openvino.frontend.pytorch.torchdynamo.execute import clear_caches
+
+    torch._dynamo.reset()
+    clear_caches()
+    model = openvino_compile(aten_add_relu(), dynamic=True)
+    expected = [(1, 1, 0), (2, 2, 0), (2, 2, 1)]
+    for batch, (entries, misses, hits) in zip([1, 4, 1], expected):
+        x = torch.randn(batch, 8)
+        y = torch.randn(batch, 8)
+        np.testing.assert_allclose(model(x, y).numpy(), torch.relu(x + y).numpy(), atol=1e-6)
+        info = openvino.torch.compiled_cache_info()
+        assert (info.entries, info.misses, info.hits) == (entries, misses, hits)
+
+
+def test_inputs_signature_ignores_dynamic_dimensions():
+    from openvino.frontend.pytorch.torchdynamo.execute import _inputs_signature
+
+    dynamic = [torch.Size([-1, 8]), None]
+    assert _inputs_signature([torch.zeros(2, 8), 3], dynamic) == _inputs_signature([torch.zeros(5, 8), 4], dynamic)
+    assert _inputs_signature([torch.zeros(2, 8)], [torch.Size([2, 8])]) != _inputs_signature([torch.zeros(5, 8)])
+
+
+def test_flatten_inputs_keeps_flat_arguments():
+    from openvino.frontend.pytorch.torchdynamo.execute import _flatten_inputs
+
+    args = (torch.zeros(2), 3)
+    assert _flatten_inputs(args) is args
+    assert len(_flatten_inputs(([torch.zeros(2), torch.zeros(3)], 3))) == 3
+
+
+class aten_partially_supported(torch.nn.Module):
+    def forward(self, x, y):
+        z = torch.relu(x * y + x)
+        return z * 2 + z
+
+
+def test_torch_compile_reads_stored_partitions(tmp_path):
+    import openvino.torch  # noqa: F401
+    from openvino.frontend.pytorch.torchdynamo.execute import clear_caches
+
+    # relu is executed by torch, so the graph is split into two OpenVINO partitions
+    options = {"model_caching": True, "cache_dir": str(tmp_path), "disabled_ops": ["torch.ops.aten.relu.default"]}
+    x = torch.randn(2, 8)
+    y = torch.randn(2, 8)
+    stored = []
+    for _ in range(2):
+        torch._dynamo.reset()
+        clear_caches()
+        model = openvino_compile(aten_partially_supported(), options=options)
+        z = torch.relu(x * y + x)
+        np.testing.assert_allclose(model(x, y).numpy(), (z * 2 + z).numpy(), atol=1e-6)
+        # partitions which failed to compile fall back to torch and are not cached
+        info = openvino.torch.compiled_cache_info()
+        assert (info.entries, info.misses) == (2, 2)
+        stored.append(sorted(path.name for path in (tmp_path / "model").iterdir()))
+
+    assert len(stored[0]) == 4
+    assert stored[0] == stored[1]
+
+
+class FakeCompiledModel:
+    def __init__(self):
+        self.created = 0
+
+    def create_infer_request(self):
+        self.created += 1
+        return object()
+
+
+def test_infer_request_pool_reuses_requests():
+    compiled = FakeCompiledModel()
+    pool = InferRequestPool(compiled, size=2)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first is not second
+    pool.release(first)
+    with pool.request() as req:
+        assert req is first
+    assert compiled.created == 2
+    assert len(pool) == 2
+
+
+def test_torch_compile_concurrent_calls():
+    import openvino.torch  # noqa: F401
+
+    model = openvino_compile(aten_add_relu())
+    inputs = [(torch.randn(2, 8), torch.randn(2, 8)) for _ in range(32)]
+    model(*inputs[0])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda xy: model(*xy), inputs))
+    for (x, y), res in zip(inputs, results):
+        np.testing.assert_allclose(res.numpy(), torch.relu(x + y).numpy(), atol=1e-6)
+
+
+def test_compile_partition_sync_compiles_once_per_key(monkeypatch):
+    import threading
+    import time
+    import openvino.frontend.pytorch.torchdynamo.execute as ov_execute
+
+    ov_execute.clear_caches()
+    lock = threading.Lock()
+    compiled = []
+    running = set()
+    concurrency = []
+
+    def fake_compile(cache_key, gm, args, model_hash_str, options):
+        with lock:
+            compiled.append(cache_key)
+            running.add(cache_key)
+            concurrency.append(len(running))
+        time.sleep(0.2)
+        with lock:
+            running.discard(cache_key)
+        ov_execute.compiled_cache.put(cache_key, cache_key)
+        return cache_key
+
+    monkeypatch.setattr(ov_execute, "_compile_partition", fake_compile)
+    keys = ["a", "b"] * 4
+    with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        results = list(executor.map(lambda key: ov_execute._compile_partition_sync(key, None, (), None, None), keys))
+
+    assert results == keys
+    assert sorted(compiled) == ["a", "b"]
+    # different partitions are not serialized by the global lock
+    assert max(concurrency) == 2
+    assert not ov_execute.pending_compiles
+    ov_execute.clear_caches()
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.int64, torch.bfloat16])
+def test_torch_to_ov_tensor_shares_memory(dtype):
+    from openvino.frontend.pytorch.torchdynamo.execute import torch_to_ov_tensor
+
+    tensor = torch.zeros(2, 3, dtype=dtype)
+    ov_tensor = torch_to_ov_tensor(tensor)
+    assert list(ov_tensor.shape) == [2, 3]
+    tensor[0, 0] = 1
+    assert ov_tensor.data.reshape(-1)[0] != 0
+
+
+def test_torch_to_ov_tensor_copies_non_contiguous():
+    from openvino.frontend.pytorch.torchdynamo.execute import torch_to_ov_tensor
+
+    tensor = torch.arange(6, dtype=torch.float32).reshape(2, 3).t()
+    ov_tensor = torch_to_ov_tensor(tensor)
+    np.testing.assert_array_equal(ov_tensor.data, tensor.numpy())
+    assert torch_to_ov_tensor(5).data.tolist() == [5]
+
+
+def test_torch_compile_async_compile():
+    import time
+    import openvino.torch  # noqa: F401
+    from openvino.frontend.pytorch.torchdynamo.execute import clear_caches, pending_compiles
+
+    clear_caches()
+    model = openvino_compile(aten_add_relu(), options={"async_compile": True})
+    x = torch.randn(2, 8)
+    y = torch.randn(2, 8)
+    # first calls run eagerly while the partition is compiled in background
+    np.testing.assert_allclose(model(x, y).numpy(), torch.relu(x + y).numpy(), atol=1e-6)
+    for _ in range(100):
+        if not pending_compiles:
+            break
+        time.sleep(0.1)
+    assert not pending_compiles
+    np.testing.assert_allclose(model(x, y).numpy(), torch.relu(x + y).numpy(), atol=1e-6)
+    assert openvino.torch.compiled_cache_info().hits >= 1
+
+
+def test_graph_hash_depends_on_weights():
+    from openvino.frontend.pytorch.torchdynamo.compile import graph_hash
+
+    first = torch.fx.symbolic_trace(torch.nn.Linear(4, 4))
+    second = torch.fx.symbolic_trace(torch.nn.Linear(4, 4))
+    assert graph_hash(first) == graph_hash(first)
+    assert graph_hash(first) != graph_hash(second)
@@ -77,8 +77,8 @@ def run_gptq_torchfx(tmp_path, model_id, model_link, prompt_result_pair):
     u4_ops = ["FullyConnected",]
     num_u4_ops = 0
     num_u4_ops_supported = 0
-    for pid in compiled_cache:
-        for op in compiled_cache[pid].get_runtime_model().get_ordered_ops():
+    for partition in compiled_cache.values():
+        for op in partition.requests.compiled_model.get_runtime_model().get_ordered_ops():
             if (str(op.get_rt_info()["layerType"].get()) in u4_ops):
                 u4_exec = (str(op.get_rt_info()["runtimePrecision"].get()) == "u4")
                 if u4_exec:
@@ -102,6 +102,199 @@ def test_max_irate(sample_language, device, max_irate, cache, tmp_path):
 
 
 @pytest.mark.skipif('CPU' not in get_devices(), reason='affinity is a CPU property')
+@pytest.mark.parametrize('arrival', ['constant', 'poisson', 'trace'])
+def test_arrival_process(arrival, cache, tmp_path):
+    arrival_options = ['-arrival', arrival]
+    if arrival == 'trace':
+        trace = tmp_path / 'trace.txt'
+        trace.write_text('\n'.join(str(i * 0.01) for i in range(20)))
+        arrival_options += ['-arrival_trace', trace]
+    else:
+        arrival_options += ['-arrival_rate', '100']
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+        *arrival_options,
+        '-niter', '20',
+        '-d', 'CPU'
+    )
+    assert 'FPS' in output
+    assert 'Queueing delay' in output
+
+
+@pytest.mark.parametrize('sweep_mode', ['grid', 'guided'])
+def test_sweep(sweep_mode, cache, tmp_path):
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+        '-sweep', 'hint=none;nstreams=1,2;nireq=1,2',
+        '-sweep_mode', sweep_mode,
+        '-sweep_report', tmp_path / 'sweep.json',
+        '-niter', '10',
+        '-d', 'CPU'
+    )
+    assert 'Best configuration' in output
+    with (tmp_path / 'sweep.json').open(encoding='utf-8') as file:
+        sweep_json = json.load(file)
+    assert sweep_json['pareto front']
+    assert len(sweep_json['configurations']) == 4 or sweep_mode == 'guided'
+
+
+def test_input_cache_dir(cache, tmp_path):
+    input_cache_dir = tmp_path / 'input_cache'
+    for _ in range(2):
+        output = get_cmd_output(
+            get_executable('Python'),
+            *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+            '-input_cache_dir', input_cache_dir,
+            '-niter', '10',
+            '-d', 'CPU'
+        )
+        assert 'FPS' in output
+    # Image is decoded on the first run only
+    assert 'Prepare image' not in output
+    assert len(list(input_cache_dir.glob('*.npy'))) == 1
+
+
+def test_multi_model(cache, tmp_path):
+    model = prepend(cache, model='bvlcalexnet-12.onnx')[-1]
+    multi_model_config = tmp_path / 'models.json'
+    multi_model_config.write_text(json.dumps([
+        {'m': str(model), 'hint': 'latency', 'nireq': 1},
+        {'m': str(model), 'hint': 'throughput', 'nireq': 2},
+    ]))
+    output = get_cmd_output(
+        get_executable('Python'),
+        '-multi_model', multi_model_config,
+        '-niter', '10',
+        '-report_type', 'no_counters',
+        '-report_folder', tmp_path,
+        '-json_stats',
+        '-d', 'CPU'
+    )
+    assert 'All models' in output
+    with (tmp_path / 'benchmark_report.json').open(encoding='utf-8') as file:
+        execution_results = json.load(file)['execution_results']
+    assert '0:bvlcalexnet-12.onnx throughput' in execution_results
+    assert '1:bvlcalexnet-12.onnx throughput' in execution_results
+    assert 'throughput' in execution_results
+
+
+@pytest.mark.parametrize('data_shape_order', ['replay', 'sample'])
+def test_data_shape_file(data_shape_order, cache, tmp_path):
+    data_shape_file = tmp_path / 'shapes.txt'
+    data_shape_file.write_text('# batch histogram\n[1,224,224,3] 3\n[2,224,224,3]\n')
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, model='efficientnet-lite4-11-qdq.onnx'),
+        '-shape', '[?,224,224,3]',
+        '-layout', '[NHWC]',
+        '-data_shape_file', data_shape_file,
+        '-data_shape_order', data_shape_order,
+        '-niter', '10',
+        '-pcseq',
+        '-d', 'CPU'
+    )
+    assert 'shapes.txt in ' + data_shape_order + ' order' in output
+    assert 'Throughput' in output
+
+
+def test_startup_runs(cache, tmp_path):
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, model='bvlcalexnet-12.onnx'),
+        '-startup_runs', '2',
+        '-startup_report', tmp_path / 'startup.json',
+        '-d', 'CPU'
+    )
+    assert 'cache hit, warm page cache' in output
+    with (tmp_path / 'startup.json').open(encoding='utf-8') as file:
+        startup_json = json.load(file)
+    assert len(startup_json['scenarios']) == 5
+    assert startup_json['cache size (bytes)'] > 0
+    assert all(scenario['runs'] == 2 for scenario in startup_json['scenarios'])
+
+
+def test_generation(cache, tmp_path):
+    input_ids = opset.parameter([1, -1], ov.Type.i64, name='input_ids')
+    input_ids.output(0).set_names({'input_ids'})
+    init_value = opset.constant(np.zeros((1, 0), np.float32))
+    past = opset.read_value(init_value, 'past', ov.Type.f32, ov.PartialShape([1, -1]))
+    present = opset.concat([past, opset.convert(input_ids, ov.Type.f32)], axis=1)
+    assign = opset.assign(present, 'past')
+    result = opset.result(opset.reduce_sum(present, [1], keep_dims=True), name='logits')
+    model = ov.Model([result], [assign], [input_ids], 'stateful_model')
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, model=model, tmp_path=tmp_path),
+        '-gen_tokens', '8',
+        '-prompt_len', '16',
+        '-nireq', '2',
+        '-niter', '4',
+        '-d', 'CPU'
+    )
+    assert 'Time to first token' in output
+    assert 'Inter-token latency' in output
+    assert 'tokens/s' in output
+
+
+def test_perf_counters_diff(cache, tmp_path):
+    for name in ('base', 'new'):
+        get_cmd_output(
+            get_executable('Python'),
+            *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+            '-pc_dump', tmp_path / f'{name}.npz',
+            '-nireq', '4',
+            '-niter', '8',
+            '-d', 'CPU'
+        )
+    output = get_cmd_output(
+        get_executable('Python'),
+        '-pc_diff', tmp_path / 'base.npz', tmp_path / 'new.npz',
+        '-report_folder', tmp_path
+    )
+    assert 'Total real time' in output
+    with (tmp_path / 'benchmark_perf_counters_diff.json').open(encoding='utf-8') as file:
+        diff_json = json.load(file)
+    assert diff_json['base samples'] == 4
+    assert diff_json['layers']
+
+
+def test_perf_counters_dump_with_average_report(cache, tmp_path):
+    get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+        '-pc_dump', tmp_path / 'counters.npz',
+        '-report_type', 'average_counters',
+        '-report_folder', tmp_path,
+        '-nireq', '4',
+        '-niter', '8',
+        '-d', 'CPU'
+    )
+    with np.load(tmp_path / 'counters.npz') as counters:
+        real_time = counters['real_time']
+    assert real_time.shape[0] == 4
+    # Dumped samples are counters of every request, so their mean matches the averaged report
+    with (tmp_path / 'benchmark_average_counters_report.csv').open(encoding='utf-8') as file:
+        total = next(line for line in file if line.startswith('Total'))
+    report_total = float(total.strip().split(';')[4])
+    np.testing.assert_allclose(real_time.sum(axis=1).mean(), report_total, rtol=1e-3, atol=1e-2)
+
+
+@pytest.mark.parametrize('api', ['sync', 'async'])
+def test_python_overhead(api, cache, tmp_path):
+    output = get_cmd_output(
+        get_executable('Python'),
+        *prepend(cache, 'dog-224x224.bmp', 'bvlcalexnet-12.onnx', tmp_path),
+        '-py_overhead',
+        '-api', api,
+        '-niter', '10',
+        '-d', 'CPU'
+    )
+    assert 'Python overhead per request' in output
+    assert 'input dispatch' in output
+
+
 @pytest.mark.parametrize('sample_language', ['C++', 'Python'])
 @pytest.mark.parametrize('pin', ['YES', 'NO'])
 def test_pin(sample_language, pin, cache, tmp_path):
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This script runs a Python statement with -X importtime several times and
+aggregates import time of modules. It is used to measure startup time of
+Python tools, e.g. `ovc` and `openvino.convert_model`.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import statistics
+import logging
+import argparse
+import sys
+import os
+import yaml
+
+from pathlib import Path
+
+UTILS_DIR = os.path.join(Path(__file__).parent.parent.parent, "utils")
+sys.path.insert(0, str(UTILS_DIR))
+
+from proc_utils import cmd_exec
+from path_utils import check_positive_int
+
+TOTAL = "total"
+
+
+def parse_importtime(output: str):
+    """Parse -X importtime output to dict with cumulative time of every module in microseconds.
+    Time of all top level imports is stored under "total" key.
+    """
+    res = {TOTAL: 0}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            # Header of the output
+            continue
+        cumulative = int(fields[1])
+        name = fields[2].rstrip()
+        # Nested imports are indented by two spaces per level
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        res[name] = res.get(name, 0) + cumulative
+        if level == 0:
+            res[TOTAL] += cumulative
+    return res
+
+
+def aggregate_stats(stats: dict):
+    """Aggregate provided statistics, time is converted to milliseconds"""
+    return {name: {"avg": statistics.mean(durations) / 1000,
+                   "stdev": statistics.stdev(durations) / 1000 if len(durations) > 1 else 0}
+            for name, durations in stats.items()}
+
+
+def run_importtime(args: dict, log=None):
+    """Run provided statement several times and aggregate collected statistics"""
+    if log is None:
+        log = logging.getLogger("run_importtime")
+
+    cmd = [sys.executable, "-X", "importtime", "-c", args["statement"]]
+    stats = {}
+    imported = set()
+    # The first run compiles bytecode of modules, so it isn't measured
+    for run_iter in range(args["niter"] + 1):
+        retcode, msg = cmd_exec(cmd, log=log, verbose=False)
+        if retcode != 0:
+            log.error(f"Run of statement '{args['statement']}' failed with return code '{retcode}'. Error: {msg}\n"
+                      f"Statistics aggregation is skipped.")
+            return retcode, msg, {}, set()
+        if run_iter == 0:
+            continue
+        times = parse_importtime(msg)
+        imported.update(times)
+        # Modules absent in some runs have zero time in them
+        for name in set(stats) | set(times):
+            stats[name] = stats.get(name, [0] * (run_iter - 1)) + [times.get(name, 0)]
+
+    aggregated_stats = aggregate_stats(stats)
+    log.debug(f"Aggregated statistics after full run: {aggregated_stats}")
+    return 0, "", aggregated_stats, imported
+
+
+def compare_stats(stats: dict, reference: dict, top: int, log):
+    """Log total import time and the slowest modules with differences from the reference statistics"""
+    def describe(name):
+        avg = stats.get(name, {}).get("avg", 0)
+        if reference is None:
+            return f"{avg:10.2f} ms"
+        reference_avg = reference.get(name, {}).get("avg", 0)
+        return f"{avg:10.2f} ms (reference {reference_avg:10.2f} ms, delta {avg - reference_avg:+10.2f} ms)"
+
+    log.info(f"Total import time: {describe(TOTAL)}")
+    names = set(stats) | (set(reference) if reference is not None else set())
+    names.discard(TOTAL)
+
+    def key(name):
+        return max(stats.get(name, {}).get("avg", 0),
+                   reference.get(name, {}).get("avg", 0) if reference is not None else 0)
+
+    log.info("Slowest imports (cumulative time):")
+    for name in sorted(names, key=key, reverse=True)[:top]:
+        log.info(f"    {name:<60} {describe(name)}")
+
+
+def cli_parser():
+    """parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Measure import time of a Python statement")
+    parser.add_argument("statement",
+                        nargs="?",
+                        default="from openvino.tools.ovc.main import main",
+                        help="Python statement to measure, imports ovc by default")
+    parser.add_argument("-niter",
+                        default=10,
+                        type=check_positive_int,
+                        help="Number of times to run the statement to aggregate statistics of")
+    parser.add_argument("-top",
+                        default=20,
+                        type=check_positive_int,
+                        help="Number of the slowest imports to report")
+    parser.add_argument("-s",
+                        dest="stats_path",
+                        type=Path,
+                        help="Path to a file to save aggregated statistics")
+    parser.add_argument("-r",
+                        dest="reference_path",
+                        type=Path,
+                        help="Path to statistics saved by a previous run to compare with, "
+                             "e.g. for another revision of the code")
+    parser.add_argument("-not_imported",
+                        nargs="*",
+                        default=[],
+                        help="Modules which shouldn't be imported by the statement, "
+                             "the script fails if any of them is imported")
+
+    args = parser.parse_args()
+
+    return args
+
+
+if __name__ == "__main__":
+    args = cli_parser()
+
+    logging.basicConfig(format="[ %(levelname)s ] %(message)s",
+                        level=logging.INFO, stream=sys.stdout)
+
+    exit_code, _, aggr_stats, imported = run_importtime(
+        dict(args._get_kwargs()), log=logging)  # pylint: disable=protected-access
+    if exit_code == 0:
+        reference = None
+        if args.reference_path:
+            with open(args.reference_path, "r") as file:
+                reference = yaml.safe_load(file)
+        compare_stats(aggr_stats, reference, args.top, logging)
+
+        unexpected = [name for name in args.not_imported if name in imported]
+        if unexpected:
+            logging.error(f"Modules are imported unexpectedly: {unexpected}")
+            exit_code = 1
+
+        if args.stats_path:
+            with open(args.stats_path, "w") as file:
+                yaml.safe_dump(aggr_stats, file)
+            logging.info(f"Aggregated statistics saved to a file: '{args.stats_path.resolve()}'")
+
+    sys.exit(exit_code)
+
+
+def test_importtime_parser():
+    # Example of -X importtime output
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       187 |        187 |       _json",
+        "import time:       443 |        630 |     json.scanner",
+        "import time:       390 |       1020 |   json.decoder",
+        "import time:       241 |       1261 | json",
+        "import time:       100 |        100 | sys_module",
+        "other output",
+    ])
+
+    expected_result = {"total": 1361, "_json": 187, "json.scanner": 630, "json.decoder": 1020, "json": 1261,
+                       "sys_module": 100}
+
+    assert parse_importtime(output) == expected_result, "Import time parsing is performed incorrectly!"
@@ -2,24 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+import threading
 import time
 from datetime import datetime
-from math import ceil
 from openvino import Core, get_version, AsyncInferQueue
 
 from .utils.constants import GPU_DEVICE_NAME, XML_EXTENSION, BIN_EXTENSION
+from .utils.latency_histogram import LatencyHistogram, Timeline
 from .utils.logging import logger
 from .utils.utils import get_duration_seconds
 
-def percentile(values, percent):
-    return values[ceil(len(values) * percent / 100) - 1]
-
 class Benchmark:
     def __init__(self, device: str, number_infer_requests: int = 0, number_iterations: int = None,
                  duration_seconds: int = None, api_type: str = '', inference_only = None,
-                 maximum_inference_rate: float = 0):
+                 maximum_inference_rate: float = 0, arrival_schedule = None, timeline_interval: float = 1.,
+                 core: Core = None):
         self.device = device
-        self.core = Core()
+        # Core may be shared by several benchmarks running concurrently
+        self.core = core if core is not None else Core()
         self.nireq = number_infer_requests if api_type == 'async' else 1
         self.niter = number_iterations
         self.duration_seconds = get_duration_seconds(duration_seconds, self.niter, self.device)
@@ -27,6 +27,11 @@ class Benchmark:
         self.inference_only = inference_only
         self.latency_groups = []
         self.max_irate = maximum_inference_rate
+        self.arrival_schedule = arrival_schedule
+        self.queueing_delays = LatencyHistogram()
+        self.latencies = LatencyHistogram()
+        self.timeline_interval = timeline_interval
+        self.timeline = Timeline(timeline_interval)
 
     def __del__(self):
         del self.core
@@ -96,38 +101,44 @@ class Benchmark:
         processed_frames = 0
         exec_time = 0
         iteration = 0
-        times = []
+        times = LatencyHistogram()
         start_time = datetime.utcnow()
+        self.timeline.start(time.perf_counter())
         while (self.niter and iteration < self.niter) or \
               (self.duration_seconds and exec_time < self.duration_seconds):
-            processed_frames += data_queue.get_next_batch_size()
+            frames = data_queue.get_next_batch_size()
+            processed_frames += frames
             if self.inference_only == False:
                 request.set_input_tensors(data_queue.get_next_input())
             request.infer()
-            times.append(request.latency)
+            times.record(request.latency)
+            self.timeline.record(request.latency, frames, time.perf_counter())
             iteration += 1
 
             exec_time = (datetime.utcnow() - start_time).total_seconds()
             self.inference_rate_delay(processed_frames, exec_time)
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
-        return sorted(times), total_duration_sec, iteration
+        self.timeline.finish(time.perf_counter())
+        return times, total_duration_sec, iteration
 
     def async_inference_only(self, infer_queue, data_queue):
         processed_frames = 0
         exec_time = 0
         iteration = 0
-        times = []
-        in_fly = set()
+        times = LatencyHistogram()
+        in_fly = {}
         start_time = datetime.utcnow()
+        self.timeline.start(time.perf_counter())
         while (self.niter and iteration < self.niter) or \
               (self.duration_seconds and exec_time < self.duration_seconds) or \
               (iteration % self.nireq):
-            processed_frames += data_queue.get_next_batch_size()
+            frames = data_queue.get_next_batch_size()
+            processed_frames += frames
             idle_id = infer_queue.get_idle_request_id()
             if idle_id in in_fly:
-                times.append(infer_queue[idle_id].latency)
-            else:
-                in_fly.add(idle_id)
+                times.record(infer_queue[idle_id].latency)
+                self.timeline.record(infer_queue[idle_id].latency, in_fly[idle_id], time.perf_counter())
+            in_fly[idle_id] = frames
             infer_queue.start_async()
             iteration += 1
 
@@ -136,29 +147,34 @@ class Benchmark:
 
         infer_queue.wait_all()
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
-        for infer_request_id in in_fly:
-            times.append(infer_queue[infer_request_id].latency)
-        return sorted(times), total_duration_sec, iteration
+        end_time = time.perf_counter()
+        for infer_request_id, frames in in_fly.items():
+            times.record(infer_queue[infer_request_id].latency)
+            self.timeline.record(infer_queue[infer_request_id].latency, frames, end_time)
+        self.timeline.finish(end_time)
+        return times, total_duration_sec, iteration
 
     def async_inference_full_mode(self, infer_queue, data_queue, pcseq):
         processed_frames = 0
         exec_time = 0
         iteration = 0
-        times = []
-        num_groups = len(self.latency_groups)
+        times = LatencyHistogram()
+        num_groups = data_queue.cycle_size
         start_time = datetime.utcnow()
-        in_fly = set()
+        self.timeline.start(time.perf_counter())
+        in_fly = {}
         while (self.niter and iteration < self.niter) or \
               (self.duration_seconds and exec_time < self.duration_seconds) or \
               (iteration % num_groups):
-            processed_frames += data_queue.get_next_batch_size()
+            frames = data_queue.get_next_batch_size()
+            processed_frames += frames
             idle_id = infer_queue.get_idle_request_id()
             if idle_id in in_fly:
-                times.append(infer_queue[idle_id].latency)
+                times.record(infer_queue[idle_id].latency)
+                self.timeline.record(infer_queue[idle_id].latency, in_fly[idle_id], time.perf_counter())
                 if pcseq:
-                    self.latency_groups[infer_queue.userdata[idle_id]].times.append(infer_queue[idle_id].latency)
-            else:
-                in_fly.add(idle_id)
+                    self.latency_groups[infer_queue.userdata[idle_id]].times.record(infer_queue[idle_id].latency)
+            in_fly[idle_id] = frames
             group_id = data_queue.current_group_id
             infer_queue[idle_id].set_input_tensors(data_queue.get_next_input())
             infer_queue.start_async(userdata=group_id)
@@ -168,16 +184,67 @@ class Benchmark:
             self.inference_rate_delay(processed_frames, exec_time)
         infer_queue.wait_all()
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
+        end_time = time.perf_counter()
 
-        for infer_request_id in in_fly:
-            times.append(infer_queue[infer_request_id].latency)
+        for infer_request_id, frames in in_fly.items():
+            times.record(infer_queue[infer_request_id].latency)
+            self.timeline.record(infer_queue[infer_request_id].latency, frames, end_time)
             if pcseq:
-                self.latency_groups[infer_queue.userdata[infer_request_id]].times.append(infer_queue[infer_request_id].latency)
+                self.latency_groups[infer_queue.userdata[infer_request_id]].times.record(infer_queue[infer_request_id].latency)
+        self.timeline.finish(end_time)
+
+        return times, total_duration_sec, processed_frames, iteration
+
+    def open_loop_inference(self, infer_queue, data_queue):
+        # Requests are sent at intended times of the arrival schedule independently of completions.
+        # Latency is measured from the intended send time, so it includes waiting for an idle request.
+        processed_frames = 0
+        iteration = 0
+        times = LatencyHistogram()
+        queueing_delays = LatencyHistogram()
+        # Callbacks are called from several threads
+        lock = threading.Lock()
+
+        def completion_callback(request, userdata):
+            intended_time, send_time, frames = userdata
+            end_time = time.perf_counter()
+            with lock:
+                times.record((end_time - intended_time) * 1000)
+                queueing_delays.record((send_time - intended_time) * 1000)
+                self.timeline.record((end_time - intended_time) * 1000, frames, end_time)
 
-        return sorted(times), total_duration_sec, processed_frames, iteration
+        infer_queue.set_callback(completion_callback)
+        start_time = time.perf_counter()
+        self.timeline.start(start_time)
+        for send_offset in self.arrival_schedule:
+            if not ((self.niter and iteration < self.niter) or \
+                    (self.duration_seconds and send_offset < self.duration_seconds)):
+                break
+            intended_time = start_time + send_offset
+            delay = intended_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            frames = data_queue.get_next_batch_size()
+            processed_frames += frames
+            idle_id = infer_queue.get_idle_request_id()
+            if self.inference_only == False:
+                infer_queue[idle_id].set_input_tensors(data_queue.get_next_input())
+            infer_queue.start_async(userdata=(intended_time, time.perf_counter(), frames))
+            iteration += 1
+        infer_queue.wait_all()
+        end_time = time.perf_counter()
+        total_duration_sec = end_time - start_time
+        self.timeline.finish(end_time)
+        if not times:
+            raise Exception("No inference requests were sent by the arrival schedule.")
+        return times, queueing_delays, total_duration_sec, processed_frames, iteration
 
     def main_loop(self, requests, data_queue, batch_size, latency_percentile, pcseq):
-        if self.api_type == 'sync':
+        self.timeline = Timeline(self.timeline_interval)
+        if self.arrival_schedule is not None:
+            times, self.queueing_delays, total_duration_sec, processed_frames, iteration = self.open_loop_inference(requests, data_queue)
+            fps = processed_frames / total_duration_sec
+        elif self.api_type == 'sync':
             times, total_duration_sec, iteration = self.sync_inference(requests[0], data_queue)
             fps = len(batch_size) * iteration / total_duration_sec
         elif self.inference_only:
@@ -187,17 +254,17 @@ class Benchmark:
             times, total_duration_sec, processed_frames, iteration = self.async_inference_full_mode(requests, data_queue, pcseq)
             fps = processed_frames / total_duration_sec
 
-        median_latency_ms = percentile(times, latency_percentile)
-        avg_latency_ms = sum(times) / len(times)
-        min_latency_ms = times[0]
-        max_latency_ms = times[-1]
+        self.latencies = times
+        median_latency_ms = times.percentile(latency_percentile)
+        avg_latency_ms = times.avg
+        min_latency_ms = times.min
+        max_latency_ms = times.max
 
         if pcseq:
             for group in self.latency_groups:
                 if group.times:
-                    group.times.sort()
-                    group.median = percentile(group.times, latency_percentile)
-                    group.avg = sum(group.times) / len(group.times)
-                    group.min = group.times[0]
-                    group.max = group.times[-1]
+                    group.median = group.times.percentile(latency_percentile)
+                    group.avg = group.times.avg
+                    group.min = group.times.min
+                    group.max = group.times.max
         return fps, median_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, total_duration_sec, iteration
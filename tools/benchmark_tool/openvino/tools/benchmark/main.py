@@ -3,7 +3,6 @@
 
 import os
 import sys
-import platform
 from datetime import datetime
 
 from openvino import Dimension, properties
@@ -13,28 +12,25 @@ from openvino.tools.benchmark.parameters import parse_args
 from openvino.tools.benchmark.utils.constants import MULTI_DEVICE_NAME, \
     CPU_DEVICE_NAME, GPU_DEVICE_NAME, \
     BLOB_EXTENSION, AUTO_DEVICE_NAME
-from openvino.tools.benchmark.utils.inputs_filling import get_input_data
+from openvino.tools.benchmark.utils.inputs_filling import get_input_data, set_initial_inputs
+from openvino.tools.benchmark.utils.generation import run_generation
+from openvino.tools.benchmark.utils.load_generator import get_arrival_schedule, TRACE_ARRIVAL
 from openvino.tools.benchmark.utils.logging import logger
 from openvino.tools.benchmark.utils.utils import next_step, get_number_iterations, pre_post_processing, \
     process_help_inference_string, print_perf_counters, print_perf_counters_sort, dump_exec_graph, get_duration_in_milliseconds, \
     get_command_line_arguments, parse_value_per_device, parse_devices, get_inputs_info, \
     print_inputs_and_outputs_info, get_network_batch_size, load_config, dump_config, get_latency_groups, \
-    check_for_static, can_measure_as_static, parse_value_for_virtual_device, is_virtual_device, is_virtual_device_found
+    check_for_static, can_measure_as_static, parse_value_for_virtual_device, is_virtual_device, is_virtual_device_found, \
+    get_paths_to_input, get_peak_memory_usage
+from openvino.tools.benchmark.utils.multi_model import run_multi_model
+from openvino.tools.benchmark.utils.perf_counters import PerfCounters, run_perf_counters_diff
+from openvino.tools.benchmark.utils.python_overhead import run_python_overhead
+from openvino.tools.benchmark.utils.shape_distribution import ShapeDistribution
+from openvino.tools.benchmark.utils.startup import run_startup_benchmark
+from openvino.tools.benchmark.utils.sweep import run_sweep
 from openvino.tools.benchmark.utils.statistics_report import StatisticsReport, JsonStatisticsReport, CsvStatisticsReport, \
     averageCntReport, detailedCntReport
 
-def get_peak_memory_usage():
-    if platform.system() == "Linux":
-        with open("/proc/self/status", "r") as f:
-            for line in f:
-                if line.startswith("VmPeak:"):
-                    return int(line.split()[1])  # The value in KB
-        raise RuntimeError("VmPeak attribute not found. Unable to determine peak memory usage.")
-
-    # No Windows support due to the lack of the ‘psutil’ module in the CI infrastructure
-    # No Macos support due to no /proc/self/status file
-    return None
-
 def log_memory_usage(logger, start_mem_usage, end_mem_usage, action_name):
     if start_mem_usage is None or end_mem_usage is None:
         return
@@ -52,10 +48,26 @@ def parse_and_check_command_line():
     parser = parse_args()
     args = parser.parse_args()
 
+    if args.pc_diff:
+        return args, False
+
+    if not args.path_to_model and not args.multi_model:
+        parser.error("the following arguments are required: -m/--path_to_model")
+
     if args.latency_percentile < 1 or args.latency_percentile > 100:
         parser.print_help()
         raise RuntimeError("The percentile value is incorrect. The applicable values range is [1, 100].")
 
+    try:
+        args.report_percentiles = [float(value) for value in args.report_percentiles.split(',') if value.strip()]
+    except ValueError:
+        raise RuntimeError(f"Incorrect -report_percentiles value '{args.report_percentiles}'. Comma separated numbers are expected.")
+    if any(value <= 0 or value > 100 for value in args.report_percentiles):
+        raise RuntimeError("The percentile value is incorrect. The applicable values range is (0, 100].")
+
+    if args.timeline_interval <= 0:
+        raise RuntimeError("-timeline_interval should be positive.")
+
     if not args.perf_hint == "none" and (arg_not_empty(args.number_streams, "") or arg_not_empty(args.number_threads, 0) or arg_not_empty(args.infer_threads_pinning, "")):
         raise Exception("-nstreams, -nthreads and -pin options are fine tune options. To use them you " \
                         "should explicitely set -hint option to none. This is not OpenVINO limitation " \
@@ -64,7 +76,7 @@ def parse_and_check_command_line():
     if args.report_type == "average_counters" and MULTI_DEVICE_NAME in args.target_device:
         raise Exception("only detailed_counters report type is supported for MULTI device")
 
-    _, ext = os.path.splitext(args.path_to_model)
+    _, ext = os.path.splitext(args.path_to_model or '')
     is_network_compiled = True if ext == BLOB_EXTENSION else False
     is_precisiton_set = not (args.input_precision == "" and args.output_precision == "" and args.input_output_precision == "")
 
@@ -79,6 +91,58 @@ def parse_and_check_command_line():
         if args.time == 0 and (args.number_infer_requests > args.number_iterations):
             raise Exception("Number of infer requests should be less than or equal to number of iterations in sync mode.")
 
+    if args.arrival_process:
+        if args.api_type != "async":
+            raise Exception("Open-loop load (-arrival) is supported only with async API.")
+        if args.maximum_inference_rate:
+            raise Exception("-arrival and -max_irate options can't be used together.")
+        if args.arrival_process == TRACE_ARRIVAL:
+            if not args.arrival_trace:
+                raise Exception("-arrival_trace should be specified for trace arrival process.")
+        elif args.arrival_rate <= 0:
+            raise Exception(f"-arrival_rate should be positive for {args.arrival_process} arrival process.")
+
+    args.shape_distribution = None
+    if args.data_shape_file:
+        if args.data_shape or args.paths_to_input:
+            raise Exception("-data_shape_file option can't be used together with -data_shape or -i.")
+        args.shape_distribution = ShapeDistribution(args.data_shape_file)
+        args.data_shape = args.shape_distribution.data_shape
+
+    if args.multi_model:
+        if args.data_shape_file:
+            raise Exception("-multi_model and -data_shape_file options can't be used together.")
+        if args.api_type != "async":
+            raise Exception("Multi-model benchmarking (-multi_model) is supported only with async API.")
+        if args.sweep or args.arrival_process:
+            raise Exception("-multi_model option can't be used together with -sweep or -arrival.")
+
+    if args.sweep:
+        if args.api_type != "async":
+            raise Exception("Sweep (-sweep) is supported only with async API.")
+        if is_network_compiled:
+            raise Exception("Sweep (-sweep) is not supported for compiled models.")
+        if args.arrival_process:
+            raise Exception("-sweep and -arrival options can't be used together.")
+
+    if args.startup_runs:
+        if not args.path_to_model:
+            raise Exception("Startup benchmark (-startup_runs) requires -m option.")
+        if args.sweep or args.multi_model or args.arrival_process:
+            raise Exception("-startup_runs option can't be used together with -sweep, -multi_model or -arrival.")
+
+    if args.gen_tokens:
+        if not args.path_to_model or is_network_compiled:
+            raise Exception("Generation mode (-gen_tokens) requires a model in -m option, compiled models are not supported.")
+        if args.sweep or args.multi_model or args.arrival_process or args.startup_runs or args.data_shape_file:
+            raise Exception("-gen_tokens option can't be used together with -sweep, -multi_model, -arrival, "
+                            "-startup_runs or -data_shape_file.")
+
+    if args.py_overhead:
+        if args.sweep or args.multi_model or args.arrival_process or args.startup_runs or args.gen_tokens:
+            raise Exception("-py_overhead option can't be used together with -sweep, -multi_model, -arrival, "
+                            "-startup_runs or -gen_tokens.")
+
     return args, is_network_compiled
 
 def main():
@@ -88,6 +152,9 @@ def main():
         next_step()
         logger.info("Parsing input parameters")
         args, is_network_compiled = parse_and_check_command_line()
+        if args.pc_diff:
+            run_perf_counters_diff(args)
+            return
 
         command_line_arguments = get_command_line_arguments(sys.argv)
         if args.report_type:
@@ -114,9 +181,14 @@ def main():
         # ------------------------------ 2. Loading OpenVINO Runtime -------------------------------------------
         next_step(step_id=2)
 
+        arrival_schedule = None
+        if args.arrival_process:
+            arrival_schedule = get_arrival_schedule(args.arrival_process, args.arrival_rate, args.arrival_trace)
+
         benchmark = Benchmark(args.target_device, args.number_infer_requests,
                               args.number_iterations, args.time, args.api_type,
-                              args.inference_only, args.maximum_inference_rate)
+                              args.inference_only, args.maximum_inference_rate, arrival_schedule,
+                              args.timeline_interval)
 
         if args.extensions:
             benchmark.add_extension(path_to_extensions=args.extensions)
@@ -133,6 +205,22 @@ def main():
 
         benchmark.print_version_info()
 
+        if args.startup_runs:
+            run_startup_benchmark(args, is_network_compiled, statistics)
+            return
+
+        if args.gen_tokens:
+            run_generation(benchmark, args, statistics)
+            return
+
+        if args.sweep:
+            run_sweep(benchmark, args, get_paths_to_input(args.paths_to_input))
+            return
+
+        if args.multi_model:
+            run_multi_model(benchmark, args, statistics)
+            return
+
         # --------------------- 3. Setting device configuration --------------------------------------------------------
         next_step()
 
@@ -217,6 +305,10 @@ def main():
                 logger.warning(f"Turn on performance counters for {device} device " +
                                f"since report type is {args.report_type}.")
                 config[device][properties.enable_profiling()] = True
+            elif args.pc_dump:
+                logger.warning(f"Turn on performance counters for {device} device " +
+                               "since they are dumped to -pc_dump file.")
+                config[device][properties.enable_profiling()] = True
             elif args.exec_graph_path is not None:
                 logger.warning(f"Turn on performance counters for {device} device " +
                                "due to execution graph dumping.")
@@ -525,15 +617,8 @@ def main():
         requests = benchmark.create_infer_requests(compiled_model)
 
         # Prepare input data
-        paths_to_input = list()
-        if args.paths_to_input:
-            for path in args.paths_to_input:
-                if ":" in next(iter(path), ""):
-                    paths_to_input.extend(path)
-                else:
-                    paths_to_input.append(os.path.abspath(*path))
-
-        data_queue = get_input_data(paths_to_input, app_inputs_info)
+        shape_schedule = args.shape_distribution.get_schedule(args.data_shape_order) if args.shape_distribution else None
+        data_queue = get_input_data(get_paths_to_input(args.paths_to_input), app_inputs_info, args.input_cache_dir, shape_schedule)
 
         static_mode = check_for_static(app_inputs_info)
         allow_inference_only_or_sync = can_measure_as_static(app_inputs_info)
@@ -560,20 +645,14 @@ def main():
             for group in benchmark.latency_groups:
                 logger.info(f"\t{str(group)}")
 
+        if args.shape_distribution:
+            logger.info(f"Requests are sent with shapes from {args.data_shape_file} in {args.data_shape_order} order")
+
         # Iteration limit
-        benchmark.niter = get_number_iterations(benchmark.niter, benchmark.nireq, max(len(info.shapes) for info in app_inputs_info), benchmark.api_type)
+        benchmark.niter = get_number_iterations(benchmark.niter, benchmark.nireq, data_queue.cycle_size, benchmark.api_type)
 
         # Set input tensors before first inference
-        for request in requests:
-            data_tensors = data_queue.get_next_input()
-            for port, data_tensor in data_tensors.items():
-                input_tensor = request.get_input_tensor(port)
-                if not static_mode:
-                    input_tensor.shape = data_tensor.shape
-                if not len(input_tensor.shape):
-                    input_tensor.data.flat[:] = data_tensor.data
-                else:
-                    input_tensor.data[:] = data_tensor.data
+        set_initial_inputs(requests, data_queue, static_mode)
 
         if statistics:
             statistics.add_parameters(StatisticsReport.Category.RUNTIME_CONFIG,
@@ -605,6 +684,9 @@ def main():
             logger.info("Benchmarking in inference only mode (inputs filling are not included in measurement loop).")
         else:
             logger.info("Benchmarking in full mode (inputs filling are included in measurement loop).")
+        if benchmark.arrival_schedule is not None:
+            logger.info(f"Open-loop load with {args.arrival_process} arrival process, "
+                        "latency is measured from the intended send time of each request.")
         if not args.no_warmup:
             duration_ms = f"{benchmark.first_infer(requests):.2f}"
             logger.info(f"First inference took {duration_ms} ms")
@@ -616,13 +698,22 @@ def main():
         else:
             logger.info("Skipping warmup inference due to -no_warmup flag")
 
+        if args.py_overhead:
+            run_python_overhead(benchmark, requests, data_queue, statistics)
+            return
 
         pcseq = args.pcseq
-        if static_mode or len(benchmark.latency_groups) == 1:
+        if static_mode or len(benchmark.latency_groups) == 1 or benchmark.arrival_schedule is not None:
             pcseq = False
 
         fps, median_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, total_duration_sec, iteration = benchmark.main_loop(requests, data_queue, batch_size, args.latency_percentile, pcseq)
 
+        report_percentiles = [(f'{value:g}', benchmark.latencies.percentile(value)) for value in args.report_percentiles]
+        if benchmark.queueing_delays:
+            avg_queueing_delay_ms = benchmark.queueing_delays.avg
+            percentile_queueing_delay_ms = benchmark.queueing_delays.percentile(args.latency_percentile)
+            max_queueing_delay_ms = benchmark.queueing_delays.max
+
         # ------------------------------------ 11. Dumping statistics report -------------------------------------------
         next_step()
 
@@ -638,6 +729,10 @@ def main():
             for request in requests:
                 perfs_count_list.append(request.profiling_info)
 
+            if args.pc_dump:
+                # Counters are stored before reports, averaging of the report modifies them in place
+                PerfCounters.from_profiling_info(perfs_count_list).save(args.pc_dump)
+
             if args.perf_counts_sort:
                 total_sorted_list = print_perf_counters_sort(perfs_count_list,sort_flag=args.perf_counts_sort)
                 if statistics:
@@ -679,6 +774,18 @@ def main():
                                           [
                                               ("max latency", f'{max_latency_ms:.2f}'),
                                           ])
+                statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                          [
+                                              (f'latency ({percent} percentile) (ms)', f'{value:.2f}')
+                                              for percent, value in report_percentiles
+                                          ])
+                if benchmark.queueing_delays:
+                    statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                              [
+                                                  ("avg queueing delay", f'{avg_queueing_delay_ms:.2f}'),
+                                                  (f"queueing delay ({args.latency_percentile} percentile) (ms)", f'{percentile_queueing_delay_ms:.2f}'),
+                                                  ("max queueing delay", f'{max_queueing_delay_ms:.2f}'),
+                                              ])
                 if pcseq:
                     for group in benchmark.latency_groups:
                         statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
@@ -702,6 +809,7 @@ def main():
                                           ('throughput', f'{fps:.2f}'),
                                       ])
             statistics.dump()
+            statistics.dump_timeline(benchmark.timeline.intervals)
 
         try:
             exeDevice = compiled_model.get_property("EXECUTION_DEVICES")
@@ -719,6 +827,14 @@ def main():
             logger.info(f'   Average:       {avg_latency_ms:.2f} ms')
             logger.info(f'   Min:           {min_latency_ms:.2f} ms')
             logger.info(f'   Max:           {max_latency_ms:.2f} ms')
+            for percent, value in report_percentiles:
+                logger.info(f'   {percent} percentile:     {value:.2f} ms')
+
+            if benchmark.queueing_delays:
+                logger.info('Queueing delay:')
+                logger.info(f'   {args.latency_percentile} percentile:     {percentile_queueing_delay_ms:.2f} ms')
+                logger.info(f'   Average:       {avg_queueing_delay_ms:.2f} ms')
+                logger.info(f'   Max:           {max_queueing_delay_ms:.2f} ms')
 
             if pcseq:
                 logger.info("Latency for each data shape group:")
@@ -3,6 +3,9 @@
 
 import sys, argparse
 
+from openvino.tools.benchmark.utils.load_generator import ARRIVAL_PROCESSES
+from openvino.tools.benchmark.utils.sweep import SWEEP_MODES
+from openvino.tools.benchmark.utils.shape_distribution import REPLAY_ORDER, SHAPE_ORDERS
 from openvino.tools.benchmark.utils.utils import show_available_devices
 
 INPUT_OUTPUT_PRECISION_CHOICES = [
@@ -54,9 +57,16 @@ def parse_args():
                            'Currently supported data types: bin, npy. If OPENCV is enabled, this functionality'
                            'is extended with the following data types: bmp, dib, jpeg, jpg, jpe, jp2, png, pbm, '
                            'pgm, ppm, sr, ras, tiff, tif.')
-    args.add_argument('-m', '--path_to_model', type=str, required=True,
+    args.add_argument('-m', '--path_to_model', type=str, required=False,
                       help='Required. Path to an .xml/.onnx file with a trained model or '
-                           'to a .blob file with a trained compiled model.')
+                           'to a .blob file with a trained compiled model. Not used with -multi_model.')
+    args.add_argument('-multi_model', '--multi_model', type=str, required=False, default='',
+                      help='Optional. Path to a JSON file with a list of models which are benchmarked concurrently '
+                           'on a shared OpenVINO Core, each with its own infer requests. Every model is an object with '
+                           'the path to the model in "m" key and optional "d", "hint", "nstreams", "nthreads", "nireq", '
+                           '"b", "shape", "data_shape", "layout" and "i" keys, other options are taken from the command line. '
+                           'For example: [{"m": "model1.xml", "hint": "latency"}, {"m": "model2.xml", "nireq": 4}]. '
+                           'Throughput and latency are reported for each model and for all models together.')
     args.add_argument('-d', '--target_device', type=str, required=False, default='CPU',
                       help='Optional. Specify a target device to infer on (the list of available devices is shown below). '
                            'Default value is CPU. Use \'-d HETERO:<comma separated devices list>\' format to specify HETERO plugin. '
@@ -78,6 +88,18 @@ def parse_args():
                            'Tweaking this value allow better accuracy in power usage measurement by limiting the execution.')
     args.add_argument('-t', '--time', type=check_positive, required=False, default=None,
                       help='Optional. Time in seconds to execute topology.')
+    args.add_argument('-arrival', '--arrival_process', type=str, required=False, default=None, choices=ARRIVAL_PROCESSES,
+                      help='Optional. Enables open-loop load: inference requests are sent on a schedule independent of completions. '
+                           '\'constant\': requests are sent at fixed intervals of 1/arrival_rate seconds. '
+                           '\'poisson\': requests are sent with exponentially distributed intervals with mean of 1/arrival_rate seconds. '
+                           '\'trace\': requests are sent at times read from -arrival_trace file. '
+                           'Latency is measured from the intended send time and includes queueing delay, which is also reported separately. '
+                           'If not specified, a new request is sent as soon as an infer request is idle (closed-loop load). '
+                           'Requires async API.')
+    args.add_argument('-arrival_rate', '--arrival_rate', type=float, required=False, default=0,
+                      help='Optional. Rate of requests sent per second for constant and poisson arrival processes.')
+    args.add_argument('-arrival_trace', '--arrival_trace', type=str, required=False, default=None,
+                      help='Optional. Path to a file with request send times in seconds, one per line, for trace arrival process.')
 
     shapes = parser.add_argument_group('Input shapes')
     shapes.add_argument('-b', '--batch_size', type=str, required=False, default='',
@@ -93,6 +115,18 @@ def parse_args():
                              'Optional if model shapes are all static (original ones or set by -shape).'
                              'Required if at least one input shape is dynamic and input images are not provided.'
                              'Set shape for input tensors. For example, "input1[1,3,224,224][1,3,448,448],input2[1,4][1,8]" or "[1,3,224,224][1,3,448,448] in case of one input size.')
+    shapes.add_argument('-data_shape_file', '--data_shape_file', type=str, required=False, default='',
+                        help='Optional. '
+                             'Path to a file with input shapes of requests to replay a dynamic-shape workload. '
+                             'Every line contains shapes of one request in -data_shape format, for example '
+                             '"input1[1,128],input2[1,128]" or "[1,128]" in case of one input, optionally followed by '
+                             'the number of consecutive requests with these shapes. Inputs are filled with random values. '
+                             'Can\'t be used together with -data_shape and -i.')
+    shapes.add_argument('-data_shape_order', '--data_shape_order', type=str, required=False, default=REPLAY_ORDER,
+                        choices=SHAPE_ORDERS,
+                        help='Optional. Order of shapes from -data_shape_file: '
+                             '"replay" sends requests in order of the file, '
+                             '"sample" draws shapes of requests randomly with frequencies from the file. Default: replay.')
     shapes.add_argument('-layout', type=str, required=False, default='',
                         help='Optional. '
                              'Prompts how model layouts should be treated by application. '
@@ -106,6 +140,10 @@ def parse_args():
                            'kernels description.')
     advs.add_argument('-cdir', '--cache_dir', type=str, required=False, default='',
                       help="Optional. Enable model caching to specified directory")
+    advs.add_argument('-input_cache_dir', '--input_cache_dir', type=str, required=False, default='',
+                      help="Optional. Enable caching of preprocessed input images to specified directory. "
+                           "Images are decoded and resized once for a given input shape, layout and precision, "
+                           "next runs load them from the cache.")
     advs.add_argument('-lfile', '--load_from_file', required=False, nargs='?', default=argparse.SUPPRESS,
                       help="Optional. Loads model from file directly without read_model.")
     args.add_argument('-api', '--api_type', type=str, required=False, default='', choices=['sync', 'async'],
@@ -157,6 +195,12 @@ def parse_args():
     stat = parser.add_argument_group('Statistics dumping options')
     stat.add_argument('-latency_percentile', '--latency_percentile', type=int, required=False, default=50,
                       help='Optional. Defines the percentile to be reported in latency metric. The valid range is [1, 100]. The default value is 50 (median).')
+    stat.add_argument('-report_percentiles', '--report_percentiles', type=str, required=False, default='',
+                      help='Optional. Comma separated list of additional latency percentiles to be reported, for example "90,99,99.9". '
+                           'The valid range is (0, 100]. Latencies are collected into a histogram with 1%% relative precision.')
+    stat.add_argument('-timeline_interval', '--timeline_interval', type=float, required=False, default=1.,
+                      help='Optional. Interval in seconds of the throughput and latency timeline which is stored with statistics report. '
+                           'The default value is 1.')
     stat.add_argument('-report_type', '--report_type', type=str, required=False,
                       choices=['no_counters', 'average_counters', 'detailed_counters'],
                       help="Optional. Enable collecting statistics report. \"no_counters\" report contains "
@@ -177,8 +221,25 @@ def parse_args():
                            '  sort: Analysis opts time cost, print by hotpoint order'
                            '  no_sort: Analysis opts time cost, print by normal order'
                            '  simple_sort: Analysis opts time cost, only print EXECUTED opts by normal order', )
+    stat.add_argument('-pc_dump', '--pc_dump', type=str, required=False, default='',
+                      help='Optional. Path to .npz file to store per-layer performance counters of all infer requests '
+                           'in a compact form for -pc_diff. Enables performance counters.')
+    stat.add_argument('-pc_diff', '--pc_diff', type=str, required=False, nargs=2, metavar=('BASE', 'NEW'),
+                      help='Optional. Compare performance counters stored by -pc_dump instead of running a benchmark. '
+                           'BASE and NEW are comma separated lists of .npz files of repeated runs. Layers and layer types '
+                           'which became slower by more than -pc_diff_threshold with statistical significance are reported '
+                           'as regressions. The result is stored to benchmark_perf_counters_diff.json in -report_folder.')
+    stat.add_argument('-pc_diff_threshold', '--pc_diff_threshold', type=float, required=False, default=5.,
+                      help='Optional. Minimal relative slowdown of a layer in percents to report it as a regression. '
+                           'The default value is 5.')
+    stat.add_argument('-pc_diff_alpha', '--pc_diff_alpha', type=float, required=False, default=0.05,
+                      help='Optional. Significance level of the permutation test of -pc_diff. The default value is 0.05.')
     stat.add_argument('-pcseq', '--pcseq', type=str2bool, required=False, default=False, nargs='?', const=True,
                       help='Optional. Report latencies for each shape in -data_shape sequence.', )
+    stat.add_argument('-py_overhead', '--py_overhead', type=str2bool, required=False, default=False, nargs='?', const=True,
+                      help='Optional. Measure duration of Python side stages of inference calls: input dispatch, native call, '
+                           'results wrapping and outputs conversion for sync API, submission and completion for async API, '
+                           'and report Python overhead per request compared to C++ latency of requests, in microseconds.')
     advs.add_argument('-exec_graph_path', '--exec_graph_path', type=str, required=False,
                       help='Optional. Path to a file where to store executable graph information serialized.')
     stat.add_argument('-dump_config', type=str, required=False, default='',
@@ -198,4 +259,42 @@ def parse_args():
                            "                     \"DEVICE_PROPERTIES\": \"{CPU:{INFERENCE_PRECISION_HINT:f32,NUM_STREAMS:3},GPU:{INFERENCE_PRECISION_HINT:f32,NUM_STREAMS:5}}\"\n"
                            "                }\n"
                            "             }")
+
+    sweep = parser.add_argument_group('Sweep options')
+    sweep.add_argument('-sweep', '--sweep', type=str, required=False, default='',
+                       help='Optional. Benchmark every combination of values of performance options and report a table '
+                            'and a latency vs throughput Pareto front. The model is read once and compiled once per combination '
+                            'of compile options. Format is "<option>=<value1>,<value2>;..." with hint, nstreams, nthreads, nireq '
+                            'and b options, for example "hint=none;nstreams=1,2,4;nireq=1,2,4,8;b=1,2". '
+                            'Options which are not swept are taken from the command line. Use -t to set time per configuration.')
+    sweep.add_argument('-sweep_mode', '--sweep_mode', type=str, required=False, default='grid', choices=SWEEP_MODES,
+                       help='Optional. \'grid\': benchmark all combinations. \'guided\': benchmark nireq values in ascending order and '
+                            'skip the rest of them once throughput grows by less than 2%% or latency exceeds -latency_sla. '
+                            'The default value is grid.')
+    sweep.add_argument('-latency_sla', '--latency_sla', type=float, required=False, default=0,
+                       help='Optional. Latency limit in ms for the percentile defined by -latency_percentile. '
+                            'The sweep reports the configuration with the highest throughput within the limit.')
+    sweep.add_argument('-sweep_report', '--sweep_report', type=str, required=False, default='',
+                       help='Optional. Path to JSON file to store sweep results. '
+                            'The default value is benchmark_sweep.json in -report_folder.')
+
+    startup = parser.add_argument_group('Startup options')
+    startup.add_argument('-startup_runs', '--startup_runs', type=check_positive, required=False, default=0,
+                         help='Optional. Benchmark model loading instead of inference: read and compile (or import) the model '
+                              'in the given number of fresh processes without model cache, with an empty cache and with a filled '
+                              'cache, each with cold and warm page cache, and report distribution of every phase, '
+                              'cache hits and size of the cache.')
+    startup.add_argument('-startup_report', '--startup_report', type=str, required=False, default='',
+                         help='Optional. Path to JSON file to store startup results. '
+                              'The default value is benchmark_startup.json in -report_folder.')
+
+    generation = parser.add_argument_group('Generation options')
+    generation.add_argument('-gen_tokens', '--gen_tokens', type=check_positive, required=False, default=0,
+                            help='Optional. Benchmark autoregressive generation with a stateful model: every sequence runs '
+                                 'a prompt of -prompt_len tokens followed by the given number of steps generating one token. '
+                                 '-nireq sets the number of concurrent sequences, -niter sets the number of sequences. '
+                                 'Time to first token, inter-token latency, tokens per second and state size are reported. '
+                                 'The model should have input_ids and optionally attention_mask, position_ids and beam_idx inputs.')
+    generation.add_argument('-prompt_len', '--prompt_len', type=check_positive, required=False, default=128,
+                            help='Optional. Number of prompt tokens of every sequence in generation mode. The default value is 128.')
     return parser
@@ -0,0 +1,216 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import numpy as np
+from openvino import Tensor
+from openvino.utils.types import get_dtype
+
+from .latency_histogram import LatencyHistogram
+from .logging import logger
+from .statistics_report import StatisticsReport
+from .sweep import get_device_config, get_number_streams
+from .utils import load_config, get_duration_in_milliseconds
+
+INPUT_IDS = 'input_ids'
+ATTENTION_MASK = 'attention_mask'
+POSITION_IDS = 'position_ids'
+BEAM_IDX = 'beam_idx'
+GENERATION_INPUTS = [INPUT_IDS, ATTENTION_MASK, POSITION_IDS, BEAM_IDX]
+# Random token ids are taken from the beginning of the vocabulary, which exists in any tokenizer
+MAX_RANDOM_TOKEN_ID = 1000
+
+
+def get_input_roles(model_inputs):
+    roles = {}
+    for port, model_input in enumerate(model_inputs):
+        names = model_input.get_names() or {model_input.node.get_friendly_name()}
+        role = next((name for name in GENERATION_INPUTS if name in names), None)
+        if role is None:
+            raise Exception(f"Input {', '.join(sorted(names))} of the model is not supported in generation mode. "
+                            f"Supported inputs: {', '.join(GENERATION_INPUTS)}")
+        roles[role] = (port, get_dtype(model_input.get_element_type()))
+    if INPUT_IDS not in roles:
+        raise Exception(f"Model should have {INPUT_IDS} input to be benchmarked in generation mode")
+    return roles
+
+
+def get_state_size(request):
+    return sum(state.state.byte_size for state in request.query_state())
+
+
+class GenerationStatistics:
+    """ Latencies and state sizes of sequences generated by all infer requests. """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_token_latencies = LatencyHistogram()
+        self.inter_token_latencies = LatencyHistogram()
+        self.prefill_state_sizes = []
+        self.final_state_sizes = []
+        self.sequences = 0
+        self.tokens = 0
+
+    def add_sequence(self, first_token_latency, inter_token_latencies, state_sizes=None):
+        with self.lock:
+            self.first_token_latencies.record(first_token_latency)
+            self.inter_token_latencies.merge(inter_token_latencies)
+            if state_sizes is not None:
+                self.prefill_state_sizes.append(state_sizes[0])
+                self.final_state_sizes.append(state_sizes[1])
+            self.sequences += 1
+            self.tokens += 1 + inter_token_latencies.count
+
+
+class SequenceGenerator:
+    """ Runs prefill of prompt_len tokens followed by decode_steps steps of one token on a stateful infer request. """
+    def __init__(self, request, roles, prompt_len, decode_steps, seed):
+        self.request = request
+        self.roles = roles
+        self.prompt_len = prompt_len
+        self.decode_steps = decode_steps
+        # Reading states may copy them from the device, so state sizes are measured for the first sequence only
+        self.state_sizes = None
+        max_len = prompt_len + decode_steps
+        # Inputs of all steps are views of these arrays, so no data is allocated in the measurement loop
+        rs = np.random.RandomState(np.random.MT19937(np.random.SeedSequence(seed)))
+        self.token_ids = rs.randint(1, MAX_RANDOM_TOKEN_ID, (1, max_len)).astype(roles[INPUT_IDS][1])
+        if ATTENTION_MASK in roles:
+            self.attention_mask = np.ones((1, max_len), dtype=roles[ATTENTION_MASK][1])
+        if POSITION_IDS in roles:
+            self.position_ids = np.arange(max_len, dtype=roles[POSITION_IDS][1]).reshape(1, max_len)
+        if BEAM_IDX in roles:
+            self.beam_idx = np.zeros(1, dtype=roles[BEAM_IDX][1])
+
+    def get_step_inputs(self, past_len, step_len):
+        inputs = {self.roles[INPUT_IDS][0]: Tensor(self.token_ids[:, past_len:past_len + step_len], shared_memory=True)}
+        if ATTENTION_MASK in self.roles:
+            inputs[self.roles[ATTENTION_MASK][0]] = Tensor(self.attention_mask[:, :past_len + step_len], shared_memory=True)
+        if POSITION_IDS in self.roles:
+            inputs[self.roles[POSITION_IDS][0]] = Tensor(self.position_ids[:, past_len:past_len + step_len], shared_memory=True)
+        if BEAM_IDX in self.roles:
+            inputs[self.roles[BEAM_IDX][0]] = Tensor(self.beam_idx, shared_memory=True)
+        return inputs
+
+    def infer_step(self, past_len, step_len):
+        start_time = time.perf_counter()
+        self.request.set_input_tensors(self.get_step_inputs(past_len, step_len))
+        self.request.infer()
+        return (time.perf_counter() - start_time) * 1000
+
+    def generate(self, statistics=None):
+        self.request.reset_state()
+        first_token_latency = self.infer_step(0, self.prompt_len)
+        measure_state = statistics is not None and self.state_sizes is None
+        prefill_state_size = get_state_size(self.request) if measure_state else 0
+        inter_token_latencies = LatencyHistogram()
+        for step in range(self.decode_steps):
+            inter_token_latencies.record(self.infer_step(self.prompt_len + step, 1))
+        if statistics is not None:
+            if measure_state:
+                self.state_sizes = (prefill_state_size, get_state_size(self.request))
+            statistics.add_sequence(first_token_latency, inter_token_latencies, self.state_sizes if measure_state else None)
+        return first_token_latency
+
+
+def run_generation(benchmark, args, statistics=None):
+    base_config = {}
+    if args.load_config:
+        load_config(args.load_config, base_config)
+    if args.cache_dir:
+        benchmark.set_cache_dir(args.cache_dir)
+    num_sequences = args.number_infer_requests or 1
+
+    model = benchmark.read_model(args.path_to_model)
+    roles = get_input_roles(model.inputs)
+    hint = args.perf_hint or ('latency' if num_sequences == 1 else 'throughput')
+    device_config = get_device_config(base_config.get(benchmark.device, {}), hint,
+                                      args.number_streams or None, str(args.number_threads) if args.number_threads else None, None)
+    compiled_model = benchmark.core.compile_model(model, benchmark.device, device_config)
+    requests = [compiled_model.create_infer_request() for _ in range(num_sequences)]
+    if not requests[0].query_state():
+        raise Exception("Model doesn't have states. Generation mode is supported for stateful models only.")
+    generators = [SequenceGenerator(request, roles, args.prompt_len, args.gen_tokens, seed)
+                  for seed, request in enumerate(requests)]
+    logger.info(f"Generation: {num_sequences} concurrent sequences of {args.prompt_len} prompt tokens "
+                f"and {args.gen_tokens} generated tokens, hint {hint}, streams {get_number_streams(compiled_model)}")
+
+    if not args.no_warmup:
+        logger.info(f"First token of the first sequence took {generators[0].generate():.2f} ms")
+
+    generation_statistics = GenerationStatistics()
+    lock = threading.Lock()
+    started_sequences = 0
+    start_time = time.perf_counter()
+
+    def generate_sequences(generator):
+        nonlocal started_sequences
+        while True:
+            # -niter limits the number of sequences, -t limits time to start new sequences
+            with lock:
+                if (benchmark.niter and started_sequences >= benchmark.niter) or \
+                   (benchmark.duration_seconds and time.perf_counter() - start_time >= benchmark.duration_seconds):
+                    return
+                started_sequences += 1
+            generator.generate(generation_statistics)
+
+    threads = [threading.Thread(target=generate_sequences, args=(generator,)) for generator in generators]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total_duration_sec = time.perf_counter() - start_time
+    if not generation_statistics.sequences:
+        raise Exception("No sequences were generated.")
+
+    first_token = generation_statistics.first_token_latencies
+    inter_token = generation_statistics.inter_token_latencies
+    tokens_per_second = generation_statistics.tokens / total_duration_sec
+    prefill_state_kb = np.mean(generation_statistics.prefill_state_sizes) / 1024
+    final_state_kb = np.mean(generation_statistics.final_state_sizes) / 1024
+    state_growth_kb = (final_state_kb - prefill_state_kb) / args.gen_tokens if args.gen_tokens else 0.
+    percentiles = sorted(set(args.report_percentiles + [args.latency_percentile]))
+
+    logger.info(f'Count:               {generation_statistics.sequences} sequences, {generation_statistics.tokens} tokens')
+    logger.info(f'Duration:            {get_duration_in_milliseconds(total_duration_sec):.2f} ms')
+    logger.info('Time to first token:')
+    logger.info(f'   {first_token.percentile(args.latency_percentile):.2f} ms ({args.latency_percentile} percentile), '
+                f'{first_token.avg:.2f} ms (avg), {first_token.min:.2f} ms (min), {first_token.max:.2f} ms (max)')
+    if inter_token:
+        logger.info('Inter-token latency:')
+        logger.info('   ' + ', '.join(f'{inter_token.percentile(percent):.2f} ms ({percent:g} percentile)' for percent in percentiles) +
+                    f', {inter_token.avg:.2f} ms (avg), {inter_token.min:.2f} ms (min), {inter_token.max:.2f} ms (max)')
+    logger.info(f'Throughput:          {tokens_per_second:.2f} tokens/s')
+    logger.info(f'State size:          {prefill_state_kb:.2f} KB after prompt, {final_state_kb:.2f} KB after generation, '
+                f'{state_growth_kb:.2f} KB per generated token')
+
+    if statistics:
+        statistics.add_parameters(StatisticsReport.Category.RUNTIME_CONFIG, [
+            ('number of concurrent sequences', str(num_sequences)),
+            ('prompt length', str(args.prompt_len)),
+            ('generated tokens', str(args.gen_tokens)),
+        ])
+        execution_results = [
+            ('total number of sequences', str(generation_statistics.sequences)),
+            ('total number of tokens', str(generation_statistics.tokens)),
+            ('total execution time (ms)', f'{get_duration_in_milliseconds(total_duration_sec):.2f}'),
+            (f'time to first token ({args.latency_percentile} percentile) (ms)', f'{first_token.percentile(args.latency_percentile):.2f}'),
+            ('avg time to first token (ms)', f'{first_token.avg:.2f}'),
+            ('max time to first token (ms)', f'{first_token.max:.2f}'),
+        ]
+        if inter_token:
+            execution_results += [(f'inter-token latency ({percent:g} percentile) (ms)', f'{inter_token.percentile(percent):.2f}')
+                                  for percent in percentiles]
+            execution_results += [
+                ('avg inter-token latency (ms)', f'{inter_token.avg:.2f}'),
+                ('max inter-token latency (ms)', f'{inter_token.max:.2f}'),
+            ]
+        execution_results += [
+            ('throughput (tokens/s)', f'{tokens_per_second:.2f}'),
+            ('state size after prompt (KB)', f'{prefill_state_kb:.2f}'),
+            ('state size after generation (KB)', f'{final_state_kb:.2f}'),
+            ('state growth per token (KB)', f'{state_growth_kb:.2f}'),
+        ]
+        statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS, execution_results)
+        statistics.dump()
@@ -1,11 +1,14 @@
 # Copyright (C) 2018-2026 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import os
 import sys
 import re
+import threading
 import numpy as np
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from importlib.util import find_spec
 
@@ -34,6 +37,8 @@ class DataQueue:
         self.index_map = defaultdict.fromkeys(input_data.keys(), 0)
         self.batch_sizes = batch_sizes
         self.size = len(batch_sizes)
+        # Number of iterations after which the sequence of shape groups repeats
+        self.cycle_size = self.size
         self.current_group_id = 0
 
     def get_next_input(self):
@@ -48,6 +53,30 @@ class DataQueue:
         return self.batch_sizes[self.current_group_id]
 
 
+class ShapeScheduleDataQueue(DataQueue):
+    """ Input data for the shape groups in order of the shape schedule.
+        Tensors are filled with random values once the group is met in the schedule for the first time,
+        so only buckets which are actually replayed take memory.
+    """
+    def __init__(self, app_input_info, shape_schedule):
+        super().__init__({}, get_group_batch_sizes(app_input_info))
+        self.app_input_info = app_input_info
+        self.shape_schedule = shape_schedule
+        self.group_tensors = {}
+        self.random_state = np.random.RandomState(np.random.MT19937(np.random.SeedSequence(0)))
+        self.current_group_id = next(self.shape_schedule)
+        # Groups don't repeat in a fixed cycle, so no additional iterations are needed to complete it
+        self.cycle_size = 1
+
+    def get_next_input(self):
+        group_id = self.current_group_id
+        if group_id not in self.group_tensors:
+            self.group_tensors[group_id] = {port: get_random_tensor(info, info.shapes[group_id % len(info.shapes)], self.random_state)
+                                            for port, info in enumerate(self.app_input_info)}
+        self.current_group_id = next(self.shape_schedule)
+        return self.group_tensors[group_id]
+
+
 def get_group_batch_sizes(app_input_info):
     batch_sizes = []
     niter = max(len(info.shapes) for info in app_input_info)
@@ -88,7 +117,12 @@ def verify_objects_to_be_used(objects_to_be_used_map: dict[str, list[str]], info
             logger.warning(f"Some {input_type_name} will be dublicated: {total_frames} is required, "
                             f"but only {objects_to_be_used_map[info.name]} were provided.")
 
-def get_input_data(paths_to_input, app_input_info):
+def get_input_data(paths_to_input, app_input_info, input_cache_dir='', shape_schedule=None):
+    if shape_schedule is not None:
+        logger.info("Fill inputs with random values of shapes from the shape distribution")
+        return ShapeScheduleDataQueue(app_input_info, shape_schedule)
+
+    cache = PreparedInputsCache(input_cache_dir) if input_cache_dir else None
     image_mapping, numpy_mapping, binary_mapping = get_input_file_mappings(paths_to_input, app_input_info)
 
     image_sizes = get_image_sizes(app_input_info)
@@ -124,7 +158,7 @@ def get_input_data(paths_to_input, app_input_info):
     data = {}
     for port, info in enumerate(app_input_info):
         if info.name in image_mapping:
-            data[port] = get_image_tensors(image_mapping[info.name][:images_to_be_used_map[info.name]], info, batch_sizes_map[info.name])
+            data[port] = get_image_tensors(image_mapping[info.name][:images_to_be_used_map[info.name]], info, batch_sizes_map[info.name], cache)
 
         elif info.name in numpy_mapping:
             data[port] = get_numpy_tensors(numpy_mapping[info.name][:numpys_to_be_used_map[info.name]], info, batch_sizes_map[info.name])
@@ -143,7 +177,82 @@ def get_input_data(paths_to_input, app_input_info):
     return DataQueue(data, get_group_batch_sizes(app_input_info))
 
 
-def get_image_tensors(image_paths: list[str], info: AppInputInfo, batch_sizes: list[int]) -> list[Tensor]:
+def set_initial_inputs(requests, data_queue, static_mode):
+    for request in requests:
+        data_tensors = data_queue.get_next_input()
+        for port, data_tensor in data_tensors.items():
+            input_tensor = request.get_input_tensor(port)
+            if not static_mode:
+                input_tensor.shape = data_tensor.shape
+            if not len(input_tensor.shape):
+                input_tensor.data.flat[:] = data_tensor.data
+            else:
+                input_tensor.data[:] = data_tensor.data
+
+
+class PreparedInputsCache:
+    """ On-disk cache of preprocessed input data.
+        Entries are keyed by the file path, its size and modification time and by the target
+        parameters of the input (shape, layout and type), so the cache is invalidated when any of them changes.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_path(self, filename, params):
+        stat = os.stat(filename)
+        key = repr((os.path.abspath(filename), stat.st_size, stat.st_mtime_ns) + tuple(params))
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.npy')
+
+    def load(self, filename, params):
+        path = self.get_path(filename, params)
+        if not os.path.exists(path):
+            return None
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            logger.warning(f"Cached input {path} for {filename} is corrupted and will be recreated")
+            return None
+
+    def store(self, filename, params, array):
+        path = self.get_path(filename, params)
+        # Write to a temporary file first, so parallel or interrupted runs never see a partial entry
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as file:
+            np.save(file, array)
+        os.replace(tmp_path, path)
+
+
+def read_image(image_filename: str, info: AppInputInfo, new_im_size, dtype, cache: PreparedInputsCache = None) -> np.ndarray:
+    cache_params = ('image', new_im_size, str(info.layout), str(info.channels), np.dtype(dtype).str)
+    if cache is not None:
+        image = cache.load(image_filename, cache_params)
+        if image is not None:
+            return image
+
+    logger.info(f'Prepare image {image_filename}')
+    image = cv2.imread(image_filename)
+    if new_im_size is None:
+        logger.info(f'Image will be processed with original shape - {image.shape[:-1]}')
+    elif image.shape[:-1] != new_im_size:
+        logger.warning(f"Image is resized from ({image.shape[:-1]}) to ({new_im_size})")
+        image = cv2.resize(image, new_im_size)
+
+    model_channel = int(str(info.channels))
+    image_channel = image.shape[-1]
+    if model_channel == 1 and image_channel == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    if model_channel == image_channel and str(info.layout) in ['[N,C,H,W]', '[C,H,W]']:
+        image = image.transpose((2, 0, 1))
+
+    image = np.ascontiguousarray(image, dtype=dtype)
+    if cache is not None:
+        cache.store(image_filename, cache_params, image)
+    return image
+
+
+def get_image_tensors(image_paths: list[str], info: AppInputInfo, batch_sizes: list[int], cache: PreparedInputsCache = None) -> list[Tensor]:
     if 'cv2' not in sys.modules:
         logger.error("Loading images requires the opencv-python or opencv-python-headless package. "
                      "Please install it before continuing or run benchmark without "
@@ -156,61 +265,56 @@ def get_image_tensors(image_paths: list[str], info: AppInputInfo, batch_sizes: l
     widths = info.widths if info.is_dynamic else [info.width]
     heights = info.heights if info.is_dynamic else [info.height]
     process_with_original_shapes = num_shapes == 0
+    dtype = get_dtype(info.element_type)
     tensors = []
 
     niter = max(num_shapes, num_images)
+    batches = []
     for i in range(niter):
-        shape = list(info.shapes[i % num_shapes]) if num_shapes else []
-        dtype = get_dtype(info.element_type)
-        images = np.ndarray(shape=shape, dtype=dtype)
-        image_index = processed_frames
         current_batch_size = 1 if process_with_original_shapes else batch_sizes[i % num_shapes]
-        for b in range(current_batch_size):
-            image_index %= num_images
-            image_filename = image_paths[image_index]
-            logger.info(f'Prepare image {image_filename}')
-            image = cv2.imread(image_filename)
-            if process_with_original_shapes:
-                logger.info(f'Image will be processed with original shape - {image.shape[:-1]}')
-            elif info.layout.has_name('H') and info.layout.has_name('W'):
-                new_im_size = (widths[i % num_shapes], heights[i % num_shapes])
-                if image.shape[:-1] != new_im_size:
-                    logger.warning(f"Image is resized from ({image.shape[:-1]}) to ({new_im_size})")
-                    image = cv2.resize(image, new_im_size)
-
-            model_channel = int(str(info.channels))
-            image_channel = image.shape[-1]
-            if model_channel == 1 and image_channel == 3:
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-            if model_channel == image_channel and str(info.layout) in ['[N,C,H,W]', '[C,H,W]']:
-                image = image.transpose((2, 0, 1))
-
-            if process_with_original_shapes:
-                if len(info.partial_shape) == 4:
-                    image = np.expand_dims(image, 0)
-                p_shape = PartialShape(image.shape)
-                if info.partial_shape.compatible(p_shape):
-                    info.data_shapes.append(p_shape.to_shape())
-                else:
-                    raise Exception(f"Data shape '{str(p_shape)}' provided for input '{info.name}' "
-                                    f"is not compatible with partial shape '{str(info.partial_shape)}' for this input.")
-                tensors.append(Tensor(image.astype(dtype)))
-            else:
-                try:
-                    if 3 == images[b].ndim and 1 == images[b].shape[2] and 2 == image.ndim:
-                        # The model last dim has length 1, which means it takes greyscale images.
-                        # Extend input image dims to match it
-                        images[b] = image[:, :, None]
-                    else:
-                        images[b] = image
-                except ValueError:
-                    raise Exception(f"Image shape {image.shape} is not compatible with input shape {shape}! "
-                                    f"Make sure -i parameter is valid.")
-            image_index += 1
+        new_im_size = None
+        if not process_with_original_shapes and info.layout.has_name('H') and info.layout.has_name('W'):
+            new_im_size = (widths[i % num_shapes], heights[i % num_shapes])
+        batches.append([(image_paths[(processed_frames + b) % num_images], new_im_size) for b in range(current_batch_size)])
         processed_frames += current_batch_size
-        if not process_with_original_shapes:
-            tensors.append(Tensor(images))
+
+    # Every image is decoded once per target size, OpenCV releases GIL, so images are decoded in parallel
+    images_to_read = list(dict.fromkeys(image for batch in batches for image in batch))
+    with ThreadPoolExecutor() as executor:
+        prepared_images = dict(zip(images_to_read, executor.map(
+            lambda image: read_image(image[0], info, image[1], dtype, cache), images_to_read)))
+
+    for i, batch in enumerate(batches):
+        if process_with_original_shapes:
+            image = prepared_images[batch[0]]
+            if len(info.partial_shape) == 4:
+                image = np.expand_dims(image, 0)
+            p_shape = PartialShape(image.shape)
+            if info.partial_shape.compatible(p_shape):
+                info.data_shapes.append(p_shape.to_shape())
+            else:
+                raise Exception(f"Data shape '{str(p_shape)}' provided for input '{info.name}' "
+                                f"is not compatible with partial shape '{str(info.partial_shape)}' for this input.")
+            tensors.append(Tensor(np.array(image)))
+            continue
+
+        shape = list(info.shapes[i % num_shapes])
+        # Images are written straight into the memory of the tensor
+        tensor = Tensor(info.element_type, shape)
+        images = tensor.data
+        for b, image_key in enumerate(batch):
+            image = prepared_images[image_key]
+            try:
+                if 3 == images[b].ndim and 1 == images[b].shape[2] and 2 == image.ndim:
+                    # The model last dim has length 1, which means it takes greyscale images.
+                    # Extend input image dims to match it
+                    images[b] = image[:, :, None]
+                else:
+                    images[b] = image
+            except ValueError:
+                raise Exception(f"Image shape {image.shape} is not compatible with input shape {shape}! "
+                                f"Make sure -i parameter is valid.")
+        tensors.append(tensor)
     return tensors
 
 
@@ -222,12 +326,16 @@ def get_numpy_tensors(numpy_paths: list[str], info: AppInputInfo, batch_sizes: l
     processed_frames = 0
     process_with_original_shapes = num_shapes == 0
     tensors = []
+    # Files are memory-mapped, so only data copied into tensors is read
+    mapped_arrays = {}
 
     niter = max(num_shapes, num_arrays)
     for i in range(niter):
         shape = list(info.shapes[i % num_shapes]) if num_shapes else []
         dtype = get_dtype(info.element_type)
-        numpy_arrays = np.ndarray(shape=shape, dtype=dtype)
+        if not process_with_original_shapes:
+            tensor = Tensor(info.element_type, shape)
+            numpy_arrays = tensor.data
         numpy_index = processed_frames
 
         current_batch_size = 1 if process_with_original_shapes \
@@ -238,7 +346,9 @@ def get_numpy_tensors(numpy_paths: list[str], info: AppInputInfo, batch_sizes: l
             numpy_filename: str = numpy_paths[numpy_index]
             extension = numpy_filename.lower().split('.')[-1]
             if extension == "npy":
-                numpy_arr: np.ndarray = np.load(numpy_filename)
+                if numpy_filename not in mapped_arrays:
+                    mapped_arrays[numpy_filename] = np.load(numpy_filename, mmap_mode='r')
+                numpy_arr: np.ndarray = mapped_arrays[numpy_filename]
 
                 if list(numpy_arr.shape) != shape and not process_with_original_shapes:
                     raise Exception(
@@ -261,13 +371,13 @@ def get_numpy_tensors(numpy_paths: list[str], info: AppInputInfo, batch_sizes: l
                     else:
                         raise Exception(f"Data shape '{str(p_shape)}' provided for input '{info.name}' "
                                         f"is not compatible with partial shape '{str(info.partial_shape)}' for this input.")
-                    tensors.append(Tensor(numpy_arr))
+                    tensors.append(Tensor(np.array(numpy_arr)))
                 else:
                     try:
                         if info.layout.has_name("N"):
                             numpy_arrays[[None] * info.layout.get_index_by_name("N") + [b]] = numpy_arr[b]
                         else:
-                            numpy_arrays = numpy_arr
+                            numpy_arrays[...] = numpy_arr
                     except ValueError:
                         raise Exception(f"Numpy array shape {numpy_arr.shape} is not compatible with input shape {shape}! "
                                         f"Make sure -i parameter is valid.")
@@ -278,7 +388,7 @@ def get_numpy_tensors(numpy_paths: list[str], info: AppInputInfo, batch_sizes: l
 
         processed_frames += current_batch_size
         if not process_with_original_shapes:
-            tensors.append(Tensor(numpy_arrays))
+            tensors.append(tensor)
 
     return tensors
 
@@ -288,6 +398,8 @@ def get_binary_tensors(binary_paths: list[str], info: AppInputInfo, batch_sizes:
     niter = max(num_shapes, num_binaries)
     processed_frames = 0
     tensors = []
+    # Files are memory-mapped once instead of being read for every batch slot
+    mapped_binaries = {}
     for i in range(niter):
         shape_id = i % num_shapes
         dtype = np.uint8() if info.element_type.bitwidth < 8 else get_dtype(info.element_type)
@@ -305,11 +417,13 @@ def get_binary_tensors(binary_paths: list[str], info: AppInputInfo, batch_sizes:
                 if blob_bit_size != binary_file_bit_size:
                     raise Exception(
                         f"File {binary_filename} contains {binary_file_bit_size} bites but model expects {blob_bit_size}")
-                from_file = np.fromfile(binary_filename, dtype)
+                if binary_filename not in mapped_binaries:
+                    mapped_binaries[binary_filename] = np.memmap(binary_filename, dtype, mode='r')
+                from_file = mapped_binaries[binary_filename]
                 if info.layout.has_name("N"):
                     binaries[[None] * info.layout.get_index_by_name("N") + [b]] = from_file[b]
                 else:
-                    binaries = from_file
+                    binaries = np.array(from_file)
             else:
                 raise Exception(
                     f"Unsupported binary file type: {extension}")
@@ -351,28 +465,25 @@ def get_random_4bit_tensor(shape, element_type, rs):
     rr = np.packbits(rand_data)
     return Tensor(rr, shape, element_type)
 
-def fill_tensors_with_random(layer):
+def get_random_tensor(layer, shape, rs):
     is_4bit = layer.element_type.bitwidth == 4
     dtype = np.uint8 if is_4bit else get_dtype(layer.element_type)
     rand_min, rand_max = (0, 1) if dtype == bool else (np.iinfo(np.uint8).min, np.iinfo(np.uint8).max)
     # np.random.uniform excludes high: add 1 to have it generated
     if np.dtype(dtype).kind in ['i', 'u', 'b']:
         rand_max += 1
+    if shape:
+        if is_4bit:
+            return get_random_4bit_tensor(shape, layer.element_type, rs)
+        return Tensor(rs.uniform(rand_min, rand_max, list(shape)).astype(dtype))
+    if is_4bit:
+        return get_random_4bit_tensor([1], layer.element_type, rs)
+    return Tensor(np.ndarray([], dtype, np.array(rs.uniform(rand_min, rand_max)).astype(dtype)))
+
+
+def fill_tensors_with_random(layer):
     rs = np.random.RandomState(np.random.MT19937(np.random.SeedSequence(0)))
-    input_tensors = []
-    for shape in layer.shapes:
-        if shape:
-            if is_4bit:
-                ov_tensor = get_random_4bit_tensor(shape, layer.element_type, rs)
-            else:
-                ov_tensor = Tensor(rs.uniform(rand_min, rand_max, list(shape)).astype(dtype))
-        else:
-            if is_4bit:
-                ov_tensor = get_random_4bit_tensor([1], layer.element_type, rs)
-            else:
-                ov_tensor = Tensor(np.ndarray([], dtype, np.array(rs.uniform(rand_min, rand_max)).astype(dtype)))
-        input_tensors.append(ov_tensor)
-    return input_tensors
+    return [get_random_tensor(layer, shape, rs) for shape in layer.shapes]
 
 
 def get_input_file_mappings(paths_to_inputs, app_input_info):
@@ -0,0 +1,116 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+from math import ceil
+
+# Relative error of reported latencies
+HISTOGRAM_PRECISION = 0.01
+# Latencies below 1 microsecond are counted in the first bucket
+HISTOGRAM_LOWEST_MS = 1e-3
+TIMELINE_PERCENTILES = [50, 90, 99]
+
+
+class LatencyHistogram:
+    """ Log-bucketed (HDR-style) histogram of latencies in milliseconds.
+        Memory doesn't depend on the number of recorded values: bucket i counts values in
+        [lowest * base^i, lowest * base^(i+1)), so percentiles are reported with relative error
+        below precision, while count, average, min and max are exact.
+    """
+    def __init__(self, precision=HISTOGRAM_PRECISION, lowest=HISTOGRAM_LOWEST_MS):
+        self.precision = precision
+        self.lowest = lowest
+        self.log_base = math.log1p(2 * precision)
+        self.counts = []
+        self.count = 0
+        self.total = 0.
+        self.min = math.inf
+        self.max = 0.
+
+    def __len__(self):
+        return self.count
+
+    def record(self, value):
+        index = int(math.log(value / self.lowest) / self.log_base) if value > self.lowest else 0
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def avg(self):
+        return self.total / self.count
+
+    def percentile(self, percent):
+        """ Return the value below which percent of recorded values fall, percent is any number in (0, 100]. """
+        rank = max(ceil(self.count * percent / 100), 1)
+        if rank >= self.count:
+            return self.max
+        accumulated = 0
+        for index, count in enumerate(self.counts):
+            accumulated += count
+            if accumulated >= rank:
+                # Geometric middle of the bucket, clamped by the exact extremes
+                value = self.lowest * math.exp((index + 0.5) * self.log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class Timeline:
+    """ Throughput and latency of inference aggregated per interval of interval_sec seconds.
+        Intervals without completed requests are kept, so stalls are visible in the report.
+    """
+    def __init__(self, interval_sec=1.):
+        self.interval_sec = interval_sec
+        self.intervals = []
+        self.start_time = None
+        self._histogram = LatencyHistogram()
+        self._frames = 0
+
+    def start(self, start_time):
+        self.start_time = start_time
+
+    def record(self, latency_ms, frames, timestamp):
+        index = int((timestamp - self.start_time) / self.interval_sec)
+        while len(self.intervals) < index:
+            self._close_interval(self.interval_sec)
+        self._histogram.record(latency_ms)
+        self._frames += frames
+
+    def finish(self, end_time):
+        duration_sec = end_time - self.start_time
+        index = int(duration_sec / self.interval_sec)
+        while len(self.intervals) < index:
+            self._close_interval(self.interval_sec)
+        last_interval_sec = duration_sec - len(self.intervals) * self.interval_sec
+        if self._histogram or last_interval_sec > 0:
+            self._close_interval(max(last_interval_sec, 1e-9))
+
+    def _close_interval(self, duration_sec):
+        histogram = self._histogram
+        interval = {
+            'time (s)': f'{len(self.intervals) * self.interval_sec + duration_sec:.3f}',
+            'iterations': str(histogram.count),
+            'throughput': f'{self._frames / duration_sec:.2f}',
+        }
+        if histogram:
+            interval['avg latency'] = f'{histogram.avg:.2f}'
+            for percent in TIMELINE_PERCENTILES:
+                interval[f'latency ({percent} percentile) (ms)'] = f'{histogram.percentile(percent):.2f}'
+            interval['max latency'] = f'{histogram.max:.2f}'
+        self.intervals.append(interval)
+        self._histogram = LatencyHistogram()
+        self._frames = 0
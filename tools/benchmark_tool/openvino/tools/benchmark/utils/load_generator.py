@@ -0,0 +1,54 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from itertools import count
+
+CONSTANT_ARRIVAL = 'constant'
+POISSON_ARRIVAL = 'poisson'
+TRACE_ARRIVAL = 'trace'
+ARRIVAL_PROCESSES = [CONSTANT_ARRIVAL, POISSON_ARRIVAL, TRACE_ARRIVAL]
+
+# Fixed seed keeps Poisson schedules reproducible between runs
+POISSON_SEED = 0
+
+
+def read_arrival_trace(path_to_trace):
+    """ Read request send times in seconds, one per line, and return offsets from the first one.
+        Empty lines and lines starting with '#' are skipped.
+    """
+    timestamps = []
+    with open(path_to_trace, 'r') as trace_file:
+        for line_number, line in enumerate(trace_file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                timestamps.append(float(line.split(',')[0]))
+            except ValueError:
+                raise RuntimeError(f"Incorrect timestamp '{line}' at line {line_number} of arrival trace {path_to_trace}")
+    if not timestamps:
+        raise RuntimeError(f"Arrival trace {path_to_trace} doesn't contain timestamps")
+    timestamps.sort()
+    return [timestamp - timestamps[0] for timestamp in timestamps]
+
+
+def get_arrival_schedule(arrival_process, arrival_rate=0, path_to_trace=None):
+    """ Return an iterator over intended send times of requests in seconds from the start of measurements.
+        The schedule is independent of request completions (open-loop load).
+    """
+    if arrival_process == CONSTANT_ARRIVAL:
+        return (i / arrival_rate for i in count())
+    if arrival_process == POISSON_ARRIVAL:
+        return poisson_schedule(arrival_rate)
+    if arrival_process == TRACE_ARRIVAL:
+        return iter(read_arrival_trace(path_to_trace))
+    raise RuntimeError(f"Unknown arrival process '{arrival_process}'. Supported values: {', '.join(ARRIVAL_PROCESSES)}")
+
+
+def poisson_schedule(arrival_rate):
+    generator = random.Random(POISSON_SEED)
+    send_time = 0.
+    while True:
+        yield send_time
+        send_time += generator.expovariate(arrival_rate)
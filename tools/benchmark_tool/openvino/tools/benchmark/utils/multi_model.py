@@ -0,0 +1,172 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import threading
+import time
+
+from ..benchmark import Benchmark
+from .inputs_filling import get_input_data, set_initial_inputs
+from .latency_histogram import LatencyHistogram
+from .logging import logger
+from .statistics_report import StatisticsReport
+from .sweep import PERFORMANCE_HINTS, get_device_config, get_number_streams
+from .utils import get_inputs_info, get_network_batch_size, pre_post_processing, get_number_iterations, \
+    get_latency_groups, check_for_static, can_measure_as_static, get_duration_in_milliseconds, get_paths_to_input, load_config
+
+MULTI_MODEL_OPTIONS = ['m', 'd', 'hint', 'nstreams', 'nthreads', 'nireq', 'b', 'shape', 'data_shape', 'layout', 'i']
+
+
+def read_multi_model_config(path_to_config):
+    """ Read a JSON list of models with their options named as command line options, for example:
+        [{"m": "model1.xml", "hint": "latency", "nireq": 2}, {"m": "model2.xml", "b": 4, "i": "images/"}]
+    """
+    with open(path_to_config, 'r') as config_file:
+        models = json.load(config_file)
+    if not isinstance(models, list) or not models:
+        raise RuntimeError(f"Multi-model configuration {path_to_config} should contain a non-empty list of models")
+    for model_options in models:
+        if not isinstance(model_options, dict) or 'm' not in model_options:
+            raise RuntimeError(f"Every model in {path_to_config} should be an object with a path to the model in 'm' key")
+        unknown_options = set(model_options) - set(MULTI_MODEL_OPTIONS)
+        if unknown_options:
+            raise RuntimeError(f"Unknown options {', '.join(sorted(unknown_options))} of model {model_options['m']}. "
+                               f"Supported options: {', '.join(MULTI_MODEL_OPTIONS)}")
+        if model_options.get('hint', 'none') not in PERFORMANCE_HINTS:
+            raise RuntimeError(f"Incorrect performance hint {model_options['hint']} of model {model_options['m']}. "
+                               f"Supported values: {', '.join(PERFORMANCE_HINTS)}")
+    return models
+
+
+class ModelBenchmark:
+    """ One of the models benchmarked concurrently on a shared Core, with its own infer requests and input data. """
+    def __init__(self, index, options, args, core, base_config):
+        self.name = f"{index}:{os.path.basename(options['m'])}"
+        self.latency_percentile = args.latency_percentile
+        self.benchmark = Benchmark(options.get('d', args.target_device), int(options.get('nireq', args.number_infer_requests)),
+                                   args.number_iterations, args.time, 'async', args.inference_only,
+                                   timeline_interval=args.timeline_interval, core=core)
+        self.results = None
+        self.error = None
+
+        nstreams = options.get('nstreams', args.number_streams)
+        nthreads = options.get('nthreads', args.number_threads)
+        hint = options.get('hint', args.perf_hint or ('none' if 'nstreams' in options or 'nthreads' in options else 'throughput'))
+        batch = str(options.get('b', args.batch_size))
+
+        model = self.benchmark.read_model(options['m'])
+        for port in model.inputs:
+            if not port.get_names():
+                port.set_names({port.node.get_friendly_name()})
+        app_inputs_info, reshape = get_inputs_info(options.get('shape', args.shape), options.get('data_shape', args.data_shape),
+                                                   options.get('layout', args.layout), batch,
+                                                   args.scale_values, args.mean_values, model.inputs)
+        if reshape:
+            model.reshape({info.name: info.partial_shape for info in app_inputs_info})
+        pre_post_processing(model, app_inputs_info, args.input_precision, args.output_precision, args.input_output_precision)
+        self.batch_size = get_network_batch_size(app_inputs_info)
+
+        device_config = get_device_config(base_config.get(self.benchmark.device, {}), hint,
+                                          None if nstreams is None else str(nstreams),
+                                          str(nthreads) if nthreads else None, batch)
+        self.compiled_model = core.compile_model(model, self.benchmark.device, device_config)
+        self.nstreams = get_number_streams(self.compiled_model)
+        self.requests = self.benchmark.create_infer_requests(self.compiled_model)
+
+        paths_to_input = args.paths_to_input
+        if 'i' in options:
+            paths_to_input = [[path] for path in ([options['i']] if isinstance(options['i'], str) else options['i'])]
+        self.data_queue = get_input_data(get_paths_to_input(paths_to_input), app_inputs_info, args.input_cache_dir)
+
+        static_mode = check_for_static(app_inputs_info)
+        if args.inference_only is None:
+            self.benchmark.inference_only = static_mode
+        elif args.inference_only and not can_measure_as_static(app_inputs_info):
+            raise Exception(f"Benchmarking dynamic model {self.name} available with input filling in measurement loop only!")
+        self.benchmark.latency_groups = get_latency_groups(app_inputs_info)
+        self.benchmark.niter = get_number_iterations(self.benchmark.niter, self.benchmark.nireq,
+                                                     max(len(info.shapes) for info in app_inputs_info), 'async')
+        set_initial_inputs(self.requests, self.data_queue, static_mode)
+        logger.info(f"Model {self.name}: device {self.benchmark.device}, hint {hint}, streams {self.nstreams}, "
+                    f"infer requests {self.benchmark.nireq}, batch {self.batch_size}")
+
+    def run(self, start_barrier):
+        start_barrier.wait()
+        try:
+            self.results = self.benchmark.main_loop(self.requests, self.data_queue, self.batch_size, self.latency_percentile, False)
+        except Exception as e:
+            self.error = e
+
+
+def run_multi_model(benchmark, args, statistics=None):
+    base_config = {}
+    if args.load_config:
+        load_config(args.load_config, base_config)
+    if args.cache_dir:
+        benchmark.set_cache_dir(args.cache_dir)
+
+    models = [ModelBenchmark(index, options, args, benchmark.core, base_config)
+              for index, options in enumerate(read_multi_model_config(args.multi_model))]
+    if not args.no_warmup:
+        for model in models:
+            logger.info(f"First inference of model {model.name} took {model.benchmark.first_infer(model.requests):.2f} ms")
+
+    # All models start measurements at once to see how they interfere with each other
+    start_barrier = threading.Barrier(len(models) + 1)
+    threads = [threading.Thread(target=model.run, args=(start_barrier,)) for model in models]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    total_duration_sec = time.perf_counter() - start_time
+    for model in models:
+        if model.error is not None:
+            raise Exception(f"Benchmarking of model {model.name} failed: {model.error}") from model.error
+
+    latency_key = f'latency ({args.latency_percentile} percentile) (ms)'
+    total_latencies = LatencyHistogram()
+    total_frames = 0
+    execution_results = []
+    for model in models:
+        fps, percentile_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, duration_sec, iteration = model.results
+        total_latencies.merge(model.benchmark.latencies)
+        total_frames += fps * duration_sec
+        logger.info(f"Model {model.name}:")
+        logger.info(f'   Count:         {iteration} iterations')
+        logger.info(f'   Duration:      {get_duration_in_milliseconds(duration_sec):.2f} ms')
+        logger.info(f'   Latency:       {percentile_latency_ms:.2f} ms ({args.latency_percentile} percentile), '
+                    f'{avg_latency_ms:.2f} ms (avg), {min_latency_ms:.2f} ms (min), {max_latency_ms:.2f} ms (max)')
+        logger.info(f'   Throughput:    {fps:.2f} FPS')
+        execution_results += [
+            (f'{model.name} total number of iterations', str(iteration)),
+            (f'{model.name} {latency_key}', f'{percentile_latency_ms:.2f}'),
+            (f'{model.name} avg latency', f'{avg_latency_ms:.2f}'),
+            (f'{model.name} min latency', f'{min_latency_ms:.2f}'),
+            (f'{model.name} max latency', f'{max_latency_ms:.2f}'),
+            (f'{model.name} throughput', f'{fps:.2f}'),
+        ]
+
+    total_fps = total_frames / total_duration_sec
+    logger.info("All models:")
+    logger.info(f'   Duration:      {get_duration_in_milliseconds(total_duration_sec):.2f} ms')
+    logger.info(f'   Latency:       {total_latencies.percentile(args.latency_percentile):.2f} ms ({args.latency_percentile} percentile), '
+                f'{total_latencies.avg:.2f} ms (avg), {total_latencies.min:.2f} ms (min), {total_latencies.max:.2f} ms (max)')
+    logger.info(f'   Throughput:    {total_fps:.2f} FPS')
+
+    if statistics:
+        statistics.add_parameters(StatisticsReport.Category.RUNTIME_CONFIG,
+                                  [(f'{model.name} number of parallel infer requests', str(model.benchmark.nireq))
+                                   for model in models] +
+                                  [(f'{model.name} number of streams', model.nstreams) for model in models])
+        statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS, execution_results + [
+            ('total execution time (ms)', f'{get_duration_in_milliseconds(total_duration_sec):.2f}'),
+            (latency_key, f'{total_latencies.percentile(args.latency_percentile):.2f}'),
+            ('avg latency', f'{total_latencies.avg:.2f}'),
+            ('min latency', f'{total_latencies.min:.2f}'),
+            ('max latency', f'{total_latencies.max:.2f}'),
+            ('throughput', f'{total_fps:.2f}'),
+        ])
+        statistics.dump()
@@ -0,0 +1,203 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from datetime import timedelta
+
+import numpy as np
+
+from .logging import logger
+
+PERF_COUNTERS_DIFF_REPORT_NAME = 'benchmark_perf_counters_diff.json'
+# Number of random permutations of samples used to estimate significance of differences
+PERMUTATIONS = 2000
+PERMUTATIONS_CHUNK = 100
+PERMUTATIONS_SEED = 0
+
+
+class PerfCounters:
+    """ Per-layer performance counters of several samples (infer requests or runs) stored as matrices.
+        real_time and cpu_time have a row per sample and a column per layer, times are in milliseconds.
+        Layers which were not reported in a sample have zero time.
+    """
+    def __init__(self, names, node_types, exec_types, real_time, cpu_time):
+        self.names = np.asarray(names, dtype=str)
+        self.node_types = np.asarray(node_types, dtype=str)
+        self.exec_types = np.asarray(exec_types, dtype=str)
+        self.real_time = np.asarray(real_time, dtype=np.float64).reshape(-1, len(self.names))
+        self.cpu_time = np.asarray(cpu_time, dtype=np.float64).reshape(-1, len(self.names))
+
+    @classmethod
+    def from_profiling_info(cls, prof_info_list):
+        layer_ids = {}
+        layers = []
+        for prof_info in prof_info_list:
+            for pi in prof_info:
+                if pi.node_name not in layer_ids:
+                    layer_ids[pi.node_name] = len(layers)
+                    layers.append((pi.node_name, pi.node_type, pi.exec_type))
+        real_time = np.zeros((len(prof_info_list), len(layers)))
+        cpu_time = np.zeros((len(prof_info_list), len(layers)))
+        for sample, prof_info in enumerate(prof_info_list):
+            columns = [layer_ids[pi.node_name] for pi in prof_info]
+            real_time[sample, columns] = [pi.real_time / timedelta(milliseconds=1) for pi in prof_info]
+            cpu_time[sample, columns] = [pi.cpu_time / timedelta(milliseconds=1) for pi in prof_info]
+        names, node_types, exec_types = zip(*layers) if layers else ((), (), ())
+        return cls(names, node_types, exec_types, real_time, cpu_time)
+
+    @classmethod
+    def load(cls, paths):
+        """ Load counters stored by save() and concatenate samples of all files. """
+        counters = []
+        for path in paths:
+            with np.load(path) as data:
+                counters.append(cls(data['names'], data['node_types'], data['exec_types'], data['real_time'], data['cpu_time']))
+        result = counters[0]
+        for other in counters[1:]:
+            result = result.concatenate(other)
+        return result
+
+    def save(self, path):
+        np.savez_compressed(path, names=self.names, node_types=self.node_types, exec_types=self.exec_types,
+                            real_time=self.real_time.astype(np.float32), cpu_time=self.cpu_time.astype(np.float32))
+        logger.info(f"Performance counters of {self.num_samples} samples are stored to {path}")
+
+    @property
+    def num_samples(self):
+        return self.real_time.shape[0]
+
+    def align(self, names):
+        """ Return counters of the given layers in the given order, absent layers have zero time. """
+        positions = {name: i for i, name in enumerate(self.names)}
+        columns = np.array([positions.get(name, -1) for name in names], dtype=np.int64)
+        present = columns >= 0
+
+        def take(array, fill):
+            result = np.full(array.shape[:-1] + (len(names),), fill, dtype=array.dtype)
+            result[..., present] = array[..., columns[present]]
+            return result
+        return PerfCounters(names, take(self.node_types, ''), take(self.exec_types, ''),
+                            take(self.real_time, 0.), take(self.cpu_time, 0.))
+
+    def concatenate(self, other):
+        names = list(dict.fromkeys(list(self.names) + list(other.names)))
+        first, second = self.align(names), other.align(names)
+        return PerfCounters(names, np.where(first.node_types != '', first.node_types, second.node_types),
+                            np.where(first.exec_types != '', first.exec_types, second.exec_types),
+                            np.concatenate([first.real_time, second.real_time]),
+                            np.concatenate([first.cpu_time, second.cpu_time]))
+
+
+def get_permutation_p_values(base, new):
+    """ Two-sided p-values of the difference of means of every column estimated with random permutations of samples. """
+    samples = np.concatenate([base, new])
+    num_base = base.shape[0]
+    observed = np.abs(new.mean(axis=0) - base.mean(axis=0))
+    rs = np.random.RandomState(np.random.MT19937(np.random.SeedSequence(PERMUTATIONS_SEED)))
+    extreme = np.zeros(samples.shape[1])
+    total = samples.sum(axis=0)
+    for start in range(0, PERMUTATIONS, PERMUTATIONS_CHUNK):
+        count = min(PERMUTATIONS_CHUNK, PERMUTATIONS - start)
+        permutations = np.argsort(rs.random_sample((count, samples.shape[0])), axis=1)
+        base_sums = samples[permutations[:, :num_base]].sum(axis=1)
+        differences = (total - base_sums) / new.shape[0] - base_sums / num_base
+        # Small tolerance keeps permutations equal to the observed split from being lost to rounding
+        extreme += (np.abs(differences) >= observed - 1e-9).sum(axis=0)
+    return (extreme + 1) / (PERMUTATIONS + 1)
+
+
+def group_by_type(node_types, real_time):
+    type_names, inverse = np.unique(node_types, return_inverse=True)
+    type_time = np.zeros((real_time.shape[0], len(type_names)))
+    np.add.at(type_time, (slice(None), inverse), real_time)
+    return type_names, type_time
+
+
+def compare_columns(names, base, new, alpha, threshold):
+    base_mean, new_mean = base.mean(axis=0), new.mean(axis=0)
+    delta = new_mean - base_mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(base_mean > 0, delta / base_mean, np.where(delta > 0, np.inf, 0.))
+    p_values = get_permutation_p_values(base, new)
+    regression = (p_values < alpha) & (relative > threshold)
+    improvement = (p_values < alpha) & (relative < -threshold)
+    total_regression = delta[regression].sum()
+    rows = []
+    for i in np.argsort(-delta):
+        rows.append({
+            'name': str(names[i]),
+            'base real_time (ms)': round(float(base_mean[i]), 4),
+            'new real_time (ms)': round(float(new_mean[i]), 4),
+            'delta (ms)': round(float(delta[i]), 4),
+            'delta (%)': round(float(relative[i]) * 100, 2) if np.isfinite(relative[i]) else None,
+            'p-value': round(float(p_values[i]), 4),
+            'status': 'regression' if regression[i] else 'improvement' if improvement[i] else 'same',
+            'share of regression (%)': round(float(delta[i] / total_regression) * 100, 2) if regression[i] and total_regression > 0 else 0.,
+        })
+    return rows
+
+
+def diff_perf_counters(base, new, alpha=0.05, threshold=0.05):
+    """ Compare per-layer and per-type real time of two sets of counters.
+        A layer is flagged when its mean time grows by more than threshold and the permutation test
+        rejects equal means at alpha level, so noise between samples isn't reported as a regression.
+    """
+    names = list(dict.fromkeys(list(base.names) + list(new.names)))
+    base, new = base.align(names), new.align(names)
+    # Layers absent in one of the runs have empty types after alignment
+    node_types = np.where(new.node_types != '', new.node_types, base.node_types)
+    exec_types = np.where(new.exec_types != '', new.exec_types, base.exec_types)
+    type_names, base_type_time = group_by_type(node_types, base.real_time)
+    _, new_type_time = group_by_type(node_types, new.real_time)
+
+    layers = compare_columns(names, base.real_time, new.real_time, alpha, threshold)
+    columns = {name: i for i, name in enumerate(names)}
+    for layer in layers:
+        column = columns[layer['name']]
+        layer['node_type'] = str(node_types[column])
+        layer['exec_type'] = str(exec_types[column])
+        if base.node_types[column] == '':
+            layer['status'] += ' (new layer)'
+        elif new.node_types[column] == '':
+            layer['status'] += ' (removed layer)'
+
+    base_total, new_total = base.real_time.sum(axis=1), new.real_time.sum(axis=1)
+    total = compare_columns(['total'], base_total[:, None], new_total[:, None], alpha, threshold)[0]
+    return {
+        'base samples': base.num_samples,
+        'new samples': new.num_samples,
+        'significance level': alpha,
+        'threshold (%)': threshold * 100,
+        'total': total,
+        'node types': compare_columns(type_names, base_type_time, new_type_time, alpha, threshold),
+        'layers': layers,
+    }
+
+
+def print_perf_counters_diff(diff, max_layers=20):
+    total = diff['total']
+    logger.info(f"Total real time: {total['base real_time (ms)']:.3f} ms -> {total['new real_time (ms)']:.3f} ms "
+                f"({total['delta (%)']}%, p-value {total['p-value']}) on {diff['base samples']} and {diff['new samples']} samples")
+    for title, rows in (('Node types', diff['node types']), ('Layers', diff['layers'])):
+        regressions = [row for row in rows if row['status'].startswith('regression')]
+        improvements = [row for row in rows if row['status'].startswith('improvement')]
+        logger.info(f"{title}: {len(regressions)} regressed, {len(improvements)} improved")
+        for row in regressions[:max_layers]:
+            relative = 'new' if row['delta (%)'] is None else f"{row['delta (%)']:+.1f}%"
+            logger.info(f"   {row['name'][:40]:<40} {row['base real_time (ms)']:>10.3f} -> {row['new real_time (ms)']:<10.3f} ms "
+                        f"{relative:>9} p-value {row['p-value']:<7} {row['share of regression (%)']:.1f}% of regression")
+        if len(regressions) > max_layers:
+            logger.info(f"   ... {len(regressions) - max_layers} more")
+
+
+def run_perf_counters_diff(args):
+    base = PerfCounters.load(args.pc_diff[0].split(','))
+    new = PerfCounters.load(args.pc_diff[1].split(','))
+    diff = diff_perf_counters(base, new, args.pc_diff_alpha, args.pc_diff_threshold / 100)
+    print_perf_counters_diff(diff)
+    report_path = os.path.join(args.report_folder, PERF_COUNTERS_DIFF_REPORT_NAME)
+    with open(report_path, 'w') as file:
+        json.dump(diff, file, indent=4)
+    logger.info(f"Performance counters diff is stored to {report_path}")
+    return diff
@@ -0,0 +1,175 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+from datetime import datetime
+
+from openvino import InferRequest
+
+from .latency_histogram import LatencyHistogram
+from .logging import logger
+from .statistics_report import StatisticsReport
+
+# Stages reported by the stage hooks of InferRequest.infer and AsyncInferQueue.start_async
+# and stages measured around these calls
+SYNC_STAGES = [
+    'input dispatch',
+    'native infer call',
+    'inference (C++ latency)',
+    'native binding overhead',
+    'results wrapping',
+    'outputs conversion',
+    'total',
+    'python overhead',
+]
+ASYNC_STAGES = [
+    'idle request wait',
+    'request wrapper lookup',
+    'input dispatch',
+    'native start_async call',
+    'submission',
+    'inference (C++ latency)',
+    'submission to callback',
+    'completion overhead',
+    'python overhead',
+]
+WRAPPER_STAGE = 'InferRequest wrapper creation'
+WRAPPER_ITERATIONS = 1000
+PERCENTILES = [50, 99]
+
+
+def new_histograms(stages):
+    # Python overhead is reported in microseconds
+    return {stage: LatencyHistogram() for stage in stages}
+
+
+def record_stages(stages, timestamps):
+    for stage, (start, end) in timestamps.items():
+        stages[stage].record((end - start) * 1e6)
+
+
+def is_running(benchmark, iteration, start_time):
+    return (benchmark.niter and iteration < benchmark.niter) or \
+           (benchmark.duration_seconds and (datetime.utcnow() - start_time).total_seconds() < benchmark.duration_seconds)
+
+
+def profile_sync_infer(benchmark, request, data_queue):
+    stages = new_histograms(SYNC_STAGES)
+    timestamps = {}
+    request._stage_hook = timestamps.update
+    iteration = 0
+    start_time = datetime.utcnow()
+    try:
+        while is_running(benchmark, iteration, start_time):
+            inputs = {port: tensor.data for port, tensor in data_queue.get_next_input().items()}
+            t0 = time.perf_counter()
+            results = request.infer(inputs)
+            t1 = time.perf_counter()
+            results.to_tuple()
+            t2 = time.perf_counter()
+            latency_us = request.latency * 1000
+            native_call_start, native_call_end = timestamps['native infer call']
+            record_stages(stages, timestamps)
+            stages['inference (C++ latency)'].record(latency_us)
+            stages['native binding overhead'].record(max((native_call_end - native_call_start) * 1e6 - latency_us, 0))
+            stages['outputs conversion'].record((t2 - t1) * 1e6)
+            stages['total'].record((t2 - t0) * 1e6)
+            stages['python overhead'].record(max((t2 - t0) * 1e6 - latency_us, 0))
+            iteration += 1
+    finally:
+        request._stage_hook = None
+    return stages, iteration
+
+
+def profile_async_infer(benchmark, infer_queue, data_queue):
+    stages = new_histograms(ASYNC_STAGES)
+    # Callbacks are called from several threads
+    lock = threading.Lock()
+    # Timestamps of submission and of completion by iteration, the callback of a job may be called
+    # before start_async returns, so a job is recorded when both of them are known
+    submissions = {}
+    completions = {}
+
+    def record_job(submission_start, native_call_time, callback_time, latency_us):
+        # Includes setting tensors of the native request and waiting for GIL to run the callback
+        completion_overhead_us = max((callback_time - native_call_time) * 1e6 - latency_us, 0)
+        stages['inference (C++ latency)'].record(latency_us)
+        stages['submission to callback'].record((callback_time - native_call_time) * 1e6)
+        stages['completion overhead'].record(completion_overhead_us)
+        stages['python overhead'].record((native_call_time - submission_start) * 1e6 + completion_overhead_us)
+
+    def completion_callback(request, iteration):
+        callback_time = time.perf_counter()
+        latency_us = request.latency * 1000
+        with lock:
+            submission = submissions.pop(iteration, None)
+            if submission is None:
+                completions[iteration] = (callback_time, latency_us)
+            else:
+                record_job(*submission, callback_time, latency_us)
+
+    timestamps = {}
+    infer_queue._stage_hook = timestamps.update
+    infer_queue.set_callback(completion_callback)
+    iteration = 0
+    start_time = datetime.utcnow()
+    try:
+        while is_running(benchmark, iteration, start_time):
+            inputs = {port: tensor.data for port, tensor in data_queue.get_next_input().items()}
+            infer_queue.start_async(inputs, iteration)
+            # Waiting for an idle request depends on the device, not on Python, so it isn't a part of submission
+            submission_start = timestamps['request wrapper lookup'][0]
+            native_call_time, submission_end = timestamps['native start_async call']
+            with lock:
+                record_stages(stages, timestamps)
+                stages['submission'].record((submission_end - submission_start) * 1e6)
+                completion = completions.pop(iteration, None)
+                if completion is None:
+                    submissions[iteration] = (submission_start, native_call_time)
+                else:
+                    record_job(submission_start, native_call_time, *completion)
+            iteration += 1
+        infer_queue.wait_all()
+    finally:
+        infer_queue._stage_hook = None
+    return stages, iteration
+
+
+def profile_wrapper_creation(request):
+    histogram = LatencyHistogram()
+    for _ in range(WRAPPER_ITERATIONS):
+        start_time = time.perf_counter()
+        InferRequest(request)
+        histogram.record((time.perf_counter() - start_time) * 1e6)
+    return histogram
+
+
+def run_python_overhead(benchmark, requests, data_queue, statistics=None):
+    """ Measure Python side stages of inference calls and compare them with C++ latency of requests. """
+    if benchmark.api_type == 'sync':
+        stages, iteration = profile_sync_infer(benchmark, requests[0], data_queue)
+    else:
+        stages, iteration = profile_async_infer(benchmark, requests, data_queue)
+    stages[WRAPPER_STAGE] = profile_wrapper_creation(requests[0])
+
+    logger.info(f"Python overhead of {benchmark.api_type} inference, {iteration} iterations, times in microseconds:")
+    logger.info(f"   {'stage':<32}" + ''.join(f"{f'{percent} percentile':>16}" for percent in PERCENTILES) + f"{'avg':>12}{'max':>12}")
+    for stage, histogram in stages.items():
+        if not histogram:
+            continue
+        logger.info(f"   {stage:<32}" + ''.join(f"{histogram.percentile(percent):>16.2f}" for percent in PERCENTILES) +
+                    f"{histogram.avg:>12.2f}{histogram.max:>12.2f}")
+
+    latency = stages['inference (C++ latency)']
+    overhead = stages['python overhead']
+    overhead_percent = overhead.avg / latency.avg * 100 if latency and latency.avg else 0.
+    logger.info(f"Python overhead per request: {overhead.avg:.2f} us on average, {overhead_percent:.2f}% of C++ latency")
+
+    if statistics:
+        statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                  [('total number of iterations', str(iteration))] +
+                                  [(f'{stage} avg (us)', f'{histogram.avg:.2f}') for stage, histogram in stages.items() if histogram] +
+                                  [('python overhead (% of latency)', f'{overhead_percent:.2f}')])
+        statistics.dump()
+    return stages
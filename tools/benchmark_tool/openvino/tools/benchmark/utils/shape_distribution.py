@@ -0,0 +1,76 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import re
+
+REPLAY_ORDER = 'replay'
+SAMPLE_ORDER = 'sample'
+SHAPE_ORDERS = [REPLAY_ORDER, SAMPLE_ORDER]
+
+# Fixed seed keeps sampled sequences of shapes reproducible between runs
+SHAPE_SAMPLING_SEED = 0
+SHAPE_SAMPLING_CHUNK = 1024
+
+
+class ShapeDistribution:
+    """ Input shapes of inference requests read from a file.
+        Every line contains input shapes of a request in -data_shape format, for example
+        "input_ids[1,128],attention_mask[1,128]" or "[1,128]" for a model with one input,
+        optionally followed by the number of requests with these shapes. Empty lines and lines
+        starting with '#' are skipped. Distinct shapes form shape groups of -data_shape.
+    """
+    def __init__(self, path_to_file):
+        self.path_to_file = path_to_file
+        # Shape group and number of requests for every line of the file
+        self.groups = []
+        self.counts = []
+        group_shapes = {}
+        input_names = None
+        with open(path_to_file, 'r') as shapes_file:
+            for line_number, line in enumerate(shapes_file, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                match = re.fullmatch(r'(.*\])\s*(\d+)?', line)
+                shapes = re.findall(r'([^,\[\]]*)\[([^\]]*)\]', match.group(1)) if match else []
+                if not shapes:
+                    raise RuntimeError(f"Can't parse shapes '{line}' at line {line_number} of {path_to_file}")
+                names = [name.strip() for name, _ in shapes]
+                if input_names is None:
+                    input_names = names
+                elif names != input_names:
+                    raise RuntimeError(f"Inputs {names} at line {line_number} of {path_to_file} "
+                                       f"don't match inputs {input_names} of the first line")
+                key = tuple(shape.replace(' ', '') for _, shape in shapes)
+                self.groups.append(group_shapes.setdefault(key, len(group_shapes)))
+                self.counts.append(int(match.group(2)) if match.group(2) else 1)
+        if not self.groups:
+            raise RuntimeError(f"File {path_to_file} doesn't contain shapes")
+        if not any(self.counts):
+            raise RuntimeError(f"Number of requests in {path_to_file} is zero")
+        if input_names == [''] * len(input_names) and len(input_names) > 1:
+            raise RuntimeError(f"Shapes of several inputs in {path_to_file} should be specified with input names")
+
+        self.num_groups = len(group_shapes)
+        self.data_shape = ','.join(name + ''.join(f'[{shapes[i]}]' for shapes in group_shapes)
+                                   for i, name in enumerate(input_names))
+
+    def get_schedule(self, order):
+        """ Return an infinite iterator over shape groups of requests. """
+        if order == REPLAY_ORDER:
+            return self._replay()
+        if order == SAMPLE_ORDER:
+            return self._sample()
+        raise RuntimeError(f"Unknown order of shapes '{order}'. Supported values: {', '.join(SHAPE_ORDERS)}")
+
+    def _replay(self):
+        while True:
+            for group, count in zip(self.groups, self.counts):
+                for _ in range(count):
+                    yield group
+
+    def _sample(self):
+        generator = random.Random(SHAPE_SAMPLING_SEED)
+        while True:
+            yield from generator.choices(self.groups, weights=self.counts, k=SHAPE_SAMPLING_CHUNK)
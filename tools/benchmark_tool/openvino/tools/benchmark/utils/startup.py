@@ -0,0 +1,213 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from openvino import Core, properties
+
+from .logging import logger
+from .statistics_report import StatisticsReport
+from .sweep import get_device_config
+from .utils import load_config, get_peak_memory_usage
+
+STARTUP_REPORT_NAME = 'benchmark_startup.json'
+# Worker prints results in a line with this prefix, so logs of plugins don't break parsing
+STARTUP_RESULT_PREFIX = 'STARTUP_RESULT:'
+STARTUP_PERCENTILES = [50, 90]
+
+# Name, whether model cache is enabled, whether it is cleared and whether files are evicted from page cache before each run.
+# Order matters: runs of a scenario leave files in page cache, so the next scenario with warm page cache doesn't need warm-up runs.
+MODEL_SCENARIOS = [
+    ('no cache, cold page cache', False, False, True),
+    ('no cache, warm page cache', False, False, False),
+    ('cache miss', True, True, False),
+    ('cache hit, cold page cache', True, False, True),
+    ('cache hit, warm page cache', True, False, False),
+]
+COMPILED_MODEL_SCENARIOS = [
+    ('cold page cache', False, False, True),
+    ('warm page cache', False, False, False),
+]
+
+
+def get_model_files(path_to_model):
+    files = [path_to_model]
+    weights = os.path.splitext(path_to_model)[0] + '.bin'
+    if path_to_model.endswith('.xml') and os.path.exists(weights):
+        files.append(weights)
+    return files
+
+
+def get_directory_files(path):
+    return [os.path.join(root, name) for root, _, names in os.walk(path) for name in names]
+
+
+def evict_from_page_cache(paths):
+    """ Drop cached pages of files, so the next read goes to the disk. Return False if the platform doesn't support it. """
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            # Dirty pages are not dropped, so write them first
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def run_startup_worker(params):
+    """ Load the model once in the current process and return duration of every phase. """
+    result = {}
+    start_time = time.perf_counter()
+    core = Core()
+    result['create core (ms)'] = (time.perf_counter() - start_time) * 1000
+    if params['cache_dir']:
+        core.set_property({'CACHE_DIR': params['cache_dir']})
+    base_config = {}
+    if params['load_config']:
+        load_config(params['load_config'], base_config)
+    device_config = get_device_config(base_config.get(params['device'], {}), params['hint'], None, None, None)
+
+    if params['is_compiled']:
+        start_time = time.perf_counter()
+        compiled_model = core.import_model(params['model'], params['device'], device_config)
+        result['import model (ms)'] = (time.perf_counter() - start_time) * 1000
+    else:
+        start_time = time.perf_counter()
+        model = core.read_model(params['model'])
+        result['read model (ms)'] = (time.perf_counter() - start_time) * 1000
+        start_time = time.perf_counter()
+        compiled_model = core.compile_model(model, params['device'], device_config)
+        result['compile model (ms)'] = (time.perf_counter() - start_time) * 1000
+
+    try:
+        result['loaded from cache'] = bool(compiled_model.get_property(properties.loaded_from_cache()))
+    except RuntimeError:
+        result['loaded from cache'] = None
+    result['peak memory (KB)'] = get_peak_memory_usage()
+    return result
+
+
+def run_startup_process(params):
+    start_time = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-m', __name__, json.dumps(params)], capture_output=True, text=True)
+    total_ms = (time.perf_counter() - start_time) * 1000
+    if completed.returncode != 0:
+        raise Exception(f"Startup run failed with exit code {completed.returncode}:\n{completed.stderr}")
+    for line in completed.stdout.splitlines():
+        if line.startswith(STARTUP_RESULT_PREFIX):
+            result = json.loads(line[len(STARTUP_RESULT_PREFIX):])
+            result['process total (ms)'] = total_ms
+            return result
+    raise Exception(f"Startup run didn't report results:\n{completed.stdout}")
+
+
+def get_distribution(values):
+    distribution = {
+        'avg': float(np.mean(values)),
+        'min': float(np.min(values)),
+        'max': float(np.max(values)),
+    }
+    for percent in STARTUP_PERCENTILES:
+        distribution[f'{percent} percentile'] = float(np.percentile(values, percent))
+    return distribution
+
+
+def run_startup_benchmark(args, is_network_compiled, statistics=None):
+    """ Load the model in args.startup_runs fresh processes for each scenario and report distribution of every phase. """
+    # The cache is cleared by the benchmark, so a dedicated directory is used even if -cdir is set
+    cache_dir = tempfile.mkdtemp(prefix='benchmark_startup_cache_', dir=args.cache_dir or None)
+    model_files = get_model_files(args.path_to_model)
+    params = {
+        'model': args.path_to_model,
+        'device': args.target_device,
+        'hint': args.perf_hint or 'throughput',
+        'load_config': args.load_config,
+        'is_compiled': is_network_compiled,
+    }
+    scenarios_results = []
+    cache_size = None
+    try:
+        for name, use_cache, clear_cache, evict in COMPILED_MODEL_SCENARIOS if is_network_compiled else MODEL_SCENARIOS:
+            runs = []
+            for _ in range(args.startup_runs):
+                if clear_cache:
+                    shutil.rmtree(cache_dir)
+                    os.makedirs(cache_dir)
+                if evict and not evict_from_page_cache(model_files + (get_directory_files(cache_dir) if use_cache else [])):
+                    logger.warning("Files can't be evicted from page cache on this platform, "
+                                   f"'{name}' runs are done with warm page cache")
+                    evict = False
+                runs.append(run_startup_process(dict(params, cache_dir=cache_dir if use_cache else '')))
+
+            phases = [key for key, value in runs[0].items() if key.endswith(('(ms)', '(KB)')) and value is not None]
+            cache_hits = sum(1 for run in runs if run['loaded from cache'])
+            scenario = {
+                'scenario': name,
+                'runs': len(runs),
+                'cache hits': cache_hits,
+                'phases': {phase: get_distribution([run[phase] for run in runs]) for phase in phases},
+            }
+            if use_cache:
+                # Cache hits are verified only if the device reports whether the model was loaded from cache
+                expected_hits = len(runs) if not clear_cache else 0
+                if any(run['loaded from cache'] is None for run in runs):
+                    scenario['cache verified'] = None
+                else:
+                    scenario['cache verified'] = cache_hits == expected_hits
+                    if cache_hits != expected_hits:
+                        logger.warning(f"'{name}': model was loaded from cache in {cache_hits} of {len(runs)} runs, "
+                                       f"expected {expected_hits}")
+            if clear_cache:
+                cache_size = sum(os.path.getsize(path) for path in get_directory_files(cache_dir))
+            scenarios_results.append(scenario)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print_startup_results(scenarios_results, cache_size)
+
+    if statistics:
+        execution_results = []
+        for scenario in scenarios_results:
+            for phase, distribution in scenario['phases'].items():
+                execution_results.append((f"{scenario['scenario']} {phase} median", f"{distribution['50 percentile']:.2f}"))
+            if 'cache verified' in scenario:
+                execution_results.append((f"{scenario['scenario']} cache hits", f"{scenario['cache hits']}/{scenario['runs']}"))
+        if cache_size is not None:
+            execution_results.append(('cache size (bytes)', str(cache_size)))
+        statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS, execution_results)
+        statistics.dump()
+
+    report_path = args.startup_report or os.path.join(args.report_folder, STARTUP_REPORT_NAME)
+    with open(report_path, 'w') as file:
+        json.dump({
+            'model': args.path_to_model,
+            'device': args.target_device,
+            'cache size (bytes)': cache_size,
+            'scenarios': scenarios_results,
+        }, file, indent=4)
+    logger.info(f"Startup report is stored to {report_path}")
+    return scenarios_results
+
+
+def print_startup_results(scenarios_results, cache_size):
+    for scenario in scenarios_results:
+        cache_info = f", loaded from cache in {scenario['cache hits']} runs" if 'cache verified' in scenario else ''
+        logger.info(f"{scenario['scenario']} ({scenario['runs']} runs{cache_info}):")
+        for phase, distribution in scenario['phases'].items():
+            logger.info(f"   {phase:<20} " + ', '.join(f"{value:.2f} ({name})" for name, value in distribution.items()))
+    if cache_size is not None:
+        logger.info(f"Model cache size: {cache_size} bytes")
+
+
+if __name__ == '__main__':
+    print(STARTUP_RESULT_PREFIX + json.dumps(run_startup_worker(json.loads(sys.argv[1]))), flush=True)
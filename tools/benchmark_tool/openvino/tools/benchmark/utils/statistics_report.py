@@ -51,6 +51,10 @@ class StatisticsReport(metaclass = abc.ABCMeta):
     def dump_performance_counters_sorted(self):
         pass
 
+    @abc.abstractmethod
+    def dump_timeline(self, intervals):
+        pass
+
 @StatisticsReport.register
 class CsvStatisticsReport(StatisticsReport):
 
@@ -114,21 +118,22 @@ class CsvStatisticsReport(StatisticsReport):
                     dump_performance_counters_request(f, prof_info)
             elif self.config.report_type == averageCntReport:
                 def get_average_performance_counters(prof_info_list):
-                    performance_counters_avg = []
+                    ## layers are matched by name in a dictionary to avoid quadratic search over all layers
+                    performance_counters_avg = {}
                     ## iterate over each processed infer request and handle its PM data
                     for prof_info in prof_info_list:
                         for pi in prof_info:
-                            item = next((x for x in performance_counters_avg if x.node_name == pi.node_name), None)
+                            item = performance_counters_avg.get(pi.node_name)
                             if item:
                                 item.real_time += pi.real_time
                                 item.cpu_time += pi.cpu_time
                             else:
-                                performance_counters_avg.append(pi)
+                                performance_counters_avg[pi.node_name] = pi
 
-                    for pi in performance_counters_avg:
+                    for pi in performance_counters_avg.values():
                         pi.real_time /= len(prof_info_list)
                         pi.cpu_time /= len(prof_info_list)
-                    return performance_counters_avg
+                    return list(performance_counters_avg.values())
                 dump_performance_counters_request(f, get_average_performance_counters(prof_info_list))
             else:
                 raise Exception('PM data can only be collected for average or detailed report types')
@@ -158,6 +163,19 @@ class CsvStatisticsReport(StatisticsReport):
             f.write('\n\n')
         logger.info(f'Sorted performance counters report is stored to {filename}')
 
+    def dump_timeline(self, intervals):
+        """Save throughput and latency per interval into csv file.
+        """
+        columns = []
+        for interval in intervals:
+            columns.extend(key for key in interval.keys() if key not in columns)
+        filename = os.path.join(self.config.report_folder, 'benchmark_timeline.csv')
+        with open(filename, 'w') as f:
+            f.write(self.csv_separator.join(columns) + '\n')
+            for interval in intervals:
+                f.write(self.csv_separator.join(interval.get(column, '') for column in columns) + '\n')
+        logger.info(f'Timeline report is stored to {filename}')
+
 @StatisticsReport.register
 class JsonStatisticsReport(StatisticsReport):
     def __init__(self, config) -> None:
@@ -214,20 +232,21 @@ class JsonStatisticsReport(StatisticsReport):
             return profiling_info_json_list
 
         def get_average_performance_counters(prof_info_list):
-            performance_counters_avg = []
+            # Layers are matched by name in a dictionary to avoid quadratic search over all layers
+            performance_counters_avg = {}
             for prof_info in prof_info_list:
                 for pi in prof_info:
-                    item = next((x for x in performance_counters_avg if x[0].node_name == pi.node_name), None)
+                    item = performance_counters_avg.get(pi.node_name)
                     if item:
                         item[0].real_time += pi.real_time
                         item[0].cpu_time += pi.cpu_time
                     else:
-                        performance_counters_avg.append([pi])
-            for pi in performance_counters_avg:
+                        performance_counters_avg[pi.node_name] = [pi]
+            for pi in performance_counters_avg.values():
                 pi[0].real_time /= len(prof_info_list)
                 pi[0].cpu_time /= len(prof_info_list)
 
-            return performance_counters_avg
+            return list(performance_counters_avg.values())
 
         if self.config.report_type == '' or self.config.report_type == noCntReport:
             logger.info("Statistics collecting for performance counters was not requested. No reports are dumped.")
@@ -294,3 +313,9 @@ class JsonStatisticsReport(StatisticsReport):
             }
             json.dump(json_statistics, file, indent=4)
             logger.info(f'Sorted performance counters report is stored to {filename}')
+
+    def dump_timeline(self, intervals: list[dict[str, str]]) -> None:
+        filename = os.path.join(self.config.report_folder, 'benchmark_timeline.json')
+        with open(filename, 'w') as file:
+            json.dump({'timeline': intervals}, file, indent=4)
+            logger.info(f'Timeline report is stored to {filename}')
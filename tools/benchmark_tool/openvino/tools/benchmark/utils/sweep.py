@@ -0,0 +1,221 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import json
+import os
+from datetime import datetime
+
+from openvino import Dimension, properties
+
+from .inputs_filling import get_input_data, set_initial_inputs
+from .logging import logger
+from .utils import get_inputs_info, get_network_batch_size, pre_post_processing, get_number_iterations, \
+    get_latency_groups, check_for_static, can_measure_as_static, load_config
+
+GRID_SWEEP = 'grid'
+GUIDED_SWEEP = 'guided'
+SWEEP_MODES = [GRID_SWEEP, GUIDED_SWEEP]
+SWEEP_OPTIONS = ['hint', 'nstreams', 'nthreads', 'nireq', 'b']
+PERFORMANCE_HINTS = {
+    'throughput': properties.hint.PerformanceMode.THROUGHPUT,
+    'tput': properties.hint.PerformanceMode.THROUGHPUT,
+    'cumulative_throughput': properties.hint.PerformanceMode.CUMULATIVE_THROUGHPUT,
+    'ctput': properties.hint.PerformanceMode.CUMULATIVE_THROUGHPUT,
+    'latency': properties.hint.PerformanceMode.LATENCY,
+    'none': None,
+}
+# Guided sweep stops increasing number of infer requests once throughput grows slower
+GUIDED_MIN_THROUGHPUT_GAIN = 0.02
+SWEEP_REPORT_NAME = 'benchmark_sweep.json'
+
+
+def parse_sweep_grid(grid_string):
+    """ Parse "<option>=<value1>,<value2>;..." into a dictionary of option values. """
+    grid = {}
+    for item in grid_string.split(';'):
+        if not item.strip():
+            continue
+        name, separator, values = item.partition('=')
+        name = name.strip().lstrip('-')
+        values = [value.strip() for value in values.split(',') if value.strip()]
+        if not separator or name not in SWEEP_OPTIONS or not values:
+            raise RuntimeError(f"Incorrect -sweep item '{item}'. Expected format is '<option>=<value1>,<value2>' "
+                               f"with one of options: {', '.join(SWEEP_OPTIONS)}")
+        if name == 'hint':
+            unknown_hints = [value for value in values if value not in PERFORMANCE_HINTS]
+            if unknown_hints:
+                raise RuntimeError(f"Incorrect performance hint {', '.join(unknown_hints)} in -sweep. "
+                                   f"Supported values: {', '.join(PERFORMANCE_HINTS)}")
+        if name in ('nthreads', 'nireq', 'b') and not all(value.isdigit() for value in values):
+            raise RuntimeError(f"Values of {name} in -sweep should be non-negative integers")
+        grid[name] = values
+    if not grid:
+        raise RuntimeError("-sweep doesn't contain options to sweep")
+    return grid
+
+
+def get_sweep_values(grid, args):
+    """ Complete the grid with values of options from command line which are not swept. """
+    values = dict(grid)
+    if 'hint' not in values:
+        fine_tuned = 'nstreams' in values or 'nthreads' in values
+        values['hint'] = [args.perf_hint or ('none' if fine_tuned else 'throughput')]
+    values.setdefault('nstreams', [args.number_streams or None])
+    values.setdefault('nthreads', [str(args.number_threads) if args.number_threads else None])
+    values.setdefault('nireq', [str(args.number_infer_requests)])
+    values.setdefault('b', [args.batch_size])
+    return values
+
+
+def get_pareto_front(results, latency_key):
+    """ Return results for which no other result has both lower latency and higher throughput. """
+    front = []
+    for result in sorted(results, key=lambda result: (result[latency_key], -result['throughput'])):
+        if not front or result['throughput'] > front[-1]['throughput']:
+            front.append(result)
+    return front
+
+
+def get_best_configuration(results, latency_key, latency_sla):
+    candidates = [result for result in results if not latency_sla or result[latency_key] <= latency_sla]
+    return max(candidates, key=lambda result: result['throughput']) if candidates else None
+
+
+def get_device_config(base_config, hint, nstreams, nthreads, batch):
+    device_config = dict(base_config)
+    if PERFORMANCE_HINTS[hint] is not None:
+        device_config[properties.hint.performance_mode()] = PERFORMANCE_HINTS[hint]
+    if nstreams is not None:
+        device_config[properties.streams.num()] = nstreams
+    if nthreads is not None:
+        device_config[properties.inference_num_threads()] = nthreads
+    if batch:
+        device_config["ALLOW_AUTO_BATCHING"] = False
+    return device_config
+
+
+def get_number_streams(compiled_model):
+    try:
+        return str(compiled_model.get_property(properties.streams.num()))
+    except RuntimeError:
+        return 'default'
+
+
+def run_sweep(benchmark, args, paths_to_input):
+    grid_values = get_sweep_values(parse_sweep_grid(args.sweep), args)
+    latency_key = f'latency ({args.latency_percentile} percentile) (ms)'
+
+    base_config = {}
+    if args.load_config:
+        load_config(args.load_config, base_config)
+    base_config = base_config.get(benchmark.device, {})
+    if args.cache_dir:
+        benchmark.set_cache_dir(args.cache_dir)
+
+    start_time = datetime.utcnow()
+    model = benchmark.read_model(args.path_to_model)
+    logger.info(f"Read model took {(datetime.utcnow() - start_time).total_seconds() * 1000:.2f} ms")
+    for port in model.inputs:
+        if not port.get_names():
+            port.set_names({port.node.get_friendly_name()})
+
+    results = []
+    for batch in grid_values['b']:
+        batch_model = model.clone()
+        app_inputs_info, reshape = get_inputs_info(args.shape, args.data_shape, args.layout, batch,
+                                                   args.scale_values, args.mean_values, batch_model.inputs)
+        if reshape:
+            batch_model.reshape({info.name: info.partial_shape for info in app_inputs_info})
+        pre_post_processing(batch_model, app_inputs_info, args.input_precision, args.output_precision, args.input_output_precision)
+        batch_size = get_network_batch_size(app_inputs_info)
+
+        shape_schedule = args.shape_distribution.get_schedule(args.data_shape_order) if args.shape_distribution else None
+        data_queue = get_input_data(paths_to_input, app_inputs_info, args.input_cache_dir, shape_schedule)
+        static_mode = check_for_static(app_inputs_info)
+        allow_inference_only = can_measure_as_static(app_inputs_info)
+        if args.inference_only is None:
+            benchmark.inference_only = static_mode
+        elif args.inference_only and not allow_inference_only:
+            raise Exception("Benchmarking dynamic model available with input filling in measurement loop only!")
+        if allow_inference_only and batch_size.is_dynamic:
+            batch_size = Dimension(data_queue.batch_sizes[data_queue.current_group_id])
+        benchmark.latency_groups = get_latency_groups(app_inputs_info)
+        num_shapes = data_queue.cycle_size
+
+        for hint, nstreams, nthreads in itertools.product(grid_values['hint'], grid_values['nstreams'], grid_values['nthreads']):
+            device_config = get_device_config(base_config, hint, nstreams, nthreads, batch)
+            # Number of infer requests doesn't affect compilation, so the compiled model is shared by all of them
+            start_time = datetime.utcnow()
+            compiled_model = benchmark.core.compile_model(batch_model, benchmark.device, device_config)
+            compile_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+
+            nireq_values = grid_values['nireq']
+            if args.sweep_mode == GUIDED_SWEEP:
+                nireq_values = sorted(nireq_values, key=int)
+            best_throughput = 0
+            for nireq in nireq_values:
+                benchmark.nireq = int(nireq)
+                requests = benchmark.create_infer_requests(compiled_model)
+                benchmark.niter = get_number_iterations(args.number_iterations, benchmark.nireq, num_shapes, benchmark.api_type)
+                set_initial_inputs(requests, data_queue, static_mode)
+                if not args.no_warmup:
+                    benchmark.first_infer(requests)
+                fps, percentile_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, _, iteration = \
+                    benchmark.main_loop(requests, data_queue, batch_size, args.latency_percentile, False)
+                result = {
+                    'hint': hint,
+                    'nstreams': get_number_streams(compiled_model) if nstreams is None else nstreams,
+                    'nthreads': nthreads or '',
+                    'nireq': benchmark.nireq,
+                    'batch size': str(batch_size),
+                    'compile model time (ms)': round(compile_time_ms, 2),
+                    'total number of iterations': iteration,
+                    'throughput': round(fps, 2),
+                    latency_key: round(percentile_latency_ms, 2),
+                    'avg latency': round(avg_latency_ms, 2),
+                    'min latency': round(min_latency_ms, 2),
+                    'max latency': round(max_latency_ms, 2),
+                }
+                results.append(result)
+                logger.info(f"hint: {hint}, nstreams: {result['nstreams']}, nthreads: {result['nthreads'] or 'default'}, "
+                            f"nireq: {benchmark.nireq}, batch: {batch_size} -> {fps:.2f} FPS, "
+                            f"{args.latency_percentile} percentile latency {percentile_latency_ms:.2f} ms")
+                del requests
+                if args.sweep_mode == GUIDED_SWEEP:
+                    if fps < best_throughput * (1 + GUIDED_MIN_THROUGHPUT_GAIN) or \
+                       (args.latency_sla and percentile_latency_ms > args.latency_sla):
+                        break
+                    best_throughput = fps
+            del compiled_model
+
+    pareto_front = get_pareto_front(results, latency_key)
+    best = get_best_configuration(results, latency_key, args.latency_sla)
+    print_sweep_results(results, pareto_front, best, latency_key, args.latency_sla)
+
+    report_path = args.sweep_report or os.path.join(args.report_folder, SWEEP_REPORT_NAME)
+    with open(report_path, 'w') as file:
+        json.dump({
+            'latency percentile': args.latency_percentile,
+            'latency sla (ms)': args.latency_sla or None,
+            'configurations': results,
+            'pareto front': pareto_front,
+            'best configuration': best,
+        }, file, indent=4)
+    logger.info(f"Sweep report is stored to {report_path}")
+    return best
+
+
+def print_sweep_results(results, pareto_front, best, latency_key, latency_sla):
+    columns = ['hint', 'nstreams', 'nthreads', 'nireq', 'batch size', 'throughput', latency_key, 'avg latency', 'max latency']
+    widths = [max(len(column), *(len(str(result[column])) for result in results)) for column in columns]
+    logger.info("Sweep results (* marks Pareto front):")
+    logger.info('  ' + '  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    for result in results:
+        marker = '*' if any(result is point for point in pareto_front) else ' '
+        logger.info(marker + ' ' + '  '.join(str(result[column]).ljust(width) for column, width in zip(columns, widths)))
+    if best is None:
+        logger.warning(f"No configuration satisfies latency limit of {latency_sla} ms")
+    else:
+        logger.info(f"Best configuration{f' within {latency_sla} ms latency' if latency_sla else ''}: "
+                    + ', '.join(f'{column}: {best[column]}' for column in columns))
@@ -9,9 +9,12 @@ from openvino.preprocess import PrePostProcessor
 
 from .constants import DEVICE_DURATION_IN_SECS, UNKNOWN_DEVICE_TYPE, \
     AUTO_DEVICE_NAME, MULTI_DEVICE_NAME, HETERO_DEVICE_NAME
+from .latency_histogram import LatencyHistogram
 from .logging import logger
 
 import json
+import os
+import platform
 import re
 import numpy as np
 
@@ -223,7 +226,7 @@ class LatencyGroup:
     def __init__(self, input_names, input_shapes):
         self.input_names = input_names
         self.input_shapes = input_shapes
-        self.times = list()
+        self.times = LatencyHistogram()
         self.median = 0.
         self.avg = 0.
         self.min = 0.
@@ -487,6 +490,17 @@ def get_command_line_arguments(argv):
     return parameters
 
 
+def get_paths_to_input(args_paths_to_input):
+    paths_to_input = list()
+    if args_paths_to_input:
+        for path in args_paths_to_input:
+            if ":" in next(iter(path), ""):
+                paths_to_input.extend(path)
+            else:
+                paths_to_input.append(os.path.abspath(*path))
+    return paths_to_input
+
+
 def get_input_output_names(ports):
     return [port.any_name if port.get_names() else port.node.get_friendly_name() for port in ports]
 
@@ -832,3 +846,16 @@ def load_config(filename, config):
             elif property_value in ("YES", "NO"):
                 property_value = True if property_value == "YES" else False
             config[device][property_name] = OVAny(property_value)
+
+
+def get_peak_memory_usage():
+    if platform.system() == "Linux":
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmPeak:"):
+                    return int(line.split()[1])  # The value in KB
+        raise RuntimeError("VmPeak attribute not found. Unable to determine peak memory usage.")
+
+    # No Windows support due to the lack of the ‘psutil’ module in the CI infrastructure
+    # No Macos support due to no /proc/self/status file
+    return None
@@ -0,0 +1,268 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from openvino.tools.ovc.cli_parser import get_all_cli_parser, get_model_name_from_args, get_params_with_paths_list
+from openvino.tools.ovc.error import Error
+from openvino.tools.ovc.profiler import get_memory_status
+
+# Interval of checking memory of conversion processes in seconds
+MEMORY_POLL_INTERVAL = 0.1
+STATUS_SUCCESS = 'success'
+STATUS_FAILED = 'failed'
+STATUS_MEMORY_LIMIT = 'memory limit exceeded'
+
+
+def read_manifest(manifest_path):
+    """
+    Reads the list of models from the manifest and resolves relative paths against the directory of the manifest.
+    The manifest is either a list of entries or an object with such list in "models" field.
+    """
+    with open(manifest_path, 'r') as manifest_file:
+        try:
+            manifest = json.load(manifest_file)
+        except json.JSONDecodeError as e:
+            raise Error('Manifest {} is not a valid JSON file: {}'.format(manifest_path, e))
+    entries = manifest.get('models') if isinstance(manifest, dict) else manifest
+    if not isinstance(entries, list):
+        raise Error('Manifest {} should contain a list of models'.format(manifest_path))
+
+    manifest_dir = Path(manifest_path).resolve().parent
+    for idx, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not entry.get('input_model'):
+            raise Error('Entry #{} of manifest {} should be an object with "input_model" field'.format(
+                idx, manifest_path))
+        for key in get_params_with_paths_list():
+            if key not in entry or entry[key] is None:
+                continue
+            paths = entry[key] if isinstance(entry[key], (list, tuple)) else str(entry[key]).split(',')
+            # Trailing separator of output directory is kept
+            entry[key] = [os.path.join(str(manifest_dir), str(path)) for path in paths]
+    return entries
+
+
+def entry_to_cli_args(entry: dict):
+    """
+    Converts an entry of the manifest to command line arguments of the tool.
+    """
+    args = []
+    for key, value in entry.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ','.join(str(element) for element in value)
+        if key == 'input_model':
+            args.append(value)
+        elif isinstance(value, bool) and key != 'compress_to_fp16':
+            # Boolean parameters are flags
+            if value:
+                args.append('--{}'.format(key))
+        else:
+            args.append('--{}={}'.format(key, value))
+    return args
+
+
+def run_conversion(cli_args: list, log_path: str, connection):
+    """
+    Entry point of a conversion process, converts a model with command line arguments of the tool.
+    """
+    exit_code, output_model = 1, None
+    with open(log_path, 'w') as log_file:
+        # File descriptors are redirected, so messages of native libraries are written to the log as well
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log_file.fileno(), sys.stdout.fileno())
+        os.dup2(log_file.fileno(), sys.stderr.fileno())
+        # Parameters of conversion are read from command line arguments of the process
+        sys.argv = ['ovc'] + cli_args
+        try:
+            from openvino.tools.ovc.main import main
+            exit_code = main()
+            if exit_code == 0:
+                output_model = get_model_name_from_args(get_all_cli_parser().parse_args())
+        except SystemExit as e:
+            # Raised by argument parser for wrong parameters
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    connection.send({'exit code': exit_code, 'output model': output_model, 'peak rss (MB)': get_memory_status()[1]})
+    connection.close()
+
+
+def get_last_error(log_path: str):
+    try:
+        with open(log_path, 'r', errors='replace') as log_file:
+            lines = [line.strip() for line in log_file if line.strip()]
+    except OSError:
+        return None
+    errors = [line.split(']', 1)[1].strip() for line in lines if line.startswith(('[ ERROR ]', '[ FRAMEWORK ERROR ]'))]
+    for idx, error in enumerate(errors):
+        # Report of unexpected exceptions has the message after this banner
+        if 'DETAILED INFORMATION' in error and idx + 1 < len(errors):
+            return errors[idx + 1]
+    messages = [error for error in errors if not error.startswith('-')]
+    if messages:
+        return messages[0]
+    # Last line of a traceback
+    return lines[-1] if lines else None
+
+
+class Conversion:
+    def __init__(self, entry: dict, cli_args: list, log_path: Path):
+        self.entry = entry
+        self.cli_args = cli_args
+        self.log_path = log_path
+        self.process = None
+        self.connection = None
+        self.start_time = None
+        self.peak_rss = None
+        self.result = None
+
+    def start(self, context):
+        self.connection, child_connection = context.Pipe(duplex=False)
+        self.process = context.Process(target=run_conversion,
+                                       args=(self.cli_args, str(self.log_path), child_connection), daemon=True)
+        self.start_time = time.perf_counter()
+        self.process.start()
+        child_connection.close()
+
+    def update_peak_rss(self):
+        current_rss, _ = get_memory_status(self.process.pid)
+        if current_rss is not None:
+            self.peak_rss = current_rss if self.peak_rss is None else max(self.peak_rss, current_rss)
+        return current_rss
+
+    def finish(self, status: str = None):
+        wall_time = time.perf_counter() - self.start_time
+        if status is None:
+            self.process.join()
+            result = self.connection.recv() if self.connection.poll() else {}
+            if result.get('peak rss (MB)') is not None:
+                self.peak_rss = max(self.peak_rss or 0, result['peak rss (MB)'])
+            exit_code = result.get('exit code', self.process.exitcode)
+            status = STATUS_SUCCESS if exit_code == 0 else STATUS_FAILED
+        else:
+            # Conversion is stopped
+            self.process.kill()
+            self.process.join()
+            result = {}
+            exit_code = self.process.exitcode
+        self.connection.close()
+        self.result = {
+            'input_model': self.entry['input_model'],
+            'output_model': result.get('output model'),
+            'status': status,
+            'exit code': exit_code,
+            'wall time (s)': round(wall_time, 3),
+            'peak rss (MB)': round(self.peak_rss, 2) if self.peak_rss is not None else None,
+            'log': str(self.log_path),
+            'error': None if status == STATUS_SUCCESS else get_last_error(self.log_path) if status == STATUS_FAILED
+            else 'Resident memory of the process reached {:.2f} MB'.format(self.peak_rss),
+        }
+        return self.result
+
+
+def get_context():
+    # Forked processes inherit imported frontends and extensions, so a conversion doesn't pay for imports
+    if sys.platform.startswith('linux'):
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+def convert_models(entries: list, common_args: list, workers: int, memory_limit: float, log_dir: Path):
+    """
+    Converts models in at most workers processes at once and returns results of conversions in order of entries.
+    A conversion is stopped when resident memory of its process exceeds memory_limit megabytes.
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    conversions = []
+    for idx, entry in enumerate(entries):
+        model_name = Path(entry['input_model'][0]).stem or 'model'
+        log_path = log_dir / '{}_{}.log'.format(idx, model_name)
+        conversions.append(Conversion(entry, common_args + entry_to_cli_args(entry), log_path))
+
+    context = get_context()
+    pending = list(conversions)
+    running = []
+    while pending or running:
+        while pending and len(running) < workers:
+            conversion = pending.pop(0)
+            conversion.start(context)
+            running.append(conversion)
+        multiprocessing.connection.wait([conversion.process.sentinel for conversion in running],
+                                        timeout=MEMORY_POLL_INTERVAL)
+        for conversion in list(running):
+            current_rss = conversion.update_peak_rss()
+            if not conversion.process.is_alive():
+                result = conversion.finish()
+            elif memory_limit is not None and current_rss is not None and current_rss > memory_limit:
+                result = conversion.finish(STATUS_MEMORY_LIMIT)
+            else:
+                continue
+            running.remove(conversion)
+            print('[ {} ] {}: {}, {:.2f} s'.format('SUCCESS' if result['status'] == STATUS_SUCCESS else 'ERROR',
+                                                  ','.join(result['input_model']), result['status'],
+                                                  result['wall time (s)']))
+    return [conversion.result for conversion in conversions]
+
+
+def convert_batch(batch_argv: argparse.Namespace, common_args: list):
+    """
+    Converts models listed in the manifest and stores the report, returns exit code of the tool.
+    """
+    if batch_argv.workers is None or batch_argv.workers < 1:
+        print('[ ERROR ] Number of workers should be positive, got {}'.format(batch_argv.workers))
+        return 1
+    if batch_argv.worker_memory_limit is not None and batch_argv.worker_memory_limit <= 0:
+        print('[ ERROR ] Memory limit of workers should be positive, got {}'.format(batch_argv.worker_memory_limit))
+        return 1
+    if batch_argv.worker_memory_limit is not None and not sys.platform.startswith('linux'):
+        print('[ WARNING ] Memory limit of workers is supported on Linux only and is ignored')
+        batch_argv.worker_memory_limit = None
+
+    try:
+        entries = read_manifest(batch_argv.manifest)
+    except (Error, OSError) as e:
+        print('[ ERROR ] {}'.format(e))
+        return 1
+    report_path = Path(batch_argv.batch_report)
+    log_dir = report_path.with_name(report_path.stem + '_logs')
+    print('[ INFO ] Converting {} models in {} processes'.format(len(entries), min(batch_argv.workers, len(entries))))
+
+    start_time = time.perf_counter()
+    results = convert_models(entries, common_args, batch_argv.workers, batch_argv.worker_memory_limit, log_dir)
+    wall_time = time.perf_counter() - start_time
+
+    succeeded = sum(result['status'] == STATUS_SUCCESS for result in results)
+    report = {
+        'manifest': str(batch_argv.manifest),
+        'workers': batch_argv.workers,
+        'worker memory limit (MB)': batch_argv.worker_memory_limit,
+        'wall time (s)': round(wall_time, 3),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'models': results,
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w') as report_file:
+        json.dump(report, report_file, indent=4)
+
+    for result in results:
+        if result['status'] != STATUS_SUCCESS:
+            print('[ ERROR ] {}: {}. Log: {}'.format(','.join(result['input_model']),
+                                                    (result['error'] or result['status']).rstrip('.'), result['log']))
+    print('[ {} ] Converted {} of {} models in {:.2f} seconds'.format(
+        'SUCCESS' if succeeded == len(results) else 'INFO', succeeded, len(results), wall_time))
+    print('[ INFO ] Report is stored to {}'.format(report_path))
+    return 0 if succeeded == len(results) else 1
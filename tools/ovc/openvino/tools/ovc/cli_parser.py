@@ -376,10 +376,40 @@ def get_common_cli_parser(parser: argparse.ArgumentParser = None):
     parser.add_argument('--version', action='version',
                         help='Print ovc version and exit.',
                         version='OpenVINO Model Converter (ovc) {}'.format(VersionChecker().get_ie_version()))
+    add_batch_cli_args(parser)
     add_args_by_description(parser, mo_convert_params_common)
     return parser
 
 
+def add_batch_cli_args(parser: argparse.ArgumentParser):
+    parser.add_argument('--manifest',
+                        help='JSON file with a list of models to convert in parallel processes instead of INPUT_MODEL. '
+                             'Every entry of the list is an object with "input_model" and other parameters of '
+                             'the command line tool for this model. Relative paths are resolved against '
+                             'the directory of the manifest. Other command line parameters are applied '
+                             'to all models, parameters of entries override them.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Number of models converted in parallel with --manifest. '
+                             'Default value is the number of logical CPU cores.')
+    parser.add_argument('--worker_memory_limit', type=float, default=None,
+                        help='Resident memory limit of a conversion process in megabytes with --manifest. '
+                             'Conversion exceeding the limit is stopped and reported as failed. '
+                             'The limit is supported on Linux only.')
+    parser.add_argument('--batch_report', default='ovc_batch_report.json',
+                        help='JSON file to store time, peak memory and result of every conversion with --manifest. '
+                             'Logs of conversions are stored to a directory named after the report.')
+
+
+def get_batch_cli_parser():
+    """
+    Specifies cli arguments for conversion of models listed in a manifest,
+    other arguments are left to the parser of Model Conversion
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    add_batch_cli_args(parser)
+    return parser
+
+
 def input_model_details(model):
     if isinstance(model, (list, tuple)) and len(model) == 1:
         model = model[0]
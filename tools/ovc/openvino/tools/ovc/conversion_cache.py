@@ -0,0 +1,250 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import inspect
+import io
+import json
+import logging as log
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# pylint: disable=no-name-in-module,import-error
+from openvino import Core, Dimension, Model, PartialShape, Shape, Type, serialize
+from openvino import get_version as get_rt_version
+
+# Size limit of the cache directory in megabytes, least recently used models are evicted above it
+CACHE_SIZE_LIMIT_ENV = 'OVC_CACHE_SIZE_LIMIT'
+DEFAULT_CACHE_SIZE_LIMIT_MB = 10 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class UncacheableModel(Exception):
+    pass
+
+
+def update_hash_with_file(hasher, path: Path):
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+
+
+def update_hash_with_path(hasher, path):
+    path = Path(path)
+    if path.is_dir():
+        # Directory models (TensorFlow SavedModel) are hashed by relative paths and contents of all files
+        for file_path in sorted(p for p in path.rglob('*') if p.is_file()):
+            hasher.update(file_path.relative_to(path).as_posix().encode('utf-8'))
+            update_hash_with_file(hasher, file_path)
+    elif path.is_file():
+        update_hash_with_file(hasher, path)
+    else:
+        raise UncacheableModel('{} is not a file or directory'.format(path))
+
+
+def update_hash_with_torch_tensor(hasher, name, tensor):
+    import torch
+    tensor = tensor.detach().cpu().contiguous()
+    hasher.update('{}:{}:{}'.format(name, tensor.dtype, list(tensor.shape)).encode('utf-8'))
+    hasher.update(tensor.reshape(-1).view(torch.uint8).numpy())
+
+
+def update_hash_with_torch_model(hasher, model):
+    import torch
+    if hasattr(torch, 'export') and isinstance(model, torch.export.ExportedProgram):
+        hasher.update(model.graph_module.code.encode('utf-8'))
+        tensors = list(model.state_dict.items()) + list(model.constants.items())
+    elif isinstance(model, torch.jit.ScriptModule):
+        hasher.update(str(model.inlined_graph).encode('utf-8'))
+        tensors = list(model.named_parameters()) + list(model.named_buffers())
+    elif isinstance(model, torch.nn.Module):
+        # Tracing result depends on the code of every module class and on the module attributes
+        sources = {}
+        for name, module in model.named_modules():
+            module_type = type(module)
+            if module_type not in sources:
+                try:
+                    sources[module_type] = inspect.getsource(module_type)
+                except (OSError, TypeError):
+                    raise UncacheableModel('source code of {} is not available'.format(module_type.__qualname__))
+                hasher.update(sources[module_type].encode('utf-8'))
+            hasher.update('{}:{}.{}:{}:{}'.format(name, module_type.__module__, module_type.__qualname__,
+                                                  module.training, module.extra_repr()).encode('utf-8'))
+        tensors = list(model.named_parameters()) + list(model.named_buffers())
+    else:
+        raise UncacheableModel('unsupported model type {}'.format(type(model)))
+    for name, tensor in tensors:
+        if not isinstance(tensor, torch.Tensor):
+            raise UncacheableModel('constant {} is not a tensor'.format(name))
+        update_hash_with_torch_tensor(hasher, name, tensor)
+
+
+def update_hash_with_input_model(hasher, input_model):
+    if isinstance(input_model, (str, Path)):
+        update_hash_with_path(hasher, input_model)
+    elif isinstance(input_model, (list, tuple)):
+        for part in input_model:
+            update_hash_with_input_model(hasher, part)
+    elif isinstance(input_model, io.BytesIO):
+        hasher.update(input_model.getbuffer())
+    elif 'torch' in sys.modules:
+        update_hash_with_torch_model(hasher, input_model)
+    else:
+        raise UncacheableModel('unsupported model type {}'.format(type(input_model)))
+
+
+def update_hash_with_value(hasher, value):
+    """ Hash a value of a conversion parameter which is not a string or a number, like example_input. """
+    if isinstance(value, (list, tuple)):
+        hasher.update('{}:{}'.format(type(value).__name__, len(value)).encode('utf-8'))
+        for element in value:
+            update_hash_with_value(hasher, element)
+    elif isinstance(value, dict):
+        hasher.update('dict:{}'.format(len(value)).encode('utf-8'))
+        for key, element in value.items():
+            hasher.update(str(key).encode('utf-8'))
+            update_hash_with_value(hasher, element)
+    elif isinstance(value, np.ndarray):
+        hasher.update('{}:{}'.format(value.dtype, list(value.shape)).encode('utf-8'))
+        hasher.update(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+    elif 'torch' in sys.modules and isinstance(value, sys.modules['torch'].Tensor):
+        update_hash_with_torch_tensor(hasher, '', value)
+    elif 'torch' in sys.modules and isinstance(value, sys.modules['torch'].dtype):
+        hasher.update(str(value).encode('utf-8'))
+    elif value is None or isinstance(value, (str, Path, bool, int, float, np.dtype, type,
+                                             PartialShape, Shape, Dimension, Type)):
+        # Shapes and types have deterministic string representation, unlike extensions and other objects
+        hasher.update('{}:{}'.format(type(value).__name__, value).encode('utf-8'))
+    else:
+        raise UncacheableModel('parameter value of type {} is not supported'.format(type(value)))
+
+
+def update_hash_with_extension(hasher, extension):
+    """ Hash extensions by contents of their files, so a rebuilt extension library changes the key. """
+    if isinstance(extension, (list, tuple)):
+        for element in extension:
+            update_hash_with_extension(hasher, element)
+    elif isinstance(extension, (str, Path)):
+        paths = extension.split(',') if isinstance(extension, str) else [extension]
+        for path in paths:
+            if os.path.exists(path):
+                hasher.update('extension:{}'.format(Path(path).name).encode('utf-8'))
+                update_hash_with_path(hasher, path)
+            else:
+                hasher.update('extension:{}'.format(path).encode('utf-8'))
+    else:
+        update_hash_with_value(hasher, extension)
+
+
+def get_cache_key(input_model, non_default_params: dict, complex_params: dict):
+    """
+    Returns a key of the converted model in the conversion cache or None if the model can't be cached.
+    The key is a hash of the original model content, of conversion parameters and of OpenVINO version.
+    :param input_model: original model passed to conversion, path to model files or model object
+    :param non_default_params: conversion parameters with simple values returned by get_non_default_params
+    :param complex_params: conversion parameters which are not serialized to rt_info, like example_input
+    """
+    hasher = hashlib.sha256(get_rt_version().encode('utf-8'))
+    try:
+        update_hash_with_input_model(hasher, input_model)
+        # Parameters are serialized to rt_info of the model, so all of them are a part of the key
+        hasher.update(json.dumps(non_default_params, sort_keys=True, default=str).encode('utf-8'))
+        for key in sorted(complex_params):
+            hasher.update(key.encode('utf-8'))
+            if key == 'extension':
+                update_hash_with_extension(hasher, complex_params[key])
+            else:
+                update_hash_with_value(hasher, complex_params[key])
+    except UncacheableModel as e:
+        log.debug('Model is not cached: {}'.format(e))
+        return None
+    return hasher.hexdigest()
+
+
+class ConversionCache:
+    """
+    Directory with converted models stored as IR under content hash keys.
+    Cached models are read with mmap, so a hit costs reading of the IR topology only.
+    """
+    core = None
+
+    def __init__(self, cache_dir, size_limit_mb: int = None):
+        self.cache_dir = Path(cache_dir)
+        if size_limit_mb is None:
+            size_limit_mb = int(os.environ.get(CACHE_SIZE_LIMIT_ENV, DEFAULT_CACHE_SIZE_LIMIT_MB))
+        self.size_limit = size_limit_mb * 1024 * 1024
+
+    def get_paths(self, key: str):
+        return self.cache_dir / (key + '.xml'), self.cache_dir / (key + '.bin')
+
+    @classmethod
+    def get_core(cls):
+        # Creating Core takes noticeable time compared with reading a cached model
+        if cls.core is None:
+            cls.core = Core()
+        return cls.core
+
+    def load(self, key: str):
+        xml_path, bin_path = self.get_paths(key)
+        if not xml_path.is_file() or not bin_path.is_file():
+            return None
+        try:
+            model = self.get_core().read_model(xml_path, bin_path)
+        except Exception as e:
+            log.debug('Cached model {} is not readable: {}'.format(xml_path, e))
+            return None
+        # Modification time of entries is used to evict least recently used models
+        os.utime(xml_path)
+        log.debug('Converted model is loaded from cache {}'.format(xml_path))
+        return model
+
+    def store(self, key: str, model: Model):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        xml_path, bin_path = self.get_paths(key)
+        # Files are renamed after serialization, so concurrent conversions never read partially written entries.
+        # .bin file is renamed first because the entry exists once its .xml file appears.
+        tmp_xml_path, tmp_bin_path = [path.with_name('{}.{}.tmp'.format(path.name, os.getpid()))
+                                      for path in (xml_path, bin_path)]
+        try:
+            serialize(model, str(tmp_xml_path), str(tmp_bin_path))
+            os.replace(tmp_bin_path, bin_path)
+            os.replace(tmp_xml_path, xml_path)
+        except Exception as e:
+            log.warning('Converted model is not stored to cache {}: {}'.format(self.cache_dir, e))
+            for path in (tmp_xml_path, tmp_bin_path):
+                if path.exists():
+                    path.unlink()
+            return
+        self.evict()
+
+    def get_entries(self):
+        entries = []
+        for xml_path in self.cache_dir.glob('*.xml'):
+            bin_path = xml_path.with_suffix('.bin')
+            try:
+                size = xml_path.stat().st_size + (bin_path.stat().st_size if bin_path.exists() else 0)
+                entries.append((xml_path.stat().st_mtime, size, xml_path, bin_path))
+            except FileNotFoundError:
+                # Evicted by another process
+                continue
+        return entries
+
+    def evict(self):
+        """ Remove least recently used models until the cache fits in the size limit. """
+        entries = sorted(self.get_entries(), key=lambda entry: entry[0])
+        total_size = sum(entry[1] for entry in entries)
+        for _, size, xml_path, bin_path in entries:
+            if total_size <= self.size_limit:
+                break
+            log.debug('Converted model {} is evicted from cache'.format(xml_path))
+            for path in (xml_path, bin_path):
+                try:
+                    # Models loaded before keep using memory mapped files after removal
+                    path.unlink()
+                except OSError:
+                    # Already evicted by another process or still used on platforms which don't allow removal
+                    pass
+            total_size -= size
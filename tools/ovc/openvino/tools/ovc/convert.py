@@ -21,6 +21,8 @@ def convert_model(
         extension: [str, pathlib.Path, list, Any] = None,
         verbose: bool = False,
         share_weights: bool = True,
+        cache_dir: [str, pathlib.Path] = None,
+        profile: [str, pathlib.Path] = None,
 ) -> Model:
     """
     Converts the model from original framework to OpenVino Model.
@@ -95,6 +97,21 @@ def convert_model(
             then mmap is used to allocate weights directly from file. If input model is
             runtime object, then original memory regions allocated in the original model
             are reused for weights in the converted model.
+        :param cache_dir:
+            Path to a directory with converted models. When it is set, the converted model is stored
+            there under a hash of the original model content, conversion parameters and OpenVINO version,
+            and the next conversion of the same model with the same parameters reads the stored model
+            with mmap instead of converting it again. Models of unsupported types (objects of frameworks
+            other than PyTorch, extension objects) are always converted. Least recently used models are
+            removed when the directory exceeds OVC_CACHE_SIZE_LIMIT environment variable value
+            in megabytes, 10240 by default. Models loaded from the cache don't share memory with
+            the original model.
+        :param profile:
+            Path to a JSON file to store the conversion profile. The profile contains wall time, CPU time
+            and peak resident set size of conversion phases: decoder creation (including tracing of PyTorch
+            models), moc_pipeline, preprocessing, transformations and the conversion cache, and execution time
+            of every transformation applied by OpenVINO pass managers in each phase. ovc also profiles
+            saving of the model.
 
     Returns:
         openvino.Model
@@ -24,6 +24,8 @@ from openvino.tools.ovc.moc_frontend.moc_emit_ir import moc_emit_ir
 from openvino.tools.ovc.moc_frontend.type_utils import to_ov_type
 from openvino.tools.ovc.cli_parser import get_available_front_ends, get_common_cli_options, depersonalize, \
     get_mo_convert_params, input_to_input_cut_info, parse_inputs
+from openvino.tools.ovc.conversion_cache import ConversionCache, get_cache_key
+from openvino.tools.ovc.profiler import ConversionProfiler, profile_phase
 from openvino.tools.ovc.help import get_convert_model_help_specifics
 
 from openvino.tools.ovc.error import Error, FrameworkError
@@ -47,13 +49,17 @@ from openvino.frontend import FrontEndManager, OpConversionFailure, TelemetryExt
 from openvino import get_version as get_rt_version
 from openvino import PartialShape
 
-try:
-    from openvino.frontend.tensorflow.utils import create_tf_graph_iterator, type_supported_by_tf_fe, \
-        extract_model_graph  # pylint: disable=no-name-in-module,import-error
 
-    tf_frontend_with_python_bindings_installed = True
-except (ModuleNotFoundError, ImportError):
-    tf_frontend_with_python_bindings_installed = False
+def get_tf_frontend_utils():
+    """
+    Returns utilities of TensorFlow frontend or None if Python bindings of the frontend are not installed.
+    Import loads the library of the frontend, so it is done only for TensorFlow model objects.
+    """
+    try:
+        from openvino.frontend.tensorflow import utils  # pylint: disable=no-name-in-module,import-error
+        return utils
+    except (ModuleNotFoundError, ImportError):
+        return None
 
 
 def replace_ext(name: str, old: str, new: str):
@@ -181,18 +187,21 @@ def prepare_ir(argv: argparse.Namespace):
     moc_front_end, available_moc_front_ends = get_moc_frontends(argv)
     if moc_front_end:
         # TODO: Should be moved to the same place where paddle and pytorch handle their objects
-        if argv.framework == 'tf' and argv.is_python_object and type_supported_by_tf_fe(argv.input_model):
-            argv.input_model = create_tf_graph_iterator(argv.input_model,
-                                                        argv.placeholder_shapes,
-                                                        argv.placeholder_data_types,
-                                                        getattr(argv, "example_input", None),
-                                                        argv.share_weights)
+        tf_utils = get_tf_frontend_utils() if argv.framework == 'tf' and argv.is_python_object else None
+        if tf_utils is not None and tf_utils.type_supported_by_tf_fe(argv.input_model):
+            with profile_phase(getattr(argv, 'profiler', None), 'decoder'):
+                argv.input_model = tf_utils.create_tf_graph_iterator(argv.input_model,
+                                                                     argv.placeholder_shapes,
+                                                                     argv.placeholder_data_types,
+                                                                     getattr(argv, "example_input", None),
+                                                                     argv.share_weights)
         t.send_event("ovc", "conversion_method", moc_front_end.get_name() + "_frontend")
         moc_front_end.add_extension(TelemetryExtension("ovc", t.send_event, t.send_error, t.send_stack_trace))
         if any_extensions_used(argv):
             for extension in filtered_extensions(argv.extension):
                 moc_front_end.add_extension(extension)
-        ov_model = moc_pipeline(argv, moc_front_end)
+        with profile_phase(getattr(argv, 'profiler', None), 'moc_pipeline'):
+            ov_model = moc_pipeline(argv, moc_front_end)
         return ov_model
 
     if not argv.input_model:
@@ -204,7 +213,8 @@ def prepare_ir(argv: argparse.Namespace):
 def check_model_object(argv):
     model = argv['input_model']
     if 'tensorflow' in sys.modules:
-        if tf_frontend_with_python_bindings_installed and extract_model_graph(argv):
+        tf_utils = get_tf_frontend_utils()
+        if tf_utils is not None and tf_utils.extract_model_graph(argv):
             return "tf"
     if 'torch' in sys.modules:
         import torch
@@ -269,6 +279,9 @@ def get_non_default_params(argv, cli_parser):
     for arg, arg_value in vars(argv).items():
         if arg in signature.parameters and check_values_equal(arg_value, signature.parameters[arg].default):
             continue
+        # Location of the conversion cache and profiling don't affect the converted model
+        if arg in ['cache_dir', 'profile']:
+            continue
         if check_values_equal(arg_value, cli_parser.get_default(arg)):
             continue
         value = depersonalize(arg_value, arg)
@@ -417,6 +430,46 @@ def pack_params_to_args_namespace(args: dict, cli_parser: argparse.ArgumentParse
     return argv
 
 
+def get_profiler(args: dict, cli_parser: argparse.ArgumentParser, python_api_used):
+    profile = args.get('profile') if python_api_used else getattr(cli_parser.parse_known_args()[0], 'profile', None)
+    return ConversionProfiler(profile) if profile else None
+
+
+def finish_profiling(profiler: ConversionProfiler, verbose: bool):
+    profiler.close()
+    if verbose:
+        profiler.print_summary()
+
+
+def get_conversion_cache(args: dict, cli_parser: argparse.ArgumentParser, python_api_used, profiler=None):
+    """
+    Returns the conversion cache, the key of the model in the cache and parsed arguments
+    if the conversion cache is enabled by cache_dir parameter, otherwise returns None values.
+    Parameters of the key are taken before conversion, because framework objects are replaced during conversion.
+    """
+    if python_api_used and args.get('cache_dir') is None:
+        return None, None, None
+    argv = pack_params_to_args_namespace(dict(args), cli_parser, python_api_used)
+    if not getattr(argv, 'cache_dir', None):
+        return None, None, None
+    # Hashing of the original model takes time proportional to its size
+    with profile_phase(profiler, 'conversion cache key'):
+        return get_conversion_cache_key(argv, cli_parser)
+
+
+def get_conversion_cache_key(argv: argparse.Namespace, cli_parser: argparse.ArgumentParser):
+    non_default_params = get_non_default_params(argv, cli_parser)
+    # Extensions are hashed by contents of their files, not by depersonalized paths
+    non_default_params.pop('extension', None)
+    # Values of these parameters can be objects, which are not serialized to rt_info
+    complex_params = {key: getattr(argv, key) for key in ['input', 'output', 'example_input', 'extension']
+                      if key not in non_default_params and getattr(argv, key, None) is not None}
+    cache_key = get_cache_key(argv.input_model, non_default_params, complex_params)
+    if cache_key is None:
+        return None, None, None
+    return ConversionCache(argv.cache_dir), cache_key, argv
+
+
 def is_verbose(argv, args=None):
     if argv is not None and hasattr(argv, 'verbose') and argv.verbose:
         return True
@@ -450,47 +503,65 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
             args['input_model'] = ()
         if isinstance(args['input_model'], (tuple, list)) and len(args['input_model']) == 1:
             args['input_model'] = args['input_model'][0]
+    profiler = None
     try:
+        profiler = get_profiler(args, cli_parser, python_api_used)
+        conversion_cache, cache_key, cache_argv = get_conversion_cache(args, cli_parser, python_api_used, profiler)
+        if conversion_cache is not None:
+            with profile_phase(profiler, 'conversion cache load'):
+                ov_model = conversion_cache.load(cache_key)
+            if ov_model is not None:
+                cache_argv.is_python_api_used = python_api_used
+                cache_argv.profiler = profiler
+                if profiler is not None and python_api_used:
+                    finish_profiling(profiler, is_verbose(cache_argv))
+                send_conversion_result('success')
+                if is_verbose(cache_argv):
+                    print('[ SUCCESS ] Converted model is loaded from cache {}'.format(cache_argv.cache_dir))
+                    tracemalloc.stop()
+                return ov_model, cache_argv
+
         model_framework = None
         inp_model_is_object = input_model_is_object(args['input_model']) if python_api_used else False
 
-        if inp_model_is_object:
-            model_framework = check_model_object(args)
-            if model_framework == "pytorch":
-                example_inputs = None
-                if 'example_input' in args and args['example_input'] is not None:
-                    example_inputs = args['example_input']
-                elif 'example_inputs' in args:
-                    raise AssertionError(
-                        "'example_inputs' argument is not recognized, maybe you meant to provide 'example_input'?")
-
-                get_pytorch_decoder(args['input_model'], example_inputs, args)
-            if model_framework == "paddle":
-                example_inputs = None
-                if 'example_input' in args and args['example_input'] is not None:
-                    example_inputs = args['example_input']
-
-                outputs = None
-                if 'output' in args and args['output'] is not None:
-                    # Once the temporary PDPD model is generated. output can be dropped.
-                    # Just swap outputs and args['output'] can reset the argv.output to `None`.
-                    # It can avoid the following `output` negative effect.
-                    outputs, args['output'] = args['output'], outputs
-                paddle_runtime_converter = paddle_frontend_converter(args['input_model'], example_inputs,
-                                                                     outputs)
-                pdmodel = paddle_runtime_converter.convert_paddle_to_pdmodel()
-                args['input_model'] = pdmodel
-            if model_framework == "jax":
-                if get_jax_decoder is not None:
-                    get_jax_decoder(args['input_model'], args)
-                else:
-                    raise Error("JAX Frontend is not available.")
-            if model_framework == "tf" and "nncf" in sys.modules:
-                try:
-                    from nncf.tensorflow.strip import strip as nncf_tf_strip
-                    args['input_model'] = nncf_tf_strip(args['input_model'])
-                except:
-                    pass
+        with profile_phase(profiler, 'decoder'):
+            if inp_model_is_object:
+                model_framework = check_model_object(args)
+                if model_framework == "pytorch":
+                    example_inputs = None
+                    if 'example_input' in args and args['example_input'] is not None:
+                        example_inputs = args['example_input']
+                    elif 'example_inputs' in args:
+                        raise AssertionError(
+                            "'example_inputs' argument is not recognized, maybe you meant to provide 'example_input'?")
+
+                    get_pytorch_decoder(args['input_model'], example_inputs, args)
+                if model_framework == "paddle":
+                    example_inputs = None
+                    if 'example_input' in args and args['example_input'] is not None:
+                        example_inputs = args['example_input']
+
+                    outputs = None
+                    if 'output' in args and args['output'] is not None:
+                        # Once the temporary PDPD model is generated. output can be dropped.
+                        # Just swap outputs and args['output'] can reset the argv.output to `None`.
+                        # It can avoid the following `output` negative effect.
+                        outputs, args['output'] = args['output'], outputs
+                    paddle_runtime_converter = paddle_frontend_converter(args['input_model'], example_inputs,
+                                                                         outputs)
+                    pdmodel = paddle_runtime_converter.convert_paddle_to_pdmodel()
+                    args['input_model'] = pdmodel
+                if model_framework == "jax":
+                    if get_jax_decoder is not None:
+                        get_jax_decoder(args['input_model'], args)
+                    else:
+                        raise Error("JAX Frontend is not available.")
+                if model_framework == "tf" and "nncf" in sys.modules:
+                    try:
+                        from nncf.tensorflow.strip import strip as nncf_tf_strip
+                        args['input_model'] = nncf_tf_strip(args['input_model'])
+                    except:
+                        pass
 
         argv = pack_params_to_args_namespace(args, cli_parser, python_api_used)
 
@@ -501,6 +572,7 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
 
         non_default_params = get_non_default_params(argv, cli_parser)
         argv.is_python_api_used = python_api_used
+        argv.profiler = profiler
 
         # send telemetry with params info
         send_params_info(non_default_params)
@@ -509,11 +581,12 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
 
         orig_input_model = argv.input_model
         pytorch_model_on_disk = False
-        if argv.framework is None and get_pytorch_decoder_for_model_on_disk(argv, args):
-            # try to load a model from disk as TorchScript or ExportedProgram
-            # TorchScriptPythonDecoder or TorchFXPythonDecoder object will be assigned to argv.input_model
-            # saved TorchScript and ExportedModel model can be passed to both ovc tool and Python convert_model
-            pytorch_model_on_disk = True
+        with profile_phase(profiler, 'decoder'):
+            if argv.framework is None and get_pytorch_decoder_for_model_on_disk(argv, args):
+                # try to load a model from disk as TorchScript or ExportedProgram
+                # TorchScriptPythonDecoder or TorchFXPythonDecoder object will be assigned to argv.input_model
+                # saved TorchScript and ExportedModel model can be passed to both ovc tool and Python convert_model
+                pytorch_model_on_disk = True
 
         ov_model = driver(argv, {"conversion_parameters": non_default_params})
 
@@ -532,6 +605,10 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
         for key, value in non_default_params.items():
             ov_model.set_rt_info(str(value), ["conversion_parameters", str(key)])
 
+        if conversion_cache is not None:
+            with profile_phase(profiler, 'conversion cache store'):
+                conversion_cache.store(cache_key, ov_model)
+
         if is_verbose(argv) or not python_api_used:
             if 'compress_to_fp16' in argv and argv.compress_to_fp16:
                 print(get_compression_message())
@@ -547,6 +624,9 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
                 peak_size / (1024 * 1024)))
             tracemalloc.stop()
 
+        # Command line tool finishes profiling after saving the model
+        if profiler is not None and python_api_used:
+            finish_profiling(profiler, is_verbose(argv))
         return ov_model, argv
 
     except Exception as e:
@@ -574,6 +654,8 @@ def _convert(cli_parser: argparse.ArgumentParser, args, python_api_used):
                 log.error("-------------------------------------------------")
 
         send_conversion_result('fail')
+        if profiler is not None:
+            finish_profiling(profiler, is_verbose(argv) or not python_api_used)
         if python_api_used:
             raise e
         else:
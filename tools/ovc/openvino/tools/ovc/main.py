@@ -3,25 +3,26 @@
 
 import sys
 
-try:
-    import openvino_telemetry as tm
-    from openvino_telemetry.backend import backend_ga4
-except ImportError:
-    import openvino.tools.ovc.telemetry_stub as tm
 from openvino.tools.ovc.convert_impl import _convert
 from openvino.tools.ovc.cli_parser import get_model_name_from_args
+from openvino.tools.ovc.profiler import profile_phase
 from openvino.tools.ovc.utils import import_openvino_tokenizers
 
-# TODO 131000: temporal workaround to patch OpenVINO Core and frontends with tokenizers extensions
-# make OVC tool to convert models requiring openvino-tokenizers extensions
-import_openvino_tokenizers()
-
 # pylint: disable=no-name-in-module,import-error
 from openvino import save_model
 
 
 def main():
-    from openvino.tools.ovc.cli_parser import get_all_cli_parser
+    from openvino.tools.ovc.cli_parser import get_all_cli_parser, get_batch_cli_parser
+    # TODO 131000: temporal workaround to patch OpenVINO Core and frontends with tokenizers extensions
+    # make OVC tool to convert models requiring openvino-tokenizers extensions.
+    # Extensions are loaded by the tool only, not on import of the module.
+    import_openvino_tokenizers()
+    batch_argv, common_args = get_batch_cli_parser().parse_known_args()
+    if batch_argv.manifest:
+        from openvino.tools.ovc.batch import convert_batch
+        return convert_batch(batch_argv, common_args)
+
     ngraph_function, argv = _convert(get_all_cli_parser(), {}, False)
     if ngraph_function is None:
         return 1
@@ -29,7 +30,12 @@ def main():
     model_path = get_model_name_from_args(argv)
 
     compress_to_fp16 = 'compress_to_fp16' in argv and argv.compress_to_fp16
-    save_model(ngraph_function, model_path.encode('utf-8'), compress_to_fp16)
+    profiler = getattr(argv, 'profiler', None)
+    with profile_phase(profiler, 'save_model'):
+        save_model(ngraph_function, model_path.encode('utf-8'), compress_to_fp16)
+    if profiler is not None:
+        profiler.close()
+        profiler.print_summary()
 
     print('[ SUCCESS ] XML file: {}'.format(model_path))
     print('[ SUCCESS ] BIN file: {}'.format(model_path.replace('.xml', '.bin')))
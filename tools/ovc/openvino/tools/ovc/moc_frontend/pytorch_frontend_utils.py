@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging as log
+import os
 import pathlib
 import sys
+import zipfile
 
 import numpy as np
 
@@ -69,6 +71,19 @@ def get_pytorch_decoder(model, example_inputs, args):
 
 
 def get_pytorch_decoder_for_model_on_disk(argv, args):
+    if isinstance(argv.input_model, (tuple, list)) and len(argv.input_model) == 1:
+        input_model = argv.input_model[0]
+    else:
+        input_model = argv.input_model
+
+    if not isinstance(input_model, (str, pathlib.Path)):
+        return False
+
+    # Saved TorchScript and ExportedProgram models are zip archives,
+    # models of other frameworks are rejected without importing torch, which takes seconds
+    if not os.path.isfile(input_model) or not zipfile.is_zipfile(input_model):
+        return False
+
     try:
         from openvino.frontend.pytorch.ts_decoder import TorchScriptPythonDecoder
         from openvino.frontend.pytorch.fx_decoder import TorchFXPythonDecoder
@@ -80,14 +95,6 @@ def get_pytorch_decoder_for_model_on_disk(argv, args):
     if 'example_input' in args and args['example_input'] is not None:
         example_inputs = args['example_input']
 
-    if isinstance(argv.input_model, (tuple, list)) and len(argv.input_model) == 1:
-        input_model = argv.input_model[0]
-    else:
-        input_model = argv.input_model
-
-    if not isinstance(input_model, (str, pathlib.Path)):
-        return False
-
     # attempt to load scripted model
     try:
         inputs = prepare_torch_inputs(example_inputs)
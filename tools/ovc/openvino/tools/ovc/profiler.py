@@ -0,0 +1,185 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Pass managers of OpenVINO append execution time of every transformation to the file set in this variable
+PROFILE_PASS_ENV = 'OV_ENABLE_PROFILE_PASS'
+
+
+def get_memory_status(pid='self'):
+    """
+    Returns current and peak resident set size of the process in megabytes, None values if they are not available.
+    Memory of other processes is available on Linux only.
+    """
+    current_rss, peak_rss = None, None
+    try:
+        with open('/proc/{}/status'.format(pid)) as status_file:
+            for line in status_file:
+                if line.startswith('VmRSS:'):
+                    current_rss = int(line.split()[1]) / 1024
+                elif line.startswith('VmHWM:'):
+                    peak_rss = int(line.split()[1]) / 1024
+    except OSError:
+        if pid != 'self':
+            return current_rss, peak_rss
+        try:
+            import resource
+            # Peak is not reset between phases on this platform, so it is the peak of the process so far
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            peak_rss /= 1024 * 1024 if sys.platform == 'darwin' else 1024
+        except ImportError:
+            pass
+    return current_rss, peak_rss
+
+
+def reset_peak_rss():
+    # Linux allows resetting the peak resident set size, so peaks of phases are measured separately
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+    except OSError:
+        pass
+
+
+class Phase:
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.start_time = time.perf_counter()
+        self.start_cpu_time = time.process_time()
+        self.start_rss, _ = get_memory_status()
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_rss = None
+        self.end_rss = None
+        self.transformations = []
+        # Peak of the phase is the maximum of peaks measured before resets by nested phases
+        self.nested_peak_rss = None
+
+    def update_peak_rss(self, peak_rss):
+        if peak_rss is not None:
+            self.nested_peak_rss = peak_rss if self.nested_peak_rss is None else max(self.nested_peak_rss, peak_rss)
+
+    def finish(self):
+        self.wall_time = time.perf_counter() - self.start_time
+        self.cpu_time = time.process_time() - self.start_cpu_time
+        self.end_rss, peak_rss = get_memory_status()
+        self.update_peak_rss(peak_rss)
+        self.peak_rss = self.nested_peak_rss
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'depth': self.depth,
+            'wall time (ms)': round(self.wall_time * 1000, 3),
+            'cpu time (ms)': round(self.cpu_time * 1000, 3),
+            'peak rss (MB)': round(self.peak_rss, 2) if self.peak_rss is not None else None,
+            'rss growth (MB)': round(self.end_rss - self.start_rss, 2)
+            if self.end_rss is not None and self.start_rss is not None else None,
+            'transformations': self.transformations,
+        }
+
+
+class ConversionProfiler:
+    """
+    Records wall time, CPU time and peak resident set size of conversion phases
+    and execution time of every transformation applied by OpenVINO pass managers.
+    Transformations are attributed to the innermost phase running them.
+    CPU time includes all threads of the process. All phases are nested into 'total' phase,
+    which lasts from creation of the profiler till close().
+    Execution times of transformations are collected by setting OV_ENABLE_PROFILE_PASS to a file,
+    in this mode pass managers don't print to the standard output.
+    """
+
+    def __init__(self, report_path):
+        self.report_path = str(report_path)
+        self.phases = []
+        self.stack = []
+        self.pass_profile_fd, self.pass_profile_path = tempfile.mkstemp(prefix='ovc_pass_profile_', suffix='.txt')
+        self.pass_profile_offset = 0
+        self.original_profile_pass = os.environ.get(PROFILE_PASS_ENV)
+        os.environ[PROFILE_PASS_ENV] = self.pass_profile_path
+        self.total = self.phase('total')
+        self.total.__enter__()
+
+    def read_transformations(self):
+        with open(self.pass_profile_path, 'r') as pass_profile:
+            pass_profile.seek(self.pass_profile_offset)
+            lines = pass_profile.readlines()
+            self.pass_profile_offset = pass_profile.tell()
+        transformations = []
+        for line in lines:
+            fields = line.rstrip('\n').split(';')
+            # Lines of transformations have format t;<pass>;<pass manager>;<nanoseconds>;<applied>
+            if fields[0] == 't' and len(fields) == 5:
+                transformations.append({
+                    'name': fields[1],
+                    'pass manager': fields[2],
+                    'wall time (ms)': round(int(fields[3]) / 1e6, 3),
+                    'applied': fields[4] == '1',
+                })
+        if self.stack:
+            self.stack[-1].transformations.extend(transformations)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        self.read_transformations()
+        if self.stack:
+            self.stack[-1].update_peak_rss(get_memory_status()[1])
+        reset_peak_rss()
+        phase = Phase(name, len(self.stack))
+        self.phases.append(phase)
+        self.stack.append(phase)
+        try:
+            yield phase
+        finally:
+            self.read_transformations()
+            phase.finish()
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1].update_peak_rss(phase.peak_rss)
+
+    def close(self):
+        """
+        Stops recording of transformations and writes the JSON report.
+        """
+        self.total.__exit__(None, None, None)
+        if self.original_profile_pass is None:
+            os.environ.pop(PROFILE_PASS_ENV, None)
+        else:
+            os.environ[PROFILE_PASS_ENV] = self.original_profile_pass
+        os.close(self.pass_profile_fd)
+        os.remove(self.pass_profile_path)
+
+        phases = [phase.to_dict() for phase in self.phases if phase.wall_time is not None]
+        transformations = [transformation for phase in phases for transformation in phase['transformations']]
+        report = {
+            'phases': phases,
+            'slowest transformations': sorted(transformations, key=lambda t: t['wall time (ms)'], reverse=True)[:20],
+        }
+        with open(self.report_path, 'w') as report_file:
+            json.dump(report, report_file, indent=4)
+        return report
+
+    def print_summary(self):
+        print('[ INFO ] Conversion profile:')
+        for phase in self.phases:
+            if phase.wall_time is None:
+                continue
+            peak_rss = ', peak RSS {:.2f} MB'.format(phase.peak_rss) if phase.peak_rss is not None else ''
+            print('[ INFO ] {}{}: {:.2f} ms, CPU {:.2f} ms{}'.format(
+                '  ' * phase.depth, phase.name, phase.wall_time * 1000, phase.cpu_time * 1000, peak_rss))
+        print('[ INFO ] Profile is stored to {}'.format(self.report_path))
+
+
+def profile_phase(profiler: [ConversionProfiler, None], name: str):
+    """
+    Returns a context manager which records the phase if profiling is enabled for the conversion.
+    """
+    return profiler.phase(name) if profiler is not None else contextlib.nullcontext()
@@ -4,6 +4,7 @@
 import argparse
 import numbers
 import os
+import sys
 from openvino import get_version as get_rt_version  # pylint: disable=no-name-in-module,import-error
 from openvino.tools.ovc.cli_parser import get_params_with_paths_list
 from openvino.tools.ovc.telemetry_params import telemetry_params
@@ -16,27 +17,50 @@ except ImportError:
     import openvino.tools.ovc.telemetry_stub as tm
 
 
-def is_optimum():
-    import traceback
-    for frame_summary in traceback.extract_stack():
-        if os.path.join("optimum", "intel") in frame_summary.filename or \
-                os.path.join("optimum", "exporters", "openvino") in frame_summary.filename:
+# Integrations which marked themselves as callers of OpenVINO with set_caller()
+callers = set()
+
+
+def set_caller(name: str):
+    """
+    Marks an integration as a caller of OpenVINO, so it is detected without walking the call stack.
+    The call stack is still checked for integrations which don't mark themselves.
+    :param name: name of the integration: "optimum", "torch.compile" or "keras3".
+    """
+    callers.add(name)
+
+
+def is_called_from(module_name: str, paths: list):
+    """
+    Checks if a function from one of the paths is in the call stack.
+    Functions of a module can't be called before the module is imported,
+    so the stack is checked only if the module is imported and without reading sources of frames.
+    :param module_name: name of the module which is imported if the function is called.
+    :param paths: parts of the file paths of the functions.
+    """
+    if module_name not in sys.modules:
+        return False
+    frame = sys._getframe(1)
+    while frame is not None:
+        if any(path in frame.f_code.co_filename for path in paths):
             return True
+        frame = frame.f_back
     return False
 
+
+def is_optimum():
+    return "optimum" in callers or is_called_from("optimum", [os.path.join("optimum", "intel"),
+                                                              os.path.join("optimum", "exporters", "openvino")])
+
+
 def is_torch_compile():
-    import traceback
-    for line in traceback.format_stack():
-        if os.path.join("torch", "_dynamo", "backends", "registry.py") in line:
-            return True
-    return False
+    return "torch.compile" in callers or is_called_from("torch._dynamo",
+                                                        [os.path.join("torch", "_dynamo", "backends", "registry.py")])
+
 
 def is_keras3():
-    import traceback
-    for line in traceback.format_stack():
-        if os.path.join("keras", "src", "backend", "openvino") in line:
-            return True
-    return False
+    return "keras3" in callers or is_called_from("keras", [os.path.join("keras", "src", "backend", "openvino")])
+
 
 def init_ovc_telemetry(app_name='OVC', app_version=None):
     app_version = app_version if app_version is not None else get_rt_version()
@@ -76,6 +100,16 @@ def init_telemetry_class(tid,
     return telemetry
 
 
+def send_torch_compile_import():
+    """
+    This function sends information about import of OpenVINO from torch.compile.
+    """
+    import importlib.metadata as importlib_metadata
+    telemetry = init_ovc_telemetry("torch.compile", importlib_metadata.version("torch"))
+    telemetry.send_event("torch.compile", "import",
+                         "Import from torch.compile(), ov_version: {}".format(get_rt_version()))
+
+
 def send_framework_info(framework: str):
     """
     This function sends information about used framework.
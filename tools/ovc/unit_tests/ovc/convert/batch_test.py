@@ -0,0 +1,59 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from openvino.tools.ovc.batch import convert_batch, entry_to_cli_args, read_manifest
+from unit_tests.ovc.unit_test_with_mocked_telemetry import UnitTestWithMockedTelemetry
+
+from utils import create_onnx_model, save_to_onnx
+
+
+class BatchConversionTest(UnitTestWithMockedTelemetry):
+    test_directory = os.path.dirname(os.path.realpath(__file__))
+
+    def test_read_manifest(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            manifest_path = Path(tmpdir, 'manifest.json')
+            with open(manifest_path, 'w') as manifest_file:
+                json.dump({'models': [{'input_model': 'model.onnx', 'output_model': 'out' + os.sep,
+                                       'input': 'input[1,3,2,2]', 'compress_to_fp16': False, 'verbose': True}]},
+                          manifest_file)
+            entry = read_manifest(manifest_path)[0]
+            assert entry['input_model'] == [os.path.join(str(Path(tmpdir).resolve()), 'model.onnx')]
+            assert entry['output_model'][0].endswith(os.sep)
+            assert entry_to_cli_args(entry) == [entry['input_model'][0], '--output_model=' + entry['output_model'][0],
+                                                '--input=input[1,3,2,2]', '--compress_to_fp16=False', '--verbose']
+
+    def test_convert_batch(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            for name in ['first', 'second']:
+                os.makedirs(os.path.join(tmpdir, name))
+                save_to_onnx(create_onnx_model(), os.path.join(tmpdir, name))
+            manifest_path = Path(tmpdir, 'manifest.json')
+            with open(manifest_path, 'w') as manifest_file:
+                json.dump([{'input_model': 'first/model.onnx', 'output_model': 'out/first'},
+                           {'input_model': 'second/model.onnx', 'output_model': 'out/second',
+                            'input': 'input[1,3,2,2]'},
+                           {'input_model': 'missing.onnx', 'output_model': 'out/missing'}], manifest_file)
+            report_path = Path(tmpdir, 'report.json')
+            batch_argv = argparse.Namespace(manifest=str(manifest_path), workers=2, worker_memory_limit=None,
+                                            batch_report=str(report_path))
+
+            assert convert_batch(batch_argv, ['--compress_to_fp16=False']) == 1
+
+            with open(report_path) as report_file:
+                report = json.load(report_file)
+            assert report['succeeded'] == 2
+            assert report['failed'] == 1
+            statuses = [model['status'] for model in report['models']]
+            assert statuses == ['success', 'success', 'failed']
+            for name in ['first', 'second']:
+                assert Path(tmpdir, 'out', name + '.xml').is_file()
+                assert Path(tmpdir, 'out', name + '.bin').is_file()
+            assert report['models'][2]['error']
+            assert all(Path(model['log']).is_file() for model in report['models'])
@@ -0,0 +1,81 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+from pathlib import Path
+
+from openvino.tools.ovc import convert_model
+from openvino.tools.ovc.conversion_cache import ConversionCache, get_cache_key
+from unit_tests.ovc.unit_test_with_mocked_telemetry import UnitTestWithMockedTelemetry
+
+from utils import create_onnx_model, save_to_onnx
+
+
+class ConversionCacheTest(UnitTestWithMockedTelemetry):
+    test_directory = os.path.dirname(os.path.realpath(__file__))
+
+    def test_cache_hit(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            cache_dir = Path(tmpdir, 'cache')
+
+            ov_model = convert_model(model_path, cache_dir=cache_dir)
+            assert len(list(cache_dir.glob('*.xml'))) == 1
+            cached_model = convert_model(model_path, cache_dir=cache_dir)
+
+            assert cached_model.get_friendly_name() == ov_model.get_friendly_name()
+            assert [op.get_type_name() for op in cached_model.get_ordered_ops()] == \
+                   [op.get_type_name() for op in ov_model.get_ordered_ops()]
+            assert cached_model.get_rt_info(['conversion_parameters', 'input_model']).astype(str) == \
+                   ov_model.get_rt_info(['conversion_parameters', 'input_model']).astype(str)
+            assert not cached_model.has_rt_info(['conversion_parameters', 'cache_dir'])
+
+            # Other parameters make another entry
+            convert_model(model_path, input=[1, 3, 4, 4], cache_dir=cache_dir)
+            assert len(list(cache_dir.glob('*.xml'))) == 2
+
+    def test_cache_key(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            params = {'input_model': os.path.join('DIR', 'model.onnx')}
+            key = get_cache_key(model_path, params, {})
+            assert key == get_cache_key(model_path, params, {})
+            assert key != get_cache_key(model_path, dict(params, verbose=True), {})
+            assert key != get_cache_key(model_path, params, {'input': [1, 3, 4, 4]})
+
+            with open(model_path, 'ab') as model_file:
+                model_file.write(b'\0')
+            assert key != get_cache_key(model_path, params, {})
+
+            # Extension libraries are identified by their contents, not by paths
+            extension_path = Path(tmpdir, 'extension.so')
+            extension_path.write_bytes(b'first build')
+            extension_key = get_cache_key(model_path, params, {'extension': [str(extension_path)]})
+            assert extension_key != key
+            assert extension_key == get_cache_key(model_path, params, {'extension': str(extension_path)})
+            extension_path.write_bytes(b'second build')
+            assert extension_key != get_cache_key(model_path, params, {'extension': [str(extension_path)]})
+
+            # Objects without deterministic representation are not cached
+            assert get_cache_key(model_path, params, {'extension': object()}) is None
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            ov_model = convert_model(model_path)
+            cache = ConversionCache(tmpdir)
+            cache.store('first', ov_model)
+            cache.store('second', ov_model)
+            first_xml, _ = cache.get_paths('first')
+            second_xml, _ = cache.get_paths('second')
+            os.utime(first_xml, (0, 0))
+            # Loading marks the entry as recently used
+            assert cache.load('first') is not None
+            os.utime(second_xml, (0, 0))
+
+            cache.size_limit = sum(entry[1] for entry in cache.get_entries()) - 1
+            cache.evict()
+            assert first_xml.exists()
+            assert not second_xml.exists()
+            assert cache.load('second') is None
@@ -0,0 +1,53 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from openvino.tools.ovc import convert_model
+from openvino.tools.ovc.profiler import PROFILE_PASS_ENV
+from unit_tests.ovc.unit_test_with_mocked_telemetry import UnitTestWithMockedTelemetry
+
+from utils import create_onnx_model, save_to_onnx
+
+
+class ProfilerTest(UnitTestWithMockedTelemetry):
+    test_directory = os.path.dirname(os.path.realpath(__file__))
+
+    def test_profile(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            profile_path = Path(tmpdir, 'profile.json')
+
+            ov_model = convert_model(model_path, profile=profile_path)
+            assert not ov_model.has_rt_info(['conversion_parameters', 'profile'])
+            assert PROFILE_PASS_ENV not in os.environ
+
+            with open(profile_path) as profile_file:
+                profile = json.load(profile_file)
+            phases = {phase['name']: phase for phase in profile['phases']}
+            for name in ['total', 'moc_pipeline', 'apply_moc_transformations',
+                         'compress_quantize_weights_transformation']:
+                assert name in phases, "Phase {} is not profiled".format(name)
+            assert phases['total']['depth'] == 0
+            assert phases['moc_pipeline']['depth'] == 1
+            assert phases['total']['wall time (ms)'] >= phases['moc_pipeline']['wall time (ms)']
+            assert phases['apply_moc_transformations']['transformations']
+            assert profile['slowest transformations']
+
+    def test_profile_keeps_stdout_clean(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            profile_path = Path(tmpdir, 'profile.json')
+            # Pass managers print to stdout of the process only if profiling isn't written to a file
+            script = ('import sys\n'
+                      'from openvino.tools.ovc import convert_model\n'
+                      'convert_model(sys.argv[1], profile=sys.argv[2])\n')
+            output = subprocess.run([sys.executable, '-c', script, model_path, str(profile_path)], check=True,
+                                    capture_output=True, text=True).stdout
+            assert 'PassManager' not in output
+            assert profile_path.is_file()
@@ -0,0 +1,68 @@
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+import tempfile
+import types
+from unittest.mock import patch
+
+from openvino.tools.ovc import telemetry_utils
+from openvino.tools.ovc.telemetry_utils import is_keras3, is_optimum, is_torch_compile
+from unit_tests.ovc.unit_test_with_mocked_telemetry import UnitTestWithMockedTelemetry
+
+from utils import create_onnx_model, save_to_onnx
+
+
+def call_from_file(function, filename):
+    # Function is called from code which looks like code of the file for the call stack
+    code = compile('result = function()', filename, 'exec')
+    scope = {'function': function}
+    exec(code, scope)
+    return scope['result']
+
+
+class StartupTest(UnitTestWithMockedTelemetry):
+    test_directory = os.path.dirname(os.path.realpath(__file__))
+
+    def test_caller_detection(self):
+        registry_path = os.path.join('site-packages', 'torch', '_dynamo', 'backends', 'registry.py')
+        with patch('traceback.extract_stack', side_effect=AssertionError), \
+                patch('traceback.format_stack', side_effect=AssertionError):
+            with patch.dict(sys.modules, {'torch._dynamo': types.ModuleType('torch._dynamo')}):
+                assert call_from_file(is_torch_compile, registry_path)
+                assert not call_from_file(is_torch_compile, 'model.py')
+            with patch.dict(sys.modules):
+                sys.modules.pop('torch._dynamo', None)
+                # Caller can't be torch.compile if it isn't imported
+                assert not call_from_file(is_torch_compile, registry_path)
+            with patch.dict(sys.modules, {'optimum': types.ModuleType('optimum')}):
+                assert call_from_file(is_optimum, os.path.join('optimum', 'intel', 'openvino', 'modeling.py'))
+                assert call_from_file(is_optimum, os.path.join('optimum', 'exporters', 'openvino', 'convert.py'))
+            with patch.dict(sys.modules, {'keras': types.ModuleType('keras')}):
+                assert call_from_file(is_keras3, os.path.join('keras', 'src', 'backend', 'openvino', 'core.py'))
+                assert not call_from_file(is_keras3, os.path.join('keras', 'src', 'backend', 'jax', 'core.py'))
+
+    def test_caller_marked_by_integration(self):
+        # Marked callers are detected without walking the call stack
+        with patch.object(telemetry_utils, 'callers', set()), \
+                patch.object(telemetry_utils, 'is_called_from', side_effect=AssertionError):
+            telemetry_utils.set_caller('torch.compile')
+            assert is_torch_compile()
+            telemetry_utils.set_caller('optimum')
+            assert is_optimum()
+        assert 'optimum' not in telemetry_utils.callers
+
+    def test_lazy_imports(self):
+        with tempfile.TemporaryDirectory(dir=self.test_directory) as tmpdir:
+            model_path = save_to_onnx(create_onnx_model(), tmpdir)
+            # Conversion of models of other frameworks doesn't import torch and doesn't load extensions
+            script = ('import sys\n'
+                      'from openvino.tools.ovc import convert_model\n'
+                      'import openvino.tools.ovc.main\n'
+                      'convert_model(sys.argv[1])\n'
+                      'print(sorted(m for m in ["torch", "openvino_tokenizers"] if m in sys.modules))\n')
+            output = subprocess.run([sys.executable, '-c', script, model_path], check=True,
+                                    capture_output=True, text=True).stdout
+            assert output.strip().splitlines()[-1] == '[]'